@@ -0,0 +1,71 @@
+# benchmarks/compression.py
+"""
+Compare les formats de compression des fichiers de données : taille, durée de sauvegarde et de chargement.
+
+Usage (depuis le dossier ChessTournamentAPP) :
+    python -m benchmarks.compression --tournaments 1000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from benchmarks.datasets import generate_archive
+from util import config
+from util.data_manager import load_tournaments, save_tournaments, load_players, save_players
+
+
+CODECS = ('', 'gz', 'zz', 'xz')
+
+
+def directory_size(directory):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(directory) for name in names)
+
+
+def measure(tournaments, players, codec, repeat):
+    """Sauvegarde puis recharge les données dans le format 'codec' ; retourne taille et meilleures durées."""
+    config.COMPRESSION = codec
+    save_times, load_times = [], []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as data_dir:  # Répertoire neuf : tous les fichiers sont écrits
+            tournaments_file = os.path.join(data_dir, config.TOURNAMENTS_FILENAME)
+            players_file = os.path.join(data_dir, config.PLAYERS_FILENAME)
+            start = time.perf_counter()
+            save_tournaments(tournaments, tournaments_file)
+            save_players(players, players_file)
+            save_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            loaded = load_tournaments(tournaments_file)
+            load_players(players_file)
+            load_times.append(time.perf_counter() - start)
+            if len(loaded) != len(tournaments):
+                raise RuntimeError(f"{len(loaded)} tournois rechargés sur {len(tournaments)}.")
+            size = directory_size(data_dir)
+    return size, min(save_times), min(load_times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tournaments', type=int, default=1000, help="Nombre de tournois de l'archive")
+    parser.add_argument('--players', type=int, default=5000, help="Nombre de joueurs de l'archive")
+    parser.add_argument('--repeat', type=int, default=3, help="Nombre de mesures par format")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        generate_archive(archive_dir, tournaments=args.tournaments, players=args.players)
+        tournaments = load_tournaments(os.path.join(archive_dir, config.TOURNAMENTS_FILENAME))
+        players = load_players(os.path.join(archive_dir, config.PLAYERS_FILENAME))
+
+    print(f"Archive : {len(tournaments)} tournois, {len(players)} joueurs")
+    print(f"{'Format':8}{'Taille':>12}{'Ratio':>8}{'Sauvegarde':>13}{'Chargement':>13}")
+    reference = None
+    for codec in CODECS:
+        size, save_time, load_time = measure(tournaments, players, codec, args.repeat)
+        reference = reference or size
+        print(f"{codec or 'json':8}{size / 1e6:>10.1f}Mo{reference / size:>7.1f}x"
+              f"{save_time * 1000:>11.0f}ms{load_time * 1000:>11.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# benchmarks/datasets.py
+
+import os
+import random
+from datetime import datetime, timedelta
+from models.match import Match
+from models.player import Player
+from models.round import Round
+from models.tournament import Tournament
+from util import config
+from util.data_manager import save_tournaments, save_players
+
+
+NAMES = ["Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau",
+         "Simon", "Laurent", "Lefebvre", "Michel", "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier"]
+FIRSTNAMES = ["Jean", "Marie", "Pierre", "Sophie", "Louis", "Julie", "Paul", "Claire", "Hugo", "Emma",
+              "Lucas", "Lea", "Nathan", "Chloe", "Arthur", "Alice", "Jules", "Camille", "Adam", "Ines"]
+LOCATIONS = ["Paris", "Lyon", "Marseille", "Lille", "Nantes", "Bordeaux", "Toulouse", "Rennes"]
+RESULTS = [(1.0, 0.0), (0.0, 1.0), (0.5, 0.5)]
+
+
+def make_unique_id(index):
+    """Construit un identifiant au format XX00000 à partir d'un entier."""
+    prefix = index // 100000
+    return f"{chr(65 + prefix // 26 % 26)}{chr(65 + prefix % 26)}{index % 100000:05d}"
+
+
+def generate_players(count, rng):
+    """Génère une liste de joueurs valides."""
+    players = []
+    for index in range(count):
+        birthdate = datetime(1950, 1, 1) + timedelta(days=rng.randrange(20000))
+        players.append(Player(rng.choice(NAMES), rng.choice(FIRSTNAMES), birthdate.strftime("%d/%m/%Y"),
+                              make_unique_id(index)))
+    return players
+
+
+def generate_tournament(index, pool, players_per_tournament, rounds, rng, start_date, complete=True):
+    """
+    Génère un tournoi dont les rounds sont appariés et, si 'complete' est vrai, tous terminés.
+
+    Les joueurs inscrits sont des copies de ceux du pool, comme après un rechargement des données.
+    """
+    entrants = [Player(p.name, p.firstname, p.birthdate.strftime("%d/%m/%Y"), p.unique_id)
+                for p in rng.sample(pool, min(players_per_tournament, len(pool)))]
+    tournament_rounds = []
+    for round_index in range(rounds):
+        rng.shuffle(entrants)
+        start_time = start_date + timedelta(days=round_index // 2, hours=round_index % 2 * 4)
+        matches = [Match(players=(entrants[i], entrants[i + 1]),
+                         results=rng.choice(RESULTS) if complete else (0, 0))
+                   for i in range(0, len(entrants) - 1, 2)]
+        tournament_rounds.append(Round(name=f"Round {round_index + 1}", start_time=start_time,
+                                       end_time=start_time + timedelta(hours=3) if complete else None,
+                                       is_complete=complete, matches=matches))
+    return Tournament(name=f"Open {index}", location=rng.choice(LOCATIONS), description=f"Tournoi synthétique {index}",
+                      start_date=start_date.strftime("%d/%m/%Y"),
+                      end_date=(start_date + timedelta(days=rounds // 2 + 1)).strftime("%d/%m/%Y"),
+                      total_round=rounds, t_id=f"{index:08x}", rounds=tournament_rounds, registered_players=entrants)
+
+
+def generate_archive(data_dir, tournaments=100, players=2000, players_per_tournament=32, rounds=7, seed=0):
+    """
+    Écrit une archive synthétique (tournaments.json et players.json) dans 'data_dir'.
+
+    Retourne :
+    - tuple : Les listes de tournois et de joueurs générés.
+    """
+    rng = random.Random(seed)
+    pool = generate_players(players, rng)
+    first_date = datetime(2014, 1, 4)
+    generated = [generate_tournament(index, pool, players_per_tournament, rounds, rng,
+                                     first_date + timedelta(days=7 * index % 3650))
+                 for index in range(tournaments)]
+    save_tournaments(generated, os.path.join(data_dir, config.TOURNAMENTS_FILENAME))
+    save_players(pool, os.path.join(data_dir, config.PLAYERS_FILENAME))
+    return generated, pool
@@ -0,0 +1,203 @@
+# benchmarks/menu_latency.py
+"""
+Mesure la latence des actions des menus en pilotant les vrais contrôleurs avec des saisies scriptées.
+
+Usage (depuis le dossier ChessTournamentAPP) :
+    python -m benchmarks.menu_latency --tournaments 500 --results 300
+
+La fonction input est remplacée par un script de réponses et la sortie standard est capturée. La latence
+d'une action va du renvoi de sa première réponse à la demande de saisie qui suit sa dernière réponse :
+elle couvre le chargement, le traitement, la sauvegarde et l'affichage, comme pour un utilisateur.
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from unittest import mock
+from benchmarks.datasets import generate_archive, generate_tournament
+from controllers.application_controller import ApplicationController
+from controllers.base_controller import BaseController, SEARCH_THRESHOLD
+from util import config
+from util.data_manager import save_tournaments
+
+
+BENCH_LOCATION = "Salle Bench"  # Lieu du tournoi créé par le script, retrouvé par la recherche
+RESULTS_LOCATION = "Salle Résultats"  # Lieu du tournoi préparé pour la saisie des résultats
+PERCENTILES = (50, 90, 99)
+
+
+class ScriptEnded(Exception):
+    """Levée lorsque l'application demande une saisie au-delà du script."""
+
+
+class ScriptedInput:
+    """
+    Remplace input : renvoie les réponses du script une à une et chronomètre chaque action.
+
+    Paramètres :
+    - steps (list) : Actions (libellé, réponses) ; un libellé None désigne une navigation non mesurée.
+    - output (StringIO) : Sortie capturée, vidée au début de chaque action.
+    """
+
+    def __init__(self, steps, output):
+        self.answers = [(label, answer, index == len(answers) - 1)
+                        for label, answers in steps for index, answer in enumerate(answers)]
+        self.position = 0
+        self.output = output
+        self.samples = {}
+        self.pending = None  # (libellé, début) de l'action dont la dernière réponse a été renvoyée
+        self.started = None
+        self.prompts = []
+
+    def __call__(self, prompt=""):
+        now = time.perf_counter()
+        if self.pending is not None:
+            label, start = self.pending
+            self.samples.setdefault(label, []).append(now - start)
+            self.pending = None
+        self.prompts = (self.prompts + [prompt])[-5:]
+        if self.position >= len(self.answers):
+            raise ScriptEnded(f"Saisie non prévue par le script ; dernières demandes : {self.prompts}")
+        label, answer, last = self.answers[self.position]
+        if self.started is None:
+            self.output.seek(0)
+            self.output.truncate()
+            self.started = time.perf_counter()
+        self.position += 1
+        if last:
+            if label is not None:
+                self.pending = (label, self.started)
+            self.started = None
+        return answer
+
+    def finish(self):
+        """Enregistre la durée de la dernière action, terminée par la sortie de l'application."""
+        if self.pending is not None:
+            label, start = self.pending
+            self.samples.setdefault(label, []).append(time.perf_counter() - start)
+            self.pending = None
+
+
+def build_dataset(data_dir, tournaments, players, results):
+    """
+    Écrit une archive synthétique, plus un tournoi en cours de 2 × 'results' joueurs dont le premier round
+    est commencé et sans résultat, pour la saisie des résultats.
+
+    Retourne :
+    - tuple : (nombre de tournois, identifiants des joueurs, nombre de matches du round à terminer).
+    """
+    generated, pool = generate_archive(data_dir, tournaments, max(players, 2 * results))
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    live = generate_tournament(tournaments, pool, 2 * results, 1, random.Random(1), today, complete=False)
+    live.location, live.total_round = RESULTS_LOCATION, 9
+    live.end_date = today + timedelta(days=9)
+    generated.append(live)
+    save_tournaments(generated, os.path.join(data_dir, config.TOURNAMENTS_FILENAME))
+    return len(generated), [player.unique_id for player in pool], len(live.rounds[0].matches)
+
+
+def select(location, position, count):
+    """Réponses qui sélectionnent un tournoi : recherche par lieu au-delà de SEARCH_THRESHOLD tournois."""
+    if count > SEARCH_THRESHOLD:
+        return [location, "", "", "", "1"]
+    return [str(position)]
+
+
+def build_script(count, player_ids, matches, entrants):
+    """
+    Construit le scénario : créer un tournoi, y inscrire 'entrants' joueurs, le démarrer, démarrer un round,
+    saisir les résultats du tournoi préparé, puis charger ce dernier deux fois (affichage puis cache).
+    """
+    today = datetime.now()
+    created = count + 1  # Le tournoi créé est ajouté à la fin de la liste
+    steps = [(None, ["1"]),
+             ("créer un tournoi", ["1", "Open Bench", BENCH_LOCATION, "Tournoi du banc d'essai",
+                                   today.strftime("%d/%m/%Y"), (today + timedelta(days=10)).strftime("%d/%m/%Y"),
+                                   ""]),
+             (None, ["9", "2"])]
+    for unique_id in player_ids[:entrants]:
+        steps.append(("inscrire un joueur", ["3"] + select(BENCH_LOCATION, created, created) + [unique_id]))
+    steps += [(None, ["7", "1"]),
+              ("démarrer un tournoi", ["4"] + select(BENCH_LOCATION, created, created)),
+              ("ouvrir la gestion des rounds", ["6"] + select(BENCH_LOCATION, created, created)),
+              ("démarrer un round", ["2", "2"]),
+              (None, ["6"]),
+              ("ouvrir la gestion des rounds", ["6"] + select(RESULTS_LOCATION, count, created)),
+              ("sélectionner le round à terminer", ["3", "1"])]
+    steps += [("saisir un résultat", ["1-0"])] * (matches - 1)
+    steps += [("terminer le round (dernier résultat et sauvegarde)", ["0.5-0.5"]),
+              (None, ["6"]),
+              ("charger un tournoi", ["3"] + select(RESULTS_LOCATION, count, created)),
+              ("recharger un tournoi (rendu en cache)", ["3"] + select(RESULTS_LOCATION, count, created)),
+              (None, ["9"]),
+              ("quitter", ["3"])]
+    return steps
+
+
+def run_session(data_dir, steps):
+    """Exécute le scénario avec les vrais contrôleurs et retourne les durées par action."""
+    BaseController.use_data_dir(data_dir)
+    output = io.StringIO()
+    scripted = ScriptedInput(steps, output)
+    with mock.patch('builtins.input', scripted), redirect_stdout(output):
+        ApplicationController().run()
+        scripted.finish()
+    if scripted.position != len(scripted.answers):
+        raise RuntimeError(f"Scénario interrompu à la réponse {scripted.position} ; "
+                           f"dernières demandes : {scripted.prompts}")
+    BaseController.use_data_dir(config.DATA_DIR)
+    return scripted.samples
+
+
+def percentile(values, rank):
+    """Percentile par rang le plus proche."""
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, -(-rank * len(ordered) // 100) - 1))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tournaments', type=int, default=500, help="Nombre de tournois de l'archive")
+    parser.add_argument('--players', type=int, default=2000, help="Nombre de joueurs de l'archive")
+    parser.add_argument('--results', type=int, default=300, help="Nombre de résultats à saisir")
+    parser.add_argument('--entrants', type=int, default=20, help="Joueurs inscrits au tournoi créé")
+    parser.add_argument('--repeat', type=int, default=3, help="Nombre de sessions, chacune sur une copie neuve")
+    parser.add_argument('--output', help="Fichier JSON où écrire les percentiles, pour comparer deux versions")
+    args = parser.parse_args(argv)
+
+    samples = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        template = os.path.join(work_dir, 'template')
+        count, player_ids, matches = build_dataset(template, args.tournaments, args.players, args.results)
+        steps = build_script(count, player_ids, matches, args.entrants)
+        for session in range(args.repeat):
+            data_dir = os.path.join(work_dir, f'session-{session}')
+            shutil.copytree(template, data_dir)
+            for label, durations in run_session(data_dir, steps).items():
+                samples.setdefault(label, []).extend(durations)
+
+    print(f"Archive : {count} tournois, {len(player_ids)} joueurs ; {args.repeat} session(s)")
+    print(f"{'Action':<52}{'n':>5}" + "".join(f"{'p' + str(rank):>10}" for rank in PERCENTILES) + f"{'max':>10}")
+    report = {}
+    for label, durations in samples.items():
+        report[label] = {f"p{rank}": percentile(durations, rank) for rank in PERCENTILES}
+        report[label].update(n=len(durations), max=max(durations))
+        print(f"{label:<52}{len(durations):>5}"
+              + "".join(f"{report[label][f'p{rank}'] * 1000:>8.1f}ms" for rank in PERCENTILES)
+              + f"{max(durations) * 1000:>8.1f}ms")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump({'arguments': vars(args), 'actions': report}, file, ensure_ascii=False, indent=1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+# benchmarks/pairing.py
+"""
+Mesure le débit de l'appariement par lots selon le nombre de processus.
+
+Usage (depuis le dossier ChessTournamentAPP) :
+    python -m benchmarks.pairing --tournaments 400 --players 120
+"""
+
+import argparse
+import os
+import random
+import time
+from datetime import datetime
+from benchmarks.datasets import generate_players, generate_tournament
+from models.pairing import pair_tournaments
+
+
+def build_sections(count, players, rounds, seed):
+    """Génère des tournois dont 'rounds' rounds sont joués et le suivant reste à apparier."""
+    rng = random.Random(seed)
+    pool = generate_players(players * 4, rng)
+    sections = []
+    for index in range(count):
+        tournament = generate_tournament(index, pool, players, rounds, rng, datetime(2030, 1, 1))
+        tournament.total_round = rounds + 1
+        sections.append(tournament)
+    return sections
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tournaments', type=int, default=400)
+    parser.add_argument('--players', type=int, default=120, help="Joueurs par tournoi")
+    parser.add_argument('--rounds', type=int, default=6, help="Rounds déjà joués")
+    args = parser.parse_args(argv)
+
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    baseline = None
+    for workers in worker_counts:
+        sections = build_sections(args.tournaments, args.players, args.rounds, seed=0)
+        start = time.perf_counter()
+        pair_tournaments(sections, max_workers=workers, seed=0)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>3} processus : {elapsed:7.3f} s   {args.tournaments / elapsed:8.1f} tournois/s   "
+              f"accélération x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/startup.py
+"""
+Mesure le temps nécessaire à main.py pour afficher le menu principal puis quitter.
+
+Usage (depuis le dossier ChessTournamentAPP) :
+    python -m benchmarks.startup --tournaments 2000 --budget 1.0
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from benchmarks.datasets import generate_archive
+
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def time_startup(data_dir, repeat):
+    """Lance main.py 'repeat' fois, quitte depuis le menu principal et retourne les durées mesurées."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, 'main.py', '--data-dir', data_dir], cwd=APP_DIR,
+                                   input="3\n", capture_output=True, text=True, check=True)
+        durations.append(time.perf_counter() - start)
+        if "MENU PRINCIPAL" not in completed.stdout:
+            raise RuntimeError("Le menu principal n'a pas été affiché.")
+    return durations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tournaments', type=int, default=1000, help="Nombre de tournois de l'archive")
+    parser.add_argument('--players', type=int, default=5000, help="Nombre de joueurs de l'archive")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=1.0, help="Durée médiane maximale en secondes")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as empty_dir, tempfile.TemporaryDirectory() as archive_dir:
+        generate_archive(archive_dir, tournaments=args.tournaments, players=args.players)
+        size = sum(os.path.getsize(os.path.join(root, name))
+                   for root, _, names in os.walk(archive_dir) for name in names)
+        results = {
+            "archive vide": time_startup(empty_dir, args.repeat),
+            f"archive {args.tournaments} tournois ({size / 1e6:.1f} Mo)": time_startup(archive_dir, args.repeat),
+        }
+
+    exceeded = False
+    for label, durations in results.items():
+        median = statistics.median(durations)
+        exceeded |= median > args.budget
+        print(f"{label:<40} médiane {median * 1000:8.1f} ms   max {max(durations) * 1000:8.1f} ms")
+    print(f"Budget : {args.budget * 1000:.0f} ms -> {'DÉPASSÉ' if exceeded else 'respecté'}")
+    return 1 if exceeded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,122 @@
 # controllers/base_controller.py
 
+import os
+from models.game_index import GameIndex
+from models.player_stats import StatsTable
+from models.tournament_index import TournamentIndex
+from util import config
+from util.archive import load_archives, merge_archives
+from util.checkpoint import recover_checkpoints, clear_checkpoints
 from util.data_manager import load_tournaments, save_tournaments, load_players, save_players
+from views.render_cache import render_cache
+from views.tournament_views import TournamentView
+
+
+SEARCH_THRESHOLD = 20  # Above this many tournaments, selecting one starts with a search
+
+
+def load_tournaments_with_recovery(filename):
+    """Load live tournaments, then replay any checkpoint left behind by an interrupted session.
+
+    Archived tournaments are added afterwards; only their headers are read until they are used.
+    """
+    tournaments = load_tournaments(filename)
+    checkpoints_dir = os.path.join(os.path.dirname(filename), config.CHECKPOINTS_DIRNAME)
+    recovered = recover_checkpoints(tournaments, checkpoints_dir)
+    if recovered:
+        save_tournaments(tournaments, filename)
+        clear_checkpoints(checkpoints_dir)
+        for tournament in recovered:
+            print(f"Résultats non sauvegardés du tournoi '{tournament.name}' récupérés.")
+    archives = load_archives(os.path.join(os.path.dirname(filename), config.ARCHIVE_DIRNAME))
+    return merge_archives(tournaments, archives)
+
+
+class LazyData:
+    """Class-level attribute whose data is loaded from the data directory on first access."""
+
+    def __init__(self, filename, loader):
+        self.filename = filename
+        self.loader = loader
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if self.name not in BaseController._data:
+            BaseController._data[self.name] = self.loader(BaseController.data_file(self.filename))
+        return BaseController._data[self.name]
+
+
+class DerivedData:
+    """Class-level attribute built from the loaded data on first access, such as an index."""
+
+    def __init__(self, builder):
+        self.builder = builder
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if self.name not in BaseController._data:
+            BaseController._data[self.name] = self.builder()
+        return BaseController._data[self.name]
 
 
 class BaseController:
     """Base controller that manages data loading and saving operations."""
 
-    tournaments = load_tournaments()  # Load static tournaments data
-    players = load_players()          # Load static players data
+    data_dir = config.DATA_DIR
+    _data = {}
+
+    tournaments = LazyData(config.TOURNAMENTS_FILENAME, load_tournaments_with_recovery)  # Loaded on first access
+    players = LazyData(config.PLAYERS_FILENAME, load_players)              # Loaded on first access
+    game_index = DerivedData(lambda: GameIndex(BaseController.tournaments))  # Games by player
+    tournament_index = DerivedData(lambda: TournamentIndex(BaseController.tournaments))  # Dates, location, status
+    player_stats = DerivedData(lambda: StatsTable(BaseController.tournaments))  # Wins, draws, losses, performance
+
+    @staticmethod
+    def use_data_dir(data_dir):
+        """Point every controller to another data directory; data is reloaded on next access."""
+        BaseController.data_dir = data_dir
+        for value in BaseController._data.values():
+            if hasattr(value, 'close'):
+                value.close()
+        for tournament in BaseController._data.get('tournaments', ()):
+            if getattr(tournament, 'archived', False):
+                tournament.close()  # Releases the archive's memory mapping
+        BaseController._data.clear()
+        render_cache.clear()
+
+    @staticmethod
+    def reset_derived_data():
+        """Drop indexes built from the loaded data and the rendered views; they are rebuilt on next access."""
+        render_cache.clear()
+        for name, attribute in vars(BaseController).items():
+            if isinstance(attribute, DerivedData) and name in BaseController._data:
+                value = BaseController._data.pop(name)
+                if hasattr(value, 'close'):
+                    value.close()
+
+    @staticmethod
+    def data_file(filename):
+        """Return the path of a data file inside the current data directory."""
+        return os.path.join(BaseController.data_dir, filename)
+
+    def select_tournament(self, selector=TournamentView.select_tournament):
+        """Let the user pick a tournament; long lists are first narrowed down with a search."""
+        tournaments = self.tournaments
+        if len(tournaments) > SEARCH_THRESHOLD:
+            criteria = TournamentView.get_search_criteria()
+            if criteria:
+                tournaments = self.tournament_index.query(**criteria)
+        return selector(tournaments)
 
     def save_data(self):
         """Save data to persistent storage."""
-        save_tournaments(BaseController.tournaments)  # Save tournaments to the file system
-        save_players(BaseController.players)          # Save players to the file system
+        # Save tournaments to the file system
+        save_tournaments(BaseController.tournaments, BaseController.data_file(config.TOURNAMENTS_FILENAME))
+        # Save players to the file system
+        save_players(BaseController.players, BaseController.data_file(config.PLAYERS_FILENAME))
+        # Checkpoints are only needed until the data they protect has been saved
+        clear_checkpoints(BaseController.data_file(config.CHECKPOINTS_DIRNAME))
@@ -1,7 +1,11 @@
+import os
 from controllers.base_controller import BaseController
 from views.player_views import PlayerView
 from views.menu_view import MenuView
 from models.player import Player
+from models.rating import recompute_ratings
+from models.duplicates import find_duplicates, merge_players
+from util.archive import archive_tournament
 
 
 class PlayerController(BaseController):
@@ -15,7 +19,13 @@ class PlayerController(BaseController):
                 self.display_players()
             elif choice == '3':
                 self.associate_player_to_tournament()
-            elif choice == '4':  # Retour au menu principal
+            elif choice == '4':
+                self.recompute_ratings()
+            elif choice == '5':
+                self.display_player_history()
+            elif choice == '6':
+                self.merge_duplicates()
+            elif choice == '7':  # Retour au menu principal
                 break
             else:
                 print("Choix invalide, veuillez réessayer.")
@@ -31,11 +41,11 @@ class PlayerController(BaseController):
 
     def display_players(self):
         """Affiche la liste de tous les joueurs enregistrés."""
-        PlayerView.display_players(self.players)
+        PlayerView.display_players(self.players, self.player_stats.for_all_players())
 
     def associate_player_to_tournament(self):
         """Associe un joueur sélectionné à un tournoi choisi."""
-        selected_tournament = PlayerView.display_tournaments_for_selection(self.tournaments)
+        selected_tournament = self.select_tournament(PlayerView.display_tournaments_for_selection)
         if selected_tournament:
             PlayerView.display_players(self.players)
             player_id = input("Entrez l'ID du joueur à inscrire : ")
@@ -47,3 +57,45 @@ class PlayerController(BaseController):
                 print("Joueur non trouvé.")
         else:
             print("Aucune action effectuée.")
+
+    def recompute_ratings(self):
+        """Recalcule les classements Elo de tous les joueurs à partir de l'historique des tournois."""
+        ratings = recompute_ratings(self.tournaments, self.players)
+        self.reset_derived_data()  # Les performances dépendent des classements des adversaires
+        self.save_data()
+        print(f"Classements recalculés pour {len(ratings)} joueurs.")
+
+    def display_player_history(self):
+        """Affiche toutes les parties d'un joueur et, sur demande, son face-à-face avec un adversaire."""
+        player_id = input("Entrez l'ID du joueur : ")
+        player = next((player for player in self.players if player.unique_id == player_id), None)
+        if not player:
+            print("Joueur non trouvé.")
+            return
+        PlayerView.display_player_history(player, self.game_index.games_of(player_id), self.game_index)
+        opponent_id = input("Entrez l'ID d'un adversaire pour le face-à-face (laisser vide pour ignorer) : ")
+        if opponent_id:
+            PlayerView.display_head_to_head(player, opponent_id, self.game_index.head_to_head(player_id, opponent_id))
+
+    @staticmethod
+    def rewrite_archive(tournament, archive):
+        """Réécrit l'archive d'un tournoi archivé dont des joueurs ont été fusionnés."""
+        archive.close()  # Libère la projection de l'ancienne archive avant son remplacement
+        return archive_tournament(tournament, os.path.dirname(archive.filename))
+
+    def merge_duplicates(self):
+        """Recherche les joueurs enregistrés sous plusieurs identifiants et fusionne ceux choisis."""
+        candidates = find_duplicates(self.players)
+        PlayerView.display_duplicates(candidates)
+        selected = PlayerView.select_duplicates(candidates) if candidates else []
+        if not selected:
+            return
+        merges = {candidate.duplicate.unique_id: candidate.player.unique_id for candidate in selected}
+        conflicts = merge_players(self.players, self.tournaments, merges, self.rewrite_archive)
+        for t_id, duplicate_id, kept_id in conflicts:
+            print(f"Tournoi {t_id} : {duplicate_id} et {kept_id} y sont tous deux inscrits, "
+                  "fusion annulée pour cette paire (fiche laissée telle quelle).")
+        # Les index par joueur référencent les anciens identifiants
+        self.reset_derived_data()
+        self.save_data()
+        print(f"{len(set(merges) - {duplicate_id for _, duplicate_id, _ in conflicts})} doublon(s) fusionné(s).")
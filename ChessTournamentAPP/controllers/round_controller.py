@@ -1,6 +1,11 @@
 # controllers/round_controller.py
 
+import os
 from controllers.base_controller import BaseController
+from models.pairing import PairingVariant, commit_preview, pairing_obstacle, preview_pairings
+from util import config
+from util.checkpoint import Checkpoint
+from util.dropfolder import DropFolder
 from views.menu_view import MenuView
 from views.round_views import RoundView
 
@@ -24,19 +29,128 @@ class RoundController(BaseController):
                 if round_index is not None:
                     if tournament.rounds[round_index].start_time is None:
                         print(f"Erreur : Le round '{tournament.rounds[round_index].name}'"
-                            f"n'a pas encore commencé et ne peut pas être terminé.")
+                              f"n'a pas encore commencé et ne peut pas être terminé.")
                     else:
-                        match_results = []
-                        for match in tournament.rounds[round_index].matches:
-                            print(match.display_match())
-                            match_result = RoundView.get_match_results()
-                            if match_result:
-                                match_results.append(match_result)
-                        if match_results:  # Ensure that results have been correctly collected
-                            tournament.end_round(round_index, match_results)
-                            self.save_data()
+                        self.end_round(tournament, round_index)
 
             elif choice == '4':
+                self.watch_results(tournament)
+            elif choice == '5':
+                self.compare_pairings(tournament)
+            elif choice == '6':
                 break
 
+    def end_round(self, tournament, round_index):
+        """
+        Saisit les résultats des matches d'un round puis le termine.
 
+        Chaque résultat est enregistré dans un point de reprise dès sa saisie : après un arrêt brutal,
+        les résultats déjà saisis sont restaurés au redémarrage et ne sont pas redemandés. Une saisie vide
+        interrompt la saisie sans terminer le round, en conservant le point de reprise.
+        """
+        rnd = tournament.rounds[round_index]
+        if rnd.is_complete:
+            print(f"Round '{rnd.name}' is already completed.")
+            return
+        checkpoint = Checkpoint(self.data_file(config.CHECKPOINTS_DIRNAME), tournament)
+        checkpoint.snapshot()
+        for match_index, match in enumerate(rnd.matches):
+            print(match.display_match())
+            if match.is_complete:
+                print(f"Résultat déjà saisi : {match.results[0]}-{match.results[1]}")
+                continue
+            while True:
+                match_result = RoundView.get_match_results()
+                if match_result == ():
+                    print("Saisie interrompue : les résultats déjà saisis sont conservés et ne seront pas "
+                          "redemandés.")
+                    return
+                if match_result:
+                    try:
+                        tournament.update_scores(round_index, match_index, *match_result)
+                        break
+                    except ValueError as e:
+                        print(e)
+            checkpoint.record_result(round_index, match_index, match_result)
+        self.refresh_ratings(tournament, rnd)
+        tournament.end_round(round_index, [match.results for match in rnd.matches])
+        self.sync_ratings(tournament, rnd)
+        self.save_data()
+
+    def watch_results(self, tournament):
+        """
+        Enregistre les résultats déposés sous forme de fichiers dans un dossier, jusqu'à Ctrl+C.
+
+        Chaque rafale de fichiers est sauvegardée en une fois ; les rounds se terminent ensuite depuis le menu.
+        """
+        default_directory = self.data_file(os.path.join(config.DROPFOLDER_DIRNAME, tournament.t_id))
+        directory = input(f"Dossier à surveiller (laisser vide pour {default_directory}) : ") or default_directory
+        print(f"Surveillance de {directory} : une ligne 'round;échiquier;résultat' par partie (ex. 3;12;1-0).")
+        print("Ctrl+C pour revenir au menu.")
+        DropFolder(directory, tournament, self.save_data).run()
+
+    def compare_pairings(self, tournament):
+        """
+        Compare plusieurs appariements du prochain round (standard, accéléré, avec ou sans retardataires)
+        puis applique celui choisi. Le tournoi n'est modifié qu'à l'application.
+        """
+        obstacle = pairing_obstacle(tournament)
+        if obstacle is not None:
+            print(f"Appariement impossible pour le tournoi '{tournament.name}' : {obstacle}.")
+            return
+        late_ids = input("Identifiants des retardataires à ajouter, séparés par des virgules "
+                         "(laisser vide pour aucun) : ")
+        players_by_id = {player.unique_id: player for player in self.players}
+        late_entrants = [players_by_id[unique_id.strip()] for unique_id in late_ids.split(',')
+                         if unique_id.strip() in players_by_id]
+        variants = [PairingVariant("Standard", False, False, None), PairingVariant("Accéléré", True, False, None)]
+        if late_entrants:
+            variants += [PairingVariant("Standard + retardataires", False, True, None),
+                         PairingVariant("Accéléré + retardataires", True, True, None)]
+        previews = preview_pairings(tournament, variants, late_entrants)
+        players_by_id.update((player.unique_id, player) for player in tournament.registered_players)
+        while True:
+            RoundView.display_pairing_previews(previews)
+            selection = RoundView.select_pairing_preview(previews)
+            if selection is None:
+                print("Aucun appariement appliqué.")
+                return
+            action, preview = selection
+            if action == 'show':
+                RoundView.display_preview_pairs(preview, players_by_id)
+                continue
+            try:
+                rnd = commit_preview(tournament, preview, late_entrants)
+            except ValueError as e:
+                print(e)
+                return
+            self.save_data()
+            print(f"{len(preview.pairs)} matches créés dans '{rnd.name}' ({preview.variant.name}).")
+            return
+
+    @staticmethod
+    def _entrants(tournament, rnd):
+        """Joueurs du tournoi et des matches du round, copies éventuellement distinctes de la liste générale."""
+        return list(tournament.registered_players) + [player for match in rnd.matches for player in match.players]
+
+    def refresh_ratings(self, tournament, rnd):
+        """
+        Reprend les classements de la liste générale sur les joueurs du tournoi avant le calcul Elo du round.
+
+        Après un rechargement, les joueurs d'un tournoi sont des copies qui portent le classement enregistré
+        dans son fichier : sans cette mise à jour, les variations obtenues entre-temps dans un autre tournoi
+        seraient perdues par sync_ratings.
+        """
+        registry = {player.unique_id: player for player in self.players}
+        for entrant in self._entrants(tournament, rnd):
+            player = registry.get(entrant.unique_id)
+            if player is not None and player is not entrant:
+                entrant.rating, entrant.rated_games = player.rating, player.rated_games
+
+    def sync_ratings(self, tournament, rnd):
+        """Reporte les classements des joueurs du tournoi sur la liste générale des joueurs."""
+        entrants = {player.unique_id: player for player in self._entrants(tournament, rnd)}
+        for player in self.players:
+            entrant = entrants.get(player.unique_id)
+            if entrant is not None and entrant is not player:
+                player.rating, player.rated_games = entrant.rating, entrant.rated_games
@@ -0,0 +1,173 @@
+# controllers/tools_controller.py
+
+import os
+from controllers.base_controller import BaseController
+from util import config
+from util.archive import ARCHIVE_EXTENSION, ArchivedTournament, archive_completed
+from util.checkpoint import apply_checkpoint, checkpoint_files
+from util.data_manager import read_tournament_file, report_problems, tournament_file
+from util.export import export_tournaments
+from util.trf import TRF_EXTENSION, read_trf, trf_files, write_trf
+from views.live_board import LiveBoard, show_live_board
+from views.menu_view import MenuView
+from views.tournament_views import TournamentView
+
+
+class ToolsController(BaseController):
+    def manage_tools(self):
+        """Gère le menu des rapports et outils des tournois."""
+        while True:
+            choice = MenuView.display_tools_menu()
+            if choice == '1':
+                self.simulate_tournament()
+            elif choice == '2':
+                self.export_reports()
+            elif choice == '3':
+                self.archive_tournaments()
+            elif choice == '4':
+                self.import_trf()
+            elif choice == '5':
+                self.export_trf()
+            elif choice == '6':
+                self.live_board()
+            elif choice == '7':
+                break
+            else:
+                print("Choix invalide, veuillez réessayer.")
+
+    def simulate_tournament(self):
+        """Estime par simulation les chances de chaque joueur de remporter un tournoi."""
+        tournament = self.select_tournament()
+        if not tournament:
+            print("Aucun tournoi sélectionné ou sélection invalide.")
+            return
+        if len(tournament.registered_players) < 2:
+            print("Pas assez de joueurs pour simuler ce tournoi.")
+            return
+        # Import différé : NumPy n'est chargé que lorsqu'une simulation est demandée
+        from models.simulation import simulate_tournament
+        result = simulate_tournament(tournament)
+        TournamentView.display_simulation(tournament, result)
+
+    def export_reports(self):
+        """Exporte les appariements, classements et grilles d'un tournoi ou de tous les tournois."""
+        default_directory = self.data_file(config.EXPORTS_DIRNAME)
+        if input("Exporter tous les tournois ? (o/n) : ").lower() == 'o':
+            tournaments = self.tournaments
+        else:
+            tournament = self.select_tournament()
+            if not tournament:
+                print("Aucun tournoi sélectionné ou sélection invalide.")
+                return
+            tournaments = [tournament]
+        directory = input(f"Dossier de destination (laisser vide pour {default_directory}) : ") or default_directory
+        written = export_tournaments(tournaments, directory)
+        print(f"{len(written)} fichier(s) exporté(s) dans {directory}.")
+
+    def archive_tournaments(self):
+        """Fige les tournois terminés dans des archives en lecture seule, hors de la sauvegarde courante."""
+        archived = archive_completed(self.tournaments, self.data_file(config.ARCHIVE_DIRNAME))
+        if not archived:
+            print("Aucun tournoi terminé à archiver.")
+            return
+        # Les index référencent les anciens objets : ils seront reconstruits à partir des archives
+        self.reset_derived_data()
+        self.save_data()
+        print(f"{len(archived)} tournoi(s) archivé(s).")
+
+    def import_trf(self):
+        """
+        Importe un fichier TRF, ou tous les fichiers TRF d'un dossier.
+
+        Les tournois et les joueurs importés sont enregistrés en une seule sauvegarde, à la fin de l'import.
+        """
+        path = input("Fichier TRF ou dossier à importer : ")
+        if not path or not os.path.exists(path):
+            print("Fichier ou dossier introuvable.")
+            return
+        imported, new_players = [], []
+        for filename in trf_files(path):
+            try:
+                tournament, players = read_trf(filename, self.players + new_players)
+            except (OSError, ValueError) as e:
+                print(f"{filename} ignoré : {e}")
+                continue
+            imported.append(tournament)
+            new_players.extend(players)
+        if not imported:
+            print("Aucun tournoi importé.")
+            return
+        self.tournaments.extend(imported)
+        self.players.extend(new_players)
+        self.reset_derived_data()
+        self.save_data()
+        print(f"{len(imported)} tournoi(s) et {len(new_players)} nouveau(x) joueur(s) importé(s).")
+
+    def export_trf(self):
+        """Exporte un tournoi au format TRF."""
+        tournament = self.select_tournament()
+        if not tournament:
+            print("Aucun tournoi sélectionné ou sélection invalide.")
+            return
+        default_file = os.path.join(self.data_file(config.EXPORTS_DIRNAME), tournament.t_id + TRF_EXTENSION)
+        filename = input(f"Fichier de destination (laisser vide pour {default_file}) : ") or default_file
+        write_trf(tournament, filename)
+        print(f"Tournoi '{tournament.name}' exporté dans {filename}.")
+
+    def live_board(self, tournament=None):
+        """
+        Affiche en plein écran les appariements du round en cours et le classement d'un tournoi.
+
+        Le tableau suit le fichier du tournoi et son point de reprise : les résultats enregistrés par une
+        autre instance de l'application s'affichent dès leur saisie au poste de l'arbitre (journal du point
+        de reprise), et à chaque lot de fichiers pour le dossier de dépôt.
+        """
+        tournament = tournament or self.select_tournament()
+        if not tournament:
+            print("Aucun tournoi sélectionné ou sélection invalide.")
+            return
+        if getattr(tournament, 'archived', False):
+            show_live_board(LiveBoard(tournament))
+            return
+        filename = tournament_file(tournament.t_id, self.data_file(config.TOURNAMENTS_FILENAME))
+        show_live_board(self._board(tournament, filename))
+
+    @classmethod
+    def _board(cls, tournament, filename):
+        """
+        Construit le tableau d'un tournoi en cours, qui relit son fichier et lui applique le point de reprise
+        des résultats saisis depuis la dernière sauvegarde. Rien n'est jamais écrit, déplacé ni supprimé.
+        """
+        checkpoints = cls.data_file(config.CHECKPOINTS_DIRNAME)
+
+        def load(path):
+            loaded = read_tournament_file(path, quarantine=False)[0]
+            if loaded is not None:
+                apply_checkpoint(loaded, checkpoints, notify=False)
+            return loaded
+        return LiveBoard(tournament, filename, load, watched=checkpoint_files(checkpoints, tournament.t_id))
+
+    @classmethod
+    def live_board_file(cls, t_id):
+        """
+        Affiche le tableau en direct d'un tournoi en ne lisant que son fichier et son point de reprise
+        (option --board).
+
+        Contrairement au chargement de l'application, aucun autre tournoi n'est lu et rien n'est écrit : ni
+        sauvegarde, ni effacement du point de reprise, ni migration ou mise de côté de fichiers. Le poste de
+        l'arbitre reste seul à écrire les données.
+        """
+        archive = os.path.join(cls.data_file(config.ARCHIVE_DIRNAME), t_id + ARCHIVE_EXTENSION)
+        if os.path.exists(archive):
+            show_live_board(LiveBoard(ArchivedTournament(archive)))
+            return
+        filename = tournament_file(t_id, cls.data_file(config.TOURNAMENTS_FILENAME))
+        tournament, problems = read_tournament_file(filename, quarantine=False)
+        if tournament is None:
+            if not os.path.exists(filename):
+                print(f"Tournoi '{t_id}' introuvable.")
+            else:
+                report_problems(filename, problems)
+            return
+        apply_checkpoint(tournament, cls.data_file(config.CHECKPOINTS_DIRNAME), notify=False)
+        show_live_board(cls._board(tournament, filename))
@@ -4,6 +4,7 @@ from controllers.base_controller import BaseController
 from views.tournament_views import TournamentView
 from views.menu_view import MenuView
 from controllers.round_controller import RoundController
+from controllers.tools_controller import ToolsController
 from models.tournament import Tournament
 from datetime import datetime
 
@@ -12,6 +13,7 @@ class TournamentController(BaseController):
     def __init__(self):
         super().__init__()
         self.round_controller = RoundController()
+        self.tools_controller = ToolsController()
 
     def manage_tournaments(self):
         """Gère le menu des tournois"""
@@ -28,12 +30,16 @@ class TournamentController(BaseController):
             elif choice == '5':
                 self.display_tournaments()
             elif choice == '6':
-                tournament = TournamentView.select_tournament(self.tournaments)
+                tournament = self.select_tournament()
                 if tournament:
                     self.round_controller.manage_rounds(tournament)
                 else:
                     print("Aucun tournoi sélectionné")
-            elif choice == '7':  # Retour au menu principal
+            elif choice == '7':
+                self.tools_controller.manage_tools()
+            elif choice == '8':
+                self.search_tournaments()
+            elif choice == '9':  # Retour au menu principal
                 break
             else:
 
@@ -48,7 +54,7 @@ class TournamentController(BaseController):
         print(f"Tournament '{new_tournament.name}' has been successfully created.")
 
     def start_tournament(self):
-        tournament = TournamentView.select_tournament(self.tournaments)
+        tournament = self.select_tournament()
         if tournament:
             if tournament.is_tournament_complete():
                 print(f"Le Tournoi '{tournament.name}' est déjà terminé.")
@@ -63,13 +69,12 @@ class TournamentController(BaseController):
         Charge un tournoi sélectionné et affiche ses informations détaillées,
         les joueurs inscrits, les rounds joués et le classement par points
         """
-        tournament = TournamentView.select_tournament(self.tournaments)
+        tournament = self.select_tournament()
         if tournament:
             TournamentView.display_tournament_details(tournament)
             TournamentView.display_players(tournament)
             TournamentView.display_rounds(tournament)
-            player_points = tournament.calculate_player_points()
-            TournamentView.display_ranking(tournament, player_points)
+            TournamentView.display_ranking(tournament, self.player_stats.for_tournament(tournament))
         else:
             print("Aucun tournoi sélectionné ou sélection invalide.")
 
@@ -77,11 +82,18 @@ class TournamentController(BaseController):
         """ Afficher les tournois disponibles  """
         TournamentView.disp_tournaments(self.tournaments)
 
+    def search_tournaments(self):
+        """Recherche les tournois par lieu, dates et statut"""
+        criteria = TournamentView.get_search_criteria()
+        TournamentView.disp_tournaments(self.tournament_index.query(**criteria))
+
     def update_tournament(self):
         """ Modifier les tournois"""
         # tournament = RoundView.display_tournaments_for_selection(self.tournaments)
-        tournament = TournamentView.select_tournament(self.tournaments)
-        if tournament:
+        tournament = self.select_tournament()
+        if tournament and getattr(tournament, 'archived', False):
+            print(f"Le tournoi '{tournament.name}' est archivé et ne peut plus être modifié.")
+        elif tournament:
             print("Quel attribut voulez-vous modifier ?")
             print("1. Nom")
             print("2. Lieu")
@@ -109,6 +121,7 @@ class TournamentController(BaseController):
                 print("Choix non valide.")
                 return
 
+            tournament.touch()
             self.save_data()
             print("Le tournoi a été mis à jour.")
         else:
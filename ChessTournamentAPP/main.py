@@ -1,7 +1,44 @@
-from controllers.application_controller import ApplicationController
+import argparse
+import sys
+
+from util import profiler
+from util.compression import FORMATS as COMPRESSION_FORMATS, validate_compression
+
+
+def parse_args(argv=None):
+    """Analyse les options de lancement de l'application."""
+    parser = argparse.ArgumentParser(description="Chess Game OffLine Software")
+    parser.add_argument('--data-dir', help="Répertoire des fichiers de données (par défaut util/data)")
+    parser.add_argument('--profile', nargs='?', const='summary', choices=profiler.MODES,
+                        help="Active l'instrumentation (résumé à la sortie, ou fichier pstats avec 'cprofile')")
+    parser.add_argument('--profile-output', help="Fichier pstats écrit en mode 'cprofile'")
+    parser.add_argument('--compression', choices=('none',) + COMPRESSION_FORMATS,
+                        help="Format des fichiers de données écrits (les fichiers existants sont lus quel que soit "
+                             "leur format)")
+    parser.add_argument('--board', metavar='T_ID',
+                        help="Affiche directement le tableau en direct du tournoi 'T_ID' (écran de la salle)")
+    return parser.parse_args(argv)
 
 
 def main():
+    args = parse_args()
+    # Le profilage doit être activé avant l'import des contrôleurs pour instrumenter leurs dépendances
+    profiler.configure(args.profile, args.profile_output)
+    from util import config
+    try:
+        # Sans option, la variable d'environnement CHESS_COMPRESSION (lue par config) est vérifiée au démarrage
+        config.COMPRESSION = validate_compression(args.compression or config.COMPRESSION)
+    except ValueError as e:
+        sys.exit(f"Erreur : {e}")
+    from controllers.application_controller import ApplicationController
+    if args.data_dir:
+        from controllers.base_controller import BaseController
+        BaseController.use_data_dir(args.data_dir)
+    if args.board:
+        from controllers.tools_controller import ToolsController
+        # Écran de la salle : lecture seule du fichier du tournoi, sans charger ni sauvegarder les données
+        ToolsController.live_board_file(args.board)
+        return
     admin = ApplicationController()
     admin.run()
 
@@ -0,0 +1,233 @@
+# models/duplicates.py
+
+import unicodedata
+from collections import namedtuple
+from difflib import SequenceMatcher
+from models.opponent_history import OpponentHistory
+
+
+MATCH_THRESHOLD = 0.85  # Score à partir duquel deux fiches sont proposées comme doublons
+MAX_BLOCK_SIZE = 200  # Un bloc plus grand (clé trop commune) n'est pas comparé paire à paire
+# Poids du nom, du prénom et de la date de naissance dans le score de similarité
+NAME_WEIGHT, FIRSTNAME_WEIGHT, BIRTHDATE_WEIGHT = 0.45, 0.35, 0.2
+
+# Doublon probable : score de similarité et les deux joueurs (le premier est celui à conserver par défaut)
+DuplicateCandidate = namedtuple('DuplicateCandidate', ['score', 'player', 'duplicate'])
+
+
+def normalize(text):
+    """Forme de comparaison d'un nom : sans accents, casse, espaces ni ponctuation."""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(char for char in decomposed if char.isalnum()).casefold()
+
+
+def identity(player):
+    """Éléments comparés d'un joueur : nom et prénom normalisés, date de naissance."""
+    return normalize(player.name), normalize(player.firstname), player.birthdate
+
+
+def blocking_keys(name, firstname, birthdate):
+    """
+    Clés de regroupement d'un joueur : seuls les joueurs partageant au moins une clé sont comparés.
+
+    Une faute de frappe sur le nom, le prénom ou la date de naissance laisse au moins une clé intacte.
+    """
+    ordinal = birthdate.toordinal()
+    return (('name', name, ordinal), ('firstname', firstname, ordinal),
+            ('identity', name, firstname, birthdate.year),
+            ('firstname-month', firstname, birthdate.year, birthdate.month))
+
+
+def _birthdate_score(birthdate, other):
+    """1 pour une date identique, 0.6 lorsqu'un seul des jour, mois ou année diffère, 0 sinon."""
+    if birthdate == other:
+        return 1.0
+    same = (birthdate.day == other.day) + (birthdate.month == other.month) + (birthdate.year == other.year)
+    return 0.6 if same == 2 else 0.0
+
+
+def similarity(first, second, ratio=None, threshold=0.0):
+    """
+    Score entre 0 et 1 de deux identités (voir identity) : noms et prénoms comparés avec difflib,
+    dates de naissance identiques ou proches.
+
+    Paramètres :
+    - ratio (callable) : Similarité de deux textes, SequenceMatcher.ratio par défaut ; find_duplicates
+      fournit une version mémorisée, les mêmes noms revenant dans de nombreuses paires.
+    - threshold (float) : Score en dessous duquel la paire n'intéresse pas : la date de naissance, la moins
+      coûteuse à comparer, l'est en premier et retourne 0 sans comparer les noms si elle ne peut l'atteindre.
+    """
+    birthdate_part = BIRTHDATE_WEIGHT * _birthdate_score(first[2], second[2])
+    if birthdate_part + NAME_WEIGHT + FIRSTNAME_WEIGHT < threshold:
+        return 0.0
+    ratio = ratio or _ratio
+    return NAME_WEIGHT * ratio(first[0], second[0]) + FIRSTNAME_WEIGHT * ratio(first[1], second[1]) + birthdate_part
+
+
+def _ratio(text, other):
+    return 1.0 if text == other else SequenceMatcher(None, text, other).ratio()
+
+
+def _memoized_ratio():
+    """Retourne une fonction _ratio mémorisant ses résultats par paire de textes."""
+    ratios = {}
+
+    def ratio(text, other):
+        if text == other:
+            return 1.0
+        key = (text, other) if text < other else (other, text)
+        value = ratios.get(key)
+        if value is None:
+            value = ratios[key] = SequenceMatcher(None, *key).ratio()
+        return value
+    return ratio
+
+
+def find_duplicates(players, threshold=MATCH_THRESHOLD):
+    """
+    Recherche les joueurs enregistrés plusieurs fois sous des identifiants différents.
+
+    Les joueurs sont d'abord répartis en blocs par clé (voir blocking_keys), puis comparés deux à deux
+    à l'intérieur de chaque bloc seulement, ce qui évite les n² comparaisons.
+
+    Retourne :
+    - list : Les doublons probables (DuplicateCandidate), du plus au moins probable. Dans chaque paire,
+      le joueur conservé par défaut est celui qui a le plus de parties classées.
+    """
+    identities = [identity(player) for player in players]
+    blocks = {}
+    for position, player_identity in enumerate(identities):
+        for key in blocking_keys(*player_identity):
+            blocks.setdefault(key, []).append(position)
+
+    compared = set()
+    candidates = []
+    ratio = _memoized_ratio()
+    for positions in blocks.values():
+        if len(positions) < 2 or len(positions) > MAX_BLOCK_SIZE:
+            continue
+        for index, first in enumerate(positions):
+            for second in positions[index + 1:]:
+                if (first, second) in compared:
+                    continue
+                compared.add((first, second))
+                player, other = players[first], players[second]
+                if player.unique_id == other.unique_id:
+                    continue
+                score = similarity(identities[first], identities[second], ratio, threshold)
+                if score >= threshold:
+                    if other.rated_games > player.rated_games:
+                        player, other = other, player
+                    candidates.append(DuplicateCandidate(round(score, 3), player, other))
+    candidates.sort(key=lambda candidate: -candidate.score)
+    return candidates
+
+
+def _resolve(merges):
+    """Suit les fusions en chaîne (A -> B -> C) pour que chaque identifiant pointe vers le conservé final."""
+    resolved = {}
+    for duplicate_id in merges:
+        target, seen = merges[duplicate_id], {duplicate_id}
+        while target in merges and target not in seen:
+            seen.add(target)
+            target = merges[target]
+        resolved[duplicate_id] = target
+    return resolved
+
+
+def _merge_conflicts(tournaments, merges, rewrite_archive):
+    """
+    Retourne les paires qui ne peuvent être fusionnées : (t_id, doublon, conservé) lorsque plusieurs fiches
+    fusionnées vers le même joueur sont inscrites au même tournoi, ou lorsqu'une archive qui référence un
+    doublon ne peut être réécrite.
+    """
+    conflicts = []
+    for tournament in tournaments:
+        archived = getattr(tournament, 'archived', False)
+        ids = tournament.player_ids() if archived else [player.unique_id for player in tournament.registered_players]
+        groups = {}
+        for unique_id in ids:
+            groups.setdefault(merges.get(unique_id, unique_id), []).append(unique_id)
+        for target, members in groups.items():
+            if len(members) > 1:
+                conflicts.extend((tournament.t_id, unique_id, target) for unique_id in members if unique_id != target)
+            elif archived and rewrite_archive is None and members[0] != target:
+                conflicts.append((tournament.t_id, members[0], target))
+    return conflicts
+
+
+def merge_players(players, tournaments, merges, rewrite_archive=None):
+    """
+    Fusionne des joueurs en double en réécrivant toutes leurs références en une seule passe.
+
+    Dans chaque tournoi, la fiche du doublon est remplacée par l'objet Player conservé, dans les inscrits
+    comme dans les matches ; aucun objet Player ne change d'identifiant, car une même fiche peut être
+    partagée entre la liste globale et les tournois. Les historiques d'adversaires sont réécrits, et les
+    doublons sont retirés de la liste globale des joueurs. Un tournoi archivé qui référence un doublon est
+    reconstruit, fusionné, puis réécrit par 'rewrite_archive'.
+
+    Une paire en conflit n'est pas fusionnée du tout : deux fiches inscrites au même tournoi désignent
+    très probablement deux joueurs distincts, et le doublon reste dans la liste globale, inchangé.
+
+    Paramètres :
+    - players (list) : Liste globale des joueurs, modifiée sur place.
+    - tournaments (list) : Tous les tournois ; un tournoi archivé réécrit y est remplacé par sa nouvelle archive.
+    - merges (dict) : unique_id du doublon -> unique_id du joueur conservé.
+    - rewrite_archive (callable) : Reçoit le tournoi fusionné et l'archive d'origine, retourne la nouvelle
+      archive. Sans elle, les paires référencées par une archive sont des conflits.
+
+    Retourne :
+    - list : Les conflits (t_id, doublon, conservé), dont les paires n'ont pas été fusionnées (voir
+      _merge_conflicts).
+    """
+    merges = _resolve(merges)
+    kept = {player.unique_id: player for player in players if player.unique_id not in merges}
+    merges = {duplicate_id: target for duplicate_id, target in merges.items() if target in kept}
+    conflicts = _merge_conflicts(tournaments, merges, rewrite_archive)
+    refused = {duplicate_id for _, duplicate_id, _ in conflicts}
+    merges = {duplicate_id: target for duplicate_id, target in merges.items() if duplicate_id not in refused}
+
+    def rewrite(player):
+        player.past_opponents = {merges.get(opponent_id, opponent_id) for opponent_id in player.past_opponents}
+        player.past_opponents.discard(player.unique_id)
+
+    def merge_tournament(tournament):
+        replacements = {}
+        for player in tournament.registered_players:
+            target = merges.get(player.unique_id)
+            if target is not None:
+                replacements[player.unique_id] = kept[target]
+                kept[target].past_opponents |= player.past_opponents
+        if replacements:
+            tournament.registered_players = [replacements.get(player.unique_id, player)
+                                             for player in tournament.registered_players]
+            for rnd in tournament.rounds:
+                for match in rnd.matches:
+                    if any(player.unique_id in replacements for player in match.players):
+                        match.players = tuple(replacements.get(player.unique_id, player) for player in match.players)
+        for player in tournament.registered_players:
+            rewrite(player)
+        if replacements:
+            tournament.opponents = OpponentHistory.from_rounds(tournament.registered_players, tournament.rounds)
+            tournament.touch()
+
+    for index, tournament in enumerate(tournaments):
+        if not getattr(tournament, 'archived', False):
+            merge_tournament(tournament)
+            continue
+        if not any(unique_id in merges for unique_id in tournament.player_ids()):
+            continue
+        rebuilt = tournament.to_tournament()
+        merge_tournament(rebuilt)
+        tournaments[index] = rewrite_archive(rebuilt, tournament)
+
+    duplicates = [player for player in players if player.unique_id in merges]
+    for player in duplicates:
+        target = kept[merges[player.unique_id]]
+        target.past_opponents |= player.past_opponents
+        target.rated_games += player.rated_games
+    removed = {id(player) for player in duplicates}
+    players[:] = [player for player in players if id(player) not in removed]
+    for player in players:
+        rewrite(player)
+    return conflicts
@@ -0,0 +1,48 @@
+# models/events.py
+
+from collections import namedtuple
+
+
+# Événements émis par les modèles. Chacun porte les objets concernés, pour qu'un abonné mette à jour
+# ses données dérivées à partir du seul changement, sans reparcourir le tournoi.
+MatchAdded = namedtuple('MatchAdded', ['round', 'match'])
+MatchResultSet = namedtuple('MatchResultSet', ['match', 'results'])
+MatchReset = namedtuple('MatchReset', ['match'])
+PlayerRegistered = namedtuple('PlayerRegistered', ['tournament', 'player'])
+RoundAdded = namedtuple('RoundAdded', ['tournament', 'round_index', 'round'])
+RoundStarted = namedtuple('RoundStarted', ['tournament', 'round_index', 'round'])
+RoundEnded = namedtuple('RoundEnded', ['tournament', 'round_index', 'round'])
+ResultRecorded = namedtuple('ResultRecorded', ['tournament', 'round_index', 'match_index', 'match'])
+TournamentChanged = namedtuple('TournamentChanged', ['tournament'])
+
+
+class EventBus:
+    """
+    Bus d'événements synchrone : les abonnés d'un type d'événement sont appelés dans l'ordre d'abonnement.
+
+    Un événement sans abonné ne coûte qu'une recherche dans un dictionnaire.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+
+    def subscribe(self, event_type, handler):
+        """Abonne une fonction, appelée avec l'événement, à un type d'événement."""
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type, handler):
+        """Désabonne une fonction ; sans effet si elle n'était pas abonnée."""
+        handlers = self.handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def publish(self, event):
+        """Transmet un événement à ses abonnés."""
+        handlers = self.handlers.get(type(event))
+        if handlers:
+            for handler in tuple(handlers):  # Un abonné peut se désabonner pendant la diffusion
+                handler(event)
+
+
+# Bus partagé par tous les modèles
+bus = EventBus()
@@ -0,0 +1,135 @@
+# models/game_index.py
+
+from collections import namedtuple
+from models.events import bus, MatchAdded, RoundAdded
+
+
+# Emplacement d'une partie : tournoi, position du round et numéro d'échiquier (à partir de 0)
+GameRef = namedtuple('GameRef', ['t_id', 'round_index', 'board_index'])
+
+# Partie vue par un joueur : emplacement, adversaire et match (dont les résultats sont lus à la demande)
+PlayerGame = namedtuple('PlayerGame', ['ref', 'opponent_id', 'match'])
+
+# Match d'un tournoi archivé, lu dans ses enregistrements sans construire les objets du modèle ; il expose
+# les attributs de Match utilisés par l'index et les vues (players[i].unique_id, results, is_complete)
+ArchivedMatch = namedtuple('ArchivedMatch', ['players', 'results', 'is_complete'])
+PlayerRef = namedtuple('PlayerRef', ['unique_id'])
+
+
+class GameIndex:
+    """
+    Index secondaire des parties de tous les tournois, par unique_id de joueur.
+
+    L'index est construit au chargement puis tenu à jour par les événements MatchAdded. Il référence les
+    objets Match eux-mêmes : un résultat saisi avec Match.set_results y est donc visible immédiatement. Les
+    parties des tournois archivés, immuables, sont lues dans leurs enregistrements (ArchivedMatch).
+    """
+
+    def __init__(self, tournaments=()):
+        self.tournaments = tournaments
+        self.games = {}
+        self._tournaments_by_id = {}
+        self._round_refs = {}  # id(round) -> (round, t_id, position) ; le round est gardé pour valider l'id
+        self._round_ids = {}  # t_id -> id des rounds enregistrés, pour retirer ceux qui ont été remplacés
+        for tournament in tournaments:
+            self.add_tournament(tournament)
+        bus.subscribe(MatchAdded, self.match_added)
+        bus.subscribe(RoundAdded, self.round_added)
+
+    def close(self):
+        """Cesse de suivre les ajouts de rounds et de matches."""
+        bus.unsubscribe(MatchAdded, self.match_added)
+        bus.unsubscribe(RoundAdded, self.round_added)
+
+    def add_tournament(self, tournament):
+        """Indexe toutes les parties d'un tournoi ; un tournoi archivé est lu sans construire ses rounds."""
+        self._tournaments_by_id[tournament.t_id] = tournament
+        if getattr(tournament, 'archived', False):
+            ids = [PlayerRef(unique_id) for unique_id in tournament.player_ids()]
+            for round_index, board_index, first, second, score1, score2, complete in tournament.iter_match_records():
+                self._add(GameRef(tournament.t_id, round_index, board_index),
+                          ArchivedMatch((ids[first], ids[second]), (score1, score2), bool(complete)))
+            return
+        self._register_rounds(tournament)
+        for round_index, rnd in enumerate(tournament.rounds):
+            for board_index, match in enumerate(rnd.matches):
+                self._add(GameRef(tournament.t_id, round_index, board_index), match)
+
+    def _add(self, ref, match):
+        first, second = match.players
+        self.games.setdefault(first.unique_id, []).append(PlayerGame(ref, second.unique_id, match))
+        self.games.setdefault(second.unique_id, []).append(PlayerGame(ref, first.unique_id, match))
+
+    def _remove(self, match):
+        for player in match.players:
+            games = self.games.get(player.unique_id, [])
+            games[:] = [game for game in games if game.match is not match]
+
+    def _register_rounds(self, tournament):
+        """Enregistre la position des rounds d'un tournoi ; ceux qu'il ne contient plus sont oubliés."""
+        current = {id(rnd) for rnd in tournament.rounds}
+        for key in self._round_ids.pop(tournament.t_id, ()):
+            entry = self._round_refs.pop(key, None)
+            if entry is not None and key not in current:
+                for match in entry[0].matches:
+                    self._remove(match)
+        self._round_ids[tournament.t_id] = [id(rnd) for rnd in tournament.rounds]
+        for round_index, rnd in enumerate(tournament.rounds):
+            self._round_refs[id(rnd)] = (rnd, tournament.t_id, round_index)
+
+    def _locate_round(self, rnd):
+        """
+        Retrouve le tournoi et la position d'un round, y compris s'il a été créé après l'indexation ou si les
+        rounds du tournoi ont été remplacés (Tournament.initialize_rounds).
+        """
+        entry = self._round_refs.get(id(rnd))
+        if entry is not None and entry[0] is rnd:
+            tournament = self._tournaments_by_id.get(entry[1])
+            rounds = tournament.rounds if tournament is not None else ()
+            if entry[2] < len(rounds) and rounds[entry[2]] is rnd:
+                return entry[1], entry[2]
+        for tournament in self.tournaments:
+            if any(candidate is rnd for candidate in tournament.rounds):
+                self._tournaments_by_id[tournament.t_id] = tournament
+                self._register_rounds(tournament)
+                return self._round_refs[id(rnd)][1:]
+        return None
+
+    def round_added(self, event):
+        """Enregistre la position d'un round ajouté par Tournament.add_round."""
+        self._tournaments_by_id.setdefault(event.tournament.t_id, event.tournament)
+        self._register_rounds(event.tournament)
+
+    def match_added(self, event):
+        """Indexe un match ajouté à un round."""
+        rnd = event.round
+        location = self._locate_round(rnd)
+        if location is not None:
+            self._add(GameRef(location[0], location[1], len(rnd.matches) - 1), event.match)
+
+    def tournament(self, t_id):
+        """Retourne le tournoi correspondant à un identifiant."""
+        return self._tournaments_by_id.get(t_id)
+
+    def games_of(self, unique_id):
+        """Retourne toutes les parties d'un joueur, tous tournois confondus."""
+        return self.games.get(unique_id, [])
+
+    def head_to_head(self, unique_id, opponent_id):
+        """
+        Retourne le bilan des parties jouées entre deux joueurs.
+
+        Retourne :
+        - dict : Parties, victoires, nulles et défaites du premier joueur, et liste des parties.
+        """
+        games = [game for game in self.games_of(unique_id) if game.opponent_id == opponent_id]
+        summary = {'games': games, 'wins': 0, 'draws': 0, 'losses': 0}
+        for game in games:
+            if not (game.match.is_complete or sum(game.match.results) > 0):
+                continue
+            results = game.match.results
+            if game.match.players[0].unique_id != unique_id:
+                results = results[::-1]
+            own, other = results
+            summary['wins' if own > other else 'losses' if own < other else 'draws'] += 1
+        return summary
@@ -2,21 +2,25 @@
 
 from typing import Tuple
 from .player import Player
+from .events import bus, MatchResultSet, MatchReset
 
 
 class Match:
     """Représentation d'un match entre deux joueurs."""
-    def __init__(self, players: Tuple[Player, Player], results: Tuple[float, float] = (0, 0)):
+    def __init__(self, players: Tuple[Player, Player], results: Tuple[float, float] = (0, 0),
+                 is_complete: bool = False):
         self.players = players
         self.results = results  # Tuple de la forme (score_joueur_1, score_joueur_2)
-        self.is_complete = False
+        self.is_complete = is_complete
+        self.tournament = None  # Tournoi propriétaire, renseigné lorsque le match y est rattaché
 
     def to_dict(self):
         """Sérialise l'objet Match pour la sauvegarde en JSON."""
         # Stockage par unique_id pour cohérence avec les données enregistrées
         return {
             'players': [player.unique_id for player in self.players],
-            'results': self.results
+            'results': self.results,
+            'is_complete': self.is_complete
         }
 
     def display_match(self):
@@ -50,6 +54,7 @@ class Match:
 
         self.results = (score1, score2)
         self.is_complete = True
+        bus.publish(MatchResultSet(self, self.results))
 
     def get_winner(self):
         """
@@ -79,4 +84,5 @@ class Match:
 
         self.results = (0, 0)
         self.is_complete = False
+        bus.publish(MatchReset(self))
         print("Match réinitialisé avec succès.")
@@ -0,0 +1,111 @@
+# models/opponent_history.py
+
+
+class OpponentHistory:
+    """
+    Historique des rencontres d'un tournoi, stocké dans une matrice de bits.
+
+    Chaque joueur occupe une position (slot) ; le bit j de la ligne i indique que les joueurs i et j se
+    sont déjà rencontrés. La matrice occupe n²/8 octets et chaque test de revanche est en O(1).
+    """
+
+    def __init__(self, player_ids=()):
+        self.slots = {}
+        self.ids = []
+        self.capacity = 0
+        self.stride = 0  # Octets par ligne
+        self.bits = bytearray()
+        for unique_id in player_ids:
+            self.add_player(unique_id)
+
+    @classmethod
+    def from_rounds(cls, players, rounds):
+        """Construit l'historique à partir des joueurs inscrits puis des matches des rounds."""
+        history = cls(player.unique_id for player in players)
+        for rnd in rounds:
+            for match in rnd.matches:
+                history.record(match.players[0].unique_id, match.players[1].unique_id)
+        return history
+
+    def _grow(self, capacity):
+        stride = capacity // 8
+        bits = bytearray(stride * capacity)
+        for slot in range(len(self.ids)):
+            bits[slot * stride:slot * stride + self.stride] = self.bits[slot * self.stride:(slot + 1) * self.stride]
+        self.capacity, self.stride, self.bits = capacity, stride, bits
+
+    def add_player(self, unique_id):
+        """Attribue une position au joueur s'il n'en a pas encore et la retourne."""
+        slot = self.slots.get(unique_id)
+        if slot is None:
+            slot = len(self.ids)
+            if slot >= self.capacity:
+                self._grow(max(8, self.capacity * 2))
+            self.slots[unique_id] = slot
+            self.ids.append(unique_id)
+        return slot
+
+    def record(self, first_id, second_id):
+        """Enregistre une rencontre entre deux joueurs."""
+        first = self.add_player(first_id)
+        second = self.add_player(second_id)
+        self.bits[first * self.stride + (second >> 3)] |= 1 << (second & 7)
+        self.bits[second * self.stride + (first >> 3)] |= 1 << (first & 7)
+
+    def has_played(self, first_id, second_id):
+        """Indique si deux joueurs se sont déjà rencontrés dans ce tournoi."""
+        first = self.slots.get(first_id)
+        second = self.slots.get(second_id)
+        if first is None or second is None:
+            return False
+        return bool(self.bits[first * self.stride + (second >> 3)] >> (second & 7) & 1)
+
+    def row_mask(self, unique_id):
+        """Retourne les adversaires d'un joueur sous forme d'entier : bit j = position j rencontrée."""
+        slot = self.slots.get(unique_id)
+        if slot is None:
+            return 0
+        return int.from_bytes(self.bits[slot * self.stride:(slot + 1) * self.stride], 'little')
+
+    def opponents_of(self, unique_id):
+        """Retourne les identifiants des adversaires déjà rencontrés par un joueur."""
+        mask = self.row_mask(unique_id)
+        return [self.ids[slot] for slot in range(len(self.ids)) if mask >> slot & 1]
+
+    def masks(self, player_ids):
+        """
+        Retourne, pour chaque joueur de 'player_ids', le masque de ses adversaires exprimé dans les
+        positions de cette même liste.
+        """
+        if self.ids[:len(player_ids)] == list(player_ids):
+            keep = (1 << len(player_ids)) - 1
+            return [self.row_mask(unique_id) & keep for unique_id in player_ids]
+        positions = {unique_id: index for index, unique_id in enumerate(player_ids)}
+        masks = []
+        for unique_id in player_ids:
+            mask = 0
+            for opponent_id in self.opponents_of(unique_id):
+                if opponent_id in positions:
+                    mask |= 1 << positions[opponent_id]
+            masks.append(mask)
+        return masks
+
+    def eligible_opponents(self, group_ids):
+        """
+        Retourne, pour chaque joueur d'un groupe de score, les membres du groupe qu'il n'a pas encore
+        rencontrés. Le groupe est converti une fois en masque puis comparé ligne à ligne.
+
+        Retourne :
+        - dict : Liste des adversaires possibles par unique_id, dans l'ordre du groupe.
+        """
+        group_mask = 0
+        for unique_id in group_ids:
+            group_mask |= 1 << self.add_player(unique_id)
+        eligible = {}
+        for unique_id in group_ids:
+            mask = group_mask & ~self.row_mask(unique_id) & ~(1 << self.slots[unique_id])
+            eligible[unique_id] = [other for other in group_ids if mask >> self.slots[other] & 1]
+        return eligible
+
+    def __len__(self):
+        return len(self.ids)
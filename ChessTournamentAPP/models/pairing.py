@@ -0,0 +1,288 @@
+# models/pairing.py
+
+import os
+import random
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from models.events import PlayerRegistered
+from models.match import Match
+from models.round import Round
+
+
+def pair_players(scores, history, seed=None):
+    """
+    Apparie les joueurs d'un round à partir de données compactes, sans objet du modèle.
+
+    Les joueurs sont mélangés puis classés par score décroissant : chacun, dans l'ordre, affronte le premier
+    joueur restant qu'il n'a pas encore rencontré. Si tous les joueurs restants sont d'anciens adversaires,
+    il affronte le premier d'entre eux plutôt que de rester sans match.
+
+    Paramètres :
+    - scores (sequence) : Score de chaque joueur, indexé par sa position.
+    - history (sequence) : Pour chaque joueur, masque de bits des positions des adversaires déjà rencontrés.
+    - seed : Graine du mélange, pour des appariements reproductibles.
+
+    Retourne :
+    - list : Couples de positions (joueur 1, joueur 2). Un joueur restant (nombre impair) est exempt.
+    """
+    order = list(range(len(scores)))
+    random.Random(seed).shuffle(order)
+    order.sort(key=lambda index: scores[index], reverse=True)  # Tri stable : mélange conservé à score égal
+    pairs = []
+    while len(order) > 1:
+        first = order.pop(0)
+        opponent = next((index for index in order if not history[first] >> index & 1), order[0])
+        order.remove(opponent)
+        pairs.append((first, opponent))
+    return pairs
+
+
+def _round_to_pair_index(tournament):
+    """Position du premier round sans match, len(rounds) si un round peut être créé, sinon None."""
+    for index, rnd in enumerate(tournament.rounds):
+        if not rnd.matches and not rnd.is_complete:
+            return index
+    return len(tournament.rounds) if len(tournament.rounds) < tournament.total_round else None
+
+
+def pairing_obstacle(tournament):
+    """
+    Indique, sans modifier le tournoi, ce qui empêche d'apparier son prochain round.
+
+    Les appariements reposent sur les scores : tous les rounds précédents doivent être terminés.
+
+    Retourne :
+    - str : La raison, ou None si le prochain round peut être apparié.
+    """
+    if getattr(tournament, 'archived', False):
+        return "le tournoi est archivé"
+    if len(tournament.registered_players) < 2:
+        return "moins de deux joueurs sont inscrits"
+    index = _round_to_pair_index(tournament)
+    if index is None:
+        return "il n'y a plus de round à apparier"
+    unfinished = next((rnd for rnd in tournament.rounds[:index] if not rnd.is_complete), None)
+    if unfinished is not None:
+        return f"le round '{unfinished.name}' n'est pas terminé"
+    return None
+
+
+def next_round_to_pair(tournament):
+    """
+    Retourne le premier round sans match du tournoi, en le créant si le nombre de rounds le permet.
+
+    À n'appeler qu'après avoir vérifié avec pairing_obstacle que le tournoi peut être apparié.
+    """
+    index = _round_to_pair_index(tournament)
+    if index is None:
+        return None
+    if index == len(tournament.rounds):
+        tournament.rounds.append(tournament.attach_round(Round(name=f"Round {index + 1}")))
+    return tournament.rounds[index]
+
+
+def build_payload(tournament, seed=None):
+    """
+    Résume un tournoi en données compactes pour l'appariement : identifiants, scores et historique
+    des rencontres sous forme d'un masque de bits par joueur.
+    """
+    ids = tuple(player.unique_id for player in tournament.registered_players)
+    points = tournament.calculate_player_points()
+    return (tournament.t_id, ids, tuple(points.get(unique_id, 0) for unique_id in ids),
+            tuple(tournament.opponents.masks(ids)), seed)
+
+
+def pair_payload(payload):
+    """Apparie un tournoi résumé par build_payload ; exécutée dans un processus de travail."""
+    t_id, ids, scores, history, seed = payload
+    return t_id, pair_players(scores, history, seed if seed is None else f"{seed}:{t_id}")
+
+
+def pair_tournaments(tournaments, max_workers=None, seed=None):
+    """
+    Apparie le prochain round de plusieurs tournois en répartissant le travail sur des processus.
+
+    Seules des données compactes circulent entre processus ; les matches obtenus sont ensuite créés
+    dans les rounds des tournois d'origine.
+
+    Paramètres :
+    - tournaments (list) : Tournois à apparier. Ceux que pairing_obstacle signale (archivés, sans round
+      disponible, round précédent non terminé, moins de deux joueurs) sont ignorés, sans être modifiés.
+    - max_workers (int) : Nombre de processus ; 1 apparie dans le processus courant.
+    - seed : Graine commune, déclinée par tournoi.
+
+    Retourne :
+    - dict : Nombre de matches créés par identifiant de tournoi.
+    """
+    targets = {}
+    for tournament in tournaments:
+        if pairing_obstacle(tournament) is None:
+            targets[tournament.t_id] = (tournament, next_round_to_pair(tournament))
+    payloads = [build_payload(tournament, seed) for tournament, _ in targets.values()]
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(payloads) < 2:
+        results = map(pair_payload, payloads)
+    else:
+        chunksize = max(1, len(payloads) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(pair_payload, payloads, chunksize=chunksize))
+
+    created = {}
+    for t_id, pairs in results:
+        tournament, rnd = targets[t_id]
+        _create_matches(tournament, rnd, tournament.registered_players, pairs)
+        created[t_id] = len(pairs)
+    return created
+
+
+def _create_matches(tournament, rnd, players, pairs):
+    """Crée dans 'rnd' les matches des couples de positions 'pairs' et les inscrit dans les historiques."""
+    for first, second in pairs:
+        rnd.append_match(Match(players=(players[first], players[second])))
+        tournament.opponents.record(players[first].unique_id, players[second].unique_id)
+        players[first].add_past_opponent(players[second].unique_id)
+        players[second].add_past_opponent(players[first].unique_id)
+    tournament.touch()
+
+
+# État d'un tournoi figé pour les aperçus d'appariement : uniquement des tuples, partageables entre processus.
+# Les retardataires (late_entrants) sont placés après les inscrits, avec un score nul et sans adversaire.
+PairingSnapshot = namedtuple('PairingSnapshot', ['t_id', 'version', 'ids', 'scores', 'ratings', 'history',
+                                                 'late_entrants'])
+
+# Variante d'appariement : nom affiché, accélération (point virtuel pour la moitié la mieux classée),
+# prise en compte des retardataires et graine du mélange
+PairingVariant = namedtuple('PairingVariant', ['name', 'accelerated', 'with_late_entrants', 'seed'])
+
+# Aperçu : variante, version du tournoi au moment de l'instantané, couples de positions et indicateurs
+PairingPreview = namedtuple('PairingPreview', ['variant', 'version', 'ids', 'pairs', 'metrics'])
+
+
+def take_snapshot(tournament, late_entrants=()):
+    """
+    Fige l'état d'un tournoi utile à l'appariement, sans le modifier.
+
+    Paramètres :
+    - tournament (Tournament) : Tournoi à apparier.
+    - late_entrants (list) : Joueurs non inscrits à ajouter dans les variantes qui le demandent.
+    """
+    ids = tuple(player.unique_id for player in tournament.registered_players)
+    points = tournament.calculate_player_points()
+    registered = set(ids)
+    late = tuple(player for player in late_entrants if player.unique_id not in registered)
+    return PairingSnapshot(tournament.t_id, tournament.version, ids + tuple(p.unique_id for p in late),
+                           tuple(points.get(unique_id, 0) for unique_id in ids) + (0,) * len(late),
+                           tuple(player.rating for player in tournament.registered_players + list(late)),
+                           tuple(tournament.opponents.masks(ids)) + (0,) * len(late),
+                           tuple(p.unique_id for p in late))
+
+
+def evaluate_variant(snapshot, variant):
+    """
+    Apparie un instantané selon une variante et mesure la qualité du résultat ; sans effet de bord,
+    exécutée dans un processus de travail.
+
+    Indicateurs : revanches, écarts moyen et maximal de points entre adversaires, écart moyen de
+    classement Elo, et joueur exempt éventuel.
+    """
+    count = len(snapshot.ids) - (0 if variant.with_late_entrants else len(snapshot.late_entrants))
+    scores = list(snapshot.scores[:count])
+    if variant.accelerated:
+        # Accélération : la moitié la mieux classée reçoit un point virtuel pour l'appariement seulement
+        by_rating = sorted(range(count), key=lambda index: snapshot.ratings[index], reverse=True)
+        for index in by_rating[:count // 2]:
+            scores[index] += 1
+    pairs = pair_players(scores, snapshot.history[:count], variant.seed)
+    paired = {index for pair in pairs for index in pair}
+    score_gaps = [abs(snapshot.scores[first] - snapshot.scores[second]) for first, second in pairs]
+    rating_gaps = [abs(snapshot.ratings[first] - snapshot.ratings[second]) for first, second in pairs]
+    metrics = {
+        'rematches': sum(1 for first, second in pairs if snapshot.history[first] >> second & 1),
+        'mean_score_gap': sum(score_gaps) / len(pairs) if pairs else 0,
+        'max_score_gap': max(score_gaps, default=0),
+        'mean_rating_gap': sum(rating_gaps) / len(pairs) if pairs else 0,
+        'bye': next((snapshot.ids[index] for index in range(count) if index not in paired), None),
+    }
+    return PairingPreview(variant, snapshot.version, snapshot.ids[:count], tuple(pairs), metrics)
+
+
+def _evaluate_payload(payload):
+    return evaluate_variant(*payload)
+
+
+def preview_pairings(tournament, variants, late_entrants=(), max_workers=None):
+    """
+    Évalue plusieurs variantes d'appariement du prochain round, en parallèle, sans modifier le tournoi.
+
+    Paramètres :
+    - tournament (Tournament) : Tournoi à apparier.
+    - variants (list) : Variantes (PairingVariant) à comparer.
+    - late_entrants (list) : Joueurs non inscrits, ajoutés aux variantes 'with_late_entrants'.
+    - max_workers (int) : Nombre de processus ; 1 évalue dans le processus courant.
+
+    Retourne :
+    - list : Un aperçu (PairingPreview) par variante, dans l'ordre des variantes.
+    """
+    snapshot = take_snapshot(tournament, late_entrants)
+    payloads = [(snapshot, variant) for variant in variants]
+    max_workers = min(max_workers or os.cpu_count() or 1, len(payloads))
+    if max_workers <= 1:
+        return [_evaluate_payload(payload) for payload in payloads]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_evaluate_payload, payloads))
+
+
+def commit_preview(tournament, preview, late_entrants=()):
+    """
+    Applique au tournoi les appariements d'un aperçu, en une fois.
+
+    Toutes les vérifications précèdent la première modification : le tournoi est modifié entièrement
+    ou pas du tout.
+
+    Les retardataires de l'aperçu sont inscrits sans passer par Tournament.register_player, qui refuse toute
+    inscription une fois le premier round commencé : c'est précisément le cas qu'ils couvrent. Seule cette
+    règle est contournée ; le tournoi doit toujours être actif (Tournament.is_active).
+
+    Paramètres :
+    - tournament (Tournament) : Tournoi de l'aperçu.
+    - preview (PairingPreview) : Aperçu choisi.
+    - late_entrants (list) : Joueurs fournis à preview_pairings ; ceux de l'aperçu sont inscrits.
+
+    Retourne :
+    - Round : Le round apparié.
+
+    Lève :
+    - ValueError : Si le tournoi a été modifié depuis l'aperçu, si le prochain round ne peut pas être apparié
+      (voir pairing_obstacle), si l'aperçu ne contient aucun match, ou s'il inscrit des retardataires dans un
+      tournoi qui n'est plus actif.
+    """
+    if tournament.version != preview.version:
+        raise ValueError(f"Le tournoi '{tournament.name}' a été modifié depuis l'aperçu ; "
+                         "relancez la comparaison des appariements.")
+    obstacle = pairing_obstacle(tournament)
+    if obstacle is not None:
+        raise ValueError(f"Appariement impossible pour le tournoi '{tournament.name}' : {obstacle}.")
+    if not preview.pairs:
+        raise ValueError(f"L'aperçu '{preview.variant.name}' ne contient aucun match : aucun round n'est créé.")
+    late = {player.unique_id: player for player in late_entrants}
+    registered = {player.unique_id: player for player in tournament.registered_players}
+    missing = [unique_id for unique_id in preview.ids if unique_id not in registered and unique_id not in late]
+    if missing:
+        raise ValueError(f"Joueurs de l'aperçu introuvables : {', '.join(missing)}")
+    if any(unique_id not in registered for unique_id in preview.ids) and not tournament.is_active():
+        raise ValueError(f"Le tournoi '{tournament.name}' n'est pas actif : les retardataires ne peuvent pas "
+                         "être inscrits.")
+
+    for unique_id in preview.ids:
+        if unique_id not in registered:
+            # Retardataire : inscription directe, volontairement hors de register_player qui la refuserait une
+            # fois le premier round commencé (le tournoi est actif, vérifié ci-dessus)
+            player = late[unique_id]
+            tournament.registered_players.append(player)
+            tournament.opponents.add_player(unique_id)
+            tournament.emit(PlayerRegistered(tournament, player))
+            registered[unique_id] = player
+    rnd = next_round_to_pair(tournament)
+    _create_matches(tournament, rnd, [registered[unique_id] for unique_id in preview.ids], preview.pairs)
+    return rnd
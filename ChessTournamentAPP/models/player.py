@@ -1,23 +1,48 @@
 # models/player.py
 import re
 from datetime import datetime
+from .rating import DEFAULT_RATING
 
 
 class Player:
     """Création de joueurs"""
-    def __init__(self, name: str, firstname: str, birthdate: str, unique_id: str, past_opponents=None):
+    def __init__(self, name: str, firstname: str, birthdate: str, unique_id: str, past_opponents=None,
+                 rating: float = DEFAULT_RATING, rated_games: int = 0):
         """
         Initialise un nouvel objet Player avec les données de base du joueur.
         - name: Nom de famille du joueur
         - firstname: Prénom du joueur
         - birthdate: Date de naissance du joueur
         - unique_id: Identifiant unique du joueur
+        - rating: Classement Elo du joueur
+        - rated_games: Nombre de parties prises en compte dans le classement
         """
         self.name = name
         self.firstname = firstname
         self.birthdate = self.validate_birthdate(birthdate)
         self.unique_id = self.validate_unique_id(unique_id)
         self.past_opponents = set(past_opponents) if past_opponents else set()
+        self.rating = rating
+        self.rated_games = rated_games
+
+    @classmethod
+    def from_trusted_data(cls, data):
+        """
+        Reconstruit un joueur à partir de données déjà validées, sauvegardées par l'application.
+
+        Les validations de __init__ (expression régulière, date dans le passé) ne sont pas rejouées, et la
+        date de naissance est lue sans strptime.
+        """
+        player = cls.__new__(cls)
+        player.name = data['name']
+        player.firstname = data['firstname']
+        day, month, year = data['birthdate'].split('/')
+        player.birthdate = datetime(int(year), int(month), int(day))
+        player.unique_id = data['unique_id']
+        player.past_opponents = set(data.get('past_opponents') or ())
+        player.rating = data.get('rating', DEFAULT_RATING)
+        player.rated_games = data.get('rated_games', 0)
+        return player
 
     def validate_birthdate(self, birthdate_str):
         """ Valide et convertit la date de naissance fournie en format DD/MM/YYYY """
@@ -42,7 +67,9 @@ class Player:
             "firstname": self.firstname,
             "birthdate": self.birthdate.strftime("%d/%m/%Y"),
             "unique_id": self.unique_id,
-            "past_opponents": list(self.past_opponents)
+            "past_opponents": list(self.past_opponents),
+            "rating": round(self.rating, 2),
+            "rated_games": self.rated_games
         }
 
     # Utilise cette méthode pour ajouter un adversaire à l'ensemble après chaque match
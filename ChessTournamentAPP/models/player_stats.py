@@ -0,0 +1,169 @@
+# models/player_stats.py
+
+from models.events import bus, MatchReset, ResultRecorded, RoundEnded, TournamentChanged
+
+
+class PlayerStats:
+    """Bilan d'un joueur : parties jouées, victoires, nulles, défaites, points et classements des adversaires."""
+    __slots__ = ('games', 'wins', 'draws', 'losses', 'points', 'opponent_ratings')
+
+    def __init__(self):
+        self.games = self.wins = self.draws = self.losses = 0
+        self.points = 0.0
+        self.opponent_ratings = 0.0  # Somme des classements Elo des adversaires
+
+    def record(self, score, opponent_score, opponent_rating, sign=1):
+        """Ajoute une partie au bilan (ou la retire avec sign=-1)."""
+        self.games += sign
+        if score > opponent_score:
+            self.wins += sign
+        elif score < opponent_score:
+            self.losses += sign
+        else:
+            self.draws += sign
+        self.points += sign * score
+        self.opponent_ratings += sign * opponent_rating
+
+    def add(self, other, sign=1):
+        """Ajoute le bilan 'other' à celui-ci (ou le retire avec sign=-1)."""
+        self.games += sign * other.games
+        self.wins += sign * other.wins
+        self.draws += sign * other.draws
+        self.losses += sign * other.losses
+        self.points += sign * other.points
+        self.opponent_ratings += sign * other.opponent_ratings
+
+    @property
+    def score_percentage(self):
+        """Pourcentage des points obtenus sur les points possibles, None sans partie jouée."""
+        return 100 * self.points / self.games if self.games else None
+
+    @property
+    def performance(self):
+        """Performance Elo (règle des 400 points) : moyenne des adversaires + 400 × (gains - pertes) / parties."""
+        if not self.games:
+            return None
+        return (self.opponent_ratings + 400 * (self.wins - self.losses)) / self.games
+
+
+def _is_played(rnd, match):
+    return rnd.is_complete or match.is_complete or sum(match.results) > 0
+
+
+def _record_match(table, match):
+    first, second = match.players
+    score1, score2 = match.results
+    _stats(table, first.unique_id).record(score1, score2, second.rating)
+    _stats(table, second.unique_id).record(score2, score1, first.rating)
+
+
+def _stats(table, unique_id):
+    stats = table.get(unique_id)
+    if stats is None:
+        stats = table[unique_id] = PlayerStats()
+    return stats
+
+
+def tournament_stats(tournament):
+    """
+    Calcule le bilan de chaque joueur d'un tournoi en un seul parcours de ses matches joués.
+
+    Un tournoi archivé est parcouru directement dans ses enregistrements, sans construire ses rounds.
+
+    Retourne :
+    - dict : unique_id -> PlayerStats.
+    """
+    table = {}
+    if getattr(tournament, 'archived', False):
+        ids, ratings = tournament.player_ids(), tournament.player_ratings()
+        for _, _, first, second, score1, score2, _ in tournament.iter_match_records():
+            _stats(table, ids[first]).record(score1, score2, ratings[second])
+            _stats(table, ids[second]).record(score2, score1, ratings[first])
+        return table
+    for rnd in tournament.rounds:
+        for match in rnd.matches:
+            if _is_played(rnd, match):
+                _record_match(table, match)
+    return table
+
+
+class StatsTable:
+    """
+    Bilans des joueurs par tournoi et tous tournois confondus.
+
+    Les bilans sont calculés en un parcours au chargement, puis tenus à jour par les événements : un
+    résultat enregistré (ResultRecorded) est ajouté aux deux niveaux ; un tournoi modifié autrement (fin de
+    round et nouveaux classements, édition, appariement) est recalculé seul. Une remise à zéro de match,
+    qui ne désigne pas son tournoi, fait recalculer l'ensemble à la lecture suivante.
+    """
+
+    def __init__(self, tournaments):
+        self.tournaments = tournaments
+        self.by_tournament = {}
+        self.totals = {}
+        self.stale = False
+        self._rebuild()
+        bus.subscribe(ResultRecorded, self.result_recorded)
+        for event_type in (RoundEnded, TournamentChanged):
+            bus.subscribe(event_type, self.tournament_changed)
+        bus.subscribe(MatchReset, self.match_reset)
+
+    def close(self):
+        """Cesse de suivre les modifications des tournois."""
+        bus.unsubscribe(ResultRecorded, self.result_recorded)
+        for event_type in (RoundEnded, TournamentChanged):
+            bus.unsubscribe(event_type, self.tournament_changed)
+        bus.unsubscribe(MatchReset, self.match_reset)
+
+    def _rebuild(self):
+        self.by_tournament.clear()
+        self.totals.clear()
+        for tournament in self.tournaments:
+            self._add_tournament(tournament)
+        self.stale = False
+
+    def _add_tournament(self, tournament):
+        table = tournament_stats(tournament)
+        self.by_tournament[tournament.t_id] = table
+        for unique_id, stats in table.items():
+            _stats(self.totals, unique_id).add(stats)
+        return table
+
+    def _remove_tournament(self, t_id):
+        for unique_id, stats in self.by_tournament.pop(t_id, {}).items():
+            self.totals[unique_id].add(stats, sign=-1)
+
+    def result_recorded(self, event):
+        """Ajoute un résultat enregistré au bilan du tournoi et au bilan général des deux joueurs."""
+        if event.tournament.t_id not in self.by_tournament:
+            self._add_tournament(event.tournament)  # Le parcours inclut déjà ce résultat
+            return
+        _record_match(self.by_tournament[event.tournament.t_id], event.match)
+        _record_match(self.totals, event.match)
+
+    def tournament_changed(self, event):
+        """Recalcule les bilans d'un tournoi modifié."""
+        self._remove_tournament(event.tournament.t_id)
+        self._add_tournament(event.tournament)
+
+    def match_reset(self, event):
+        self.stale = True
+
+    def for_tournament(self, tournament):
+        """Retourne les bilans des joueurs d'un tournoi (unique_id -> PlayerStats)."""
+        if self.stale:
+            self._rebuild()
+        table = self.by_tournament.get(tournament.t_id)
+        return table if table is not None else self._add_tournament(tournament)
+
+    def for_all_players(self):
+        """Retourne les bilans de tous les joueurs, tous tournois confondus (unique_id -> PlayerStats)."""
+        if self.stale:
+            self._rebuild()
+        return self.totals
+
+    def for_player(self, unique_id):
+        """Retourne le bilan d'un joueur tous tournois confondus."""
+        if self.stale:
+            self._rebuild()
+        return self.totals.get(unique_id) or PlayerStats()
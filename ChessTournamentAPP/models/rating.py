@@ -0,0 +1,142 @@
+# models/rating.py
+
+from datetime import datetime
+
+DEFAULT_RATING = 1500
+PROVISIONAL_GAMES = 30    # Parties en dessous desquelles le classement est provisoire
+MASTER_RATING = 2400
+K_PROVISIONAL = 40
+K_STANDARD = 20
+K_MASTER = 10
+
+
+def expected_score(rating, opponent_rating):
+    """Score attendu d'un joueur face à un adversaire selon la formule Elo."""
+    return 1.0 / (1.0 + 10.0 ** ((opponent_rating - rating) / 400.0))
+
+
+def k_factor(rating, rated_games):
+    """Coefficient K : élevé pour un classement provisoire, réduit pour les joueurs les plus forts."""
+    if rated_games < PROVISIONAL_GAMES:
+        return K_PROVISIONAL
+    return K_MASTER if rating >= MASTER_RATING else K_STANDARD
+
+
+def rated_games_of(rnd):
+    """Retourne les matches d'un round qui comptent pour le classement (résultat saisi)."""
+    return [match for match in rnd.matches
+            if (rnd.is_complete or match.is_complete) and sum(match.results) > 0]
+
+
+def rate_round(rnd):
+    """
+    Met à jour les classements des joueurs d'un round terminé.
+
+    Le round forme une période de classement : toutes ses parties sont évaluées avec les classements
+    d'avant le round, puis les variations sont appliquées ensemble.
+
+    Retourne :
+    - dict : Nouveau classement par unique_id des joueurs concernés.
+    """
+    deltas = {}
+    games = {}
+    players = {}
+    for match in rated_games_of(rnd):
+        first, second = match.players
+        expected = expected_score(first.rating, second.rating)
+        for player, score, player_expected in ((first, match.results[0], expected),
+                                               (second, match.results[1], 1.0 - expected)):
+            players[player.unique_id] = player
+            deltas[player.unique_id] = (deltas.get(player.unique_id, 0.0)
+                                        + k_factor(player.rating, player.rated_games) * (score - player_expected))
+            games[player.unique_id] = games.get(player.unique_id, 0) + 1
+    for unique_id, player in players.items():
+        player.rating += deltas[unique_id]
+        player.rated_games += games[unique_id]
+    return {unique_id: player.rating for unique_id, player in players.items()}
+
+
+def _rated_rounds(tournament):
+    """
+    Parcourt les rounds d'un tournoi ayant des parties classées.
+
+    Un tournoi archivé est lu dans ses enregistrements, sans construire ses rounds ni ses joueurs.
+
+    Génère :
+    - tuple : (position du round, début, fin, parties (unique_id 1, unique_id 2, score du joueur 1)).
+    """
+    if getattr(tournament, 'archived', False):
+        ids = tournament.player_ids()
+        games = {}
+        for round_index, _, first, second, score1, score2, _ in tournament.iter_match_records():
+            if score1 + score2 > 0:  # Tous les rounds d'une archive sont terminés
+                games.setdefault(round_index, []).append((ids[first], ids[second], score1))
+        times = tournament.round_records()
+        for round_index in sorted(games):
+            yield round_index, times[round_index][1], times[round_index][2], games[round_index]
+        return
+    for round_index, rnd in enumerate(tournament.rounds):
+        matches = rated_games_of(rnd)
+        if matches:
+            yield (round_index, rnd.start_time, rnd.end_time,
+                   [(match.players[0].unique_id, match.players[1].unique_id, match.results[0]) for match in matches])
+
+
+def _k_factors(np, ratings, rated_games):
+    """Version vectorisée de k_factor."""
+    return np.where(rated_games < PROVISIONAL_GAMES, K_PROVISIONAL,
+                    np.where(ratings >= MASTER_RATING, K_MASTER, K_STANDARD))
+
+
+def recompute_ratings(tournaments, players=()):
+    """
+    Recalcule tous les classements en rejouant l'historique des tournois dans l'ordre chronologique.
+
+    Chaque round terminé est une période de classement, traitée en une seule opération vectorisée.
+    Tous les joueurs repartent de DEFAULT_RATING ; les objets Player de 'players' et des tournois non
+    archivés reçoivent le résultat (les archives, immuables, gardent les classements de leur époque).
+
+    Retourne :
+    - dict : Couple (classement, parties classées) par unique_id.
+    """
+    import numpy as np  # Import différé : NumPy n'est nécessaire qu'au recalcul complet
+
+    periods = []
+    for tournament in tournaments:
+        for round_index, start_time, end_time, games in _rated_rounds(tournament):
+            # Date inconnue (date de début illisible et round sans horaire) : période placée en premier
+            moment = start_time or end_time or tournament.start_date or datetime.min
+            periods.append(((moment, tournament.t_id, round_index), games))
+    periods.sort(key=lambda period: period[0])
+
+    positions = {}
+    firsts, seconds, scores, bounds = [], [], [], [0]
+    for _, games in periods:
+        for first_id, second_id, score in games:
+            firsts.append(positions.setdefault(first_id, len(positions)))
+            seconds.append(positions.setdefault(second_id, len(positions)))
+            scores.append(score)
+        bounds.append(len(scores))
+    firsts = np.array(firsts, dtype=np.int64)
+    seconds = np.array(seconds, dtype=np.int64)
+    scores = np.array(scores, dtype=np.float64)
+
+    ratings = np.full(len(positions), float(DEFAULT_RATING))
+    rated_games = np.zeros(len(positions), dtype=np.int64)
+    for start, end in zip(bounds, bounds[1:]):
+        # Seuls les joueurs de la période sont lus et modifiés : coût proportionnel à ses parties
+        first, second, score = firsts[start:end], seconds[start:end], scores[start:end]
+        k_first = _k_factors(np, ratings[first], rated_games[first])
+        k_second = _k_factors(np, ratings[second], rated_games[second])
+        expected = 1.0 / (1.0 + 10.0 ** ((ratings[second] - ratings[first]) / 400.0))
+        np.add.at(ratings, first, k_first * (score - expected))
+        np.add.at(ratings, second, k_second * (expected - score))
+        np.add.at(rated_games, first, 1)
+        np.add.at(rated_games, second, 1)
+
+    results = {unique_id: (float(ratings[index]), int(rated_games[index])) for unique_id, index in positions.items()}
+    everyone = list(players) + [player for tournament in tournaments if not getattr(tournament, 'archived', False)
+                                for player in tournament.registered_players]
+    for player in everyone:
+        player.rating, player.rated_games = results.get(player.unique_id, (DEFAULT_RATING, 0))
+    return results
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from .match import Match
+from .events import bus, MatchAdded
 
 
 class Round:
@@ -14,6 +15,7 @@ class Round:
         self.matches = matches if matches else []
         self.start_time = self.convert_str_to_datetime(start_time)
         self.end_time = self.convert_str_to_datetime(end_time)   # Modification effectuée
+        self.tournament = None  # Tournoi propriétaire, renseigné par Tournament.attach_round
 
     def convert_str_to_datetime(self, date_str):
         """Convertit une chaîne de caractères en un objet datetime, gère les formats non valides."""
@@ -27,30 +29,45 @@ class Round:
                 return None
         return None
 
-    def add_match(self, player1, player2, current_matches, results=(0, 0)):
-        """Tente d'ajouter un match au round si toutes les conditions sont remplies."""
-        if self.can_add_match(player1, player2, current_matches):
+    def add_match(self, player1, player2, current_matches, results=(0, 0), history=None):
+        """
+        Tente d'ajouter un match au round si toutes les conditions sont remplies.
+        'history' est l'historique des rencontres (OpponentHistory) du tournoi auquel appartient le round.
+        """
+        if self.can_add_match(player1, player2, current_matches, history):
             match = Match(players=(player1, player2), results=results)
-            self.matches.append(match)
-            self.update_match_tracking(current_matches, player1, player2)
+            self.append_match(match)
+            self.update_match_tracking(current_matches, player1, player2, history)
             print(f"Match entre {player1.firstname} {player1.name} et"
                   f"{player2.firstname} {player2.name} ajouté à {self.name}.")
         else:
             print("Match not added to avoid duplicates or because the round is complete.")
 
-    def can_add_match(self, player1, player2, current_matches):
+    def append_match(self, match):
+        """Ajoute un match au round, le rattache au tournoi du round et publie l'événement MatchAdded."""
+        match.tournament = self.tournament
+        self.matches.append(match)
+        bus.publish(MatchAdded(self, match))
+
+    def can_add_match(self, player1, player2, current_matches, history=None):
         """Vérifie si un match peut être ajouté en évitant les doublons et les adversaires passés."""
+        if history is not None:
+            already_played = history.has_played(player1.unique_id, player2.unique_id)
+        else:
+            already_played = player2.unique_id in player1.past_opponents
         return (
             not self.is_complete and
             (player1, player2) not in current_matches and
             (player2, player1) not in current_matches and
-            player2.unique_id not in player1.past_opponents
+            not already_played
         )
 
-    def update_match_tracking(self, current_matches, player1, player2):
+    def update_match_tracking(self, current_matches, player1, player2, history=None):
         """Met à jour le suivi des matches joués et des adversaires rencontrés."""
         current_matches.add((player1, player2))
         current_matches.add((player2, player1))
+        if history is not None:
+            history.record(player1.unique_id, player2.unique_id)
         player1.add_past_opponent(player2.unique_id)
         player2.add_past_opponent(player1.unique_id)
 
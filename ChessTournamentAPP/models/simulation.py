@@ -0,0 +1,220 @@
+# models/simulation.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+
+DRAW_RATE = 0.3            # Proportion de nulles entre deux joueurs de même force
+CHUNK_SIZE = 1000          # Simulations par lot, pour borner la mémoire d'un lot
+PARALLEL_THRESHOLD = 64    # Taille de champ à partir de laquelle les lots sont répartis sur plusieurs processus
+
+
+class SimulationState:
+    """
+    État courant d'un tournoi sous forme de tableaux NumPy : scores, classements Elo, historique des
+    rencontres, matches du round en cours restant à jouer et nombre de rounds encore à apparier.
+    """
+
+    def __init__(self, tournament, ratings=None):
+        ratings = ratings or {}
+        players = tournament.registered_players
+        self.ids = [player.unique_id for player in players]
+        positions = {unique_id: index for index, unique_id in enumerate(self.ids)}
+        points = tournament.calculate_player_points()
+        size = len(self.ids)
+        self.scores = np.array([points.get(unique_id, 0) for unique_id in self.ids], dtype=np.float64)
+        self.ratings = np.array([ratings.get(player.unique_id, player.rating) for player in players],
+                                dtype=np.float64)
+        self.played = np.zeros((size, size), dtype=bool)
+        pending = []
+        paired_rounds = 0
+        for rnd in tournament.rounds:
+            if rnd.matches:
+                paired_rounds += 1
+            for match in rnd.matches:
+                first = positions[match.players[0].unique_id]
+                second = positions[match.players[1].unique_id]
+                self.played[first, second] = self.played[second, first] = True
+                if not (rnd.is_complete or match.is_complete):
+                    pending.append((first, second))
+        self.pending = np.array(pending, dtype=np.int64).reshape(-1, 2)
+        self.remaining_rounds = max(tournament.total_round - paired_rounds, 0)
+
+    def contenders(self):
+        """
+        Retourne les identifiants des joueurs pouvant encore terminer premiers, au moins ex aequo :
+        leur score, augmenté de tous les points restant en jeu pour eux, atteint le meilleur score actuel.
+        """
+        remaining = np.full(len(self.ids), float(self.remaining_rounds))
+        np.add.at(remaining, self.pending.ravel(), 1.0)
+        best = self.scores.max(initial=0.0)
+        return [unique_id for unique_id, reachable in zip(self.ids, self.scores + remaining) if reachable >= best]
+
+
+def outcome_probabilities(rating1, rating2, draw_rate=DRAW_RATE):
+    """
+    Modèle de résultat basé sur l'Elo : probabilités de victoire du joueur 1 et de nulle.
+
+    Le score attendu Elo est conservé ; la probabilité de nulle décroît avec l'écart de force.
+    """
+    expected = 1.0 / (1.0 + 10.0 ** ((rating2 - rating1) / 400.0))
+    draw = draw_rate * 2.0 * np.minimum(expected, 1.0 - expected)
+    return expected - draw / 2.0, draw
+
+
+def play_games(rng, state, first, second):
+    """Tire les résultats de parties (tableaux d'indices) et retourne les points du premier joueur."""
+    win, draw = outcome_probabilities(state.ratings[first], state.ratings[second])
+    draws = rng.random(first.shape)
+    return np.where(draws < win, 1.0, np.where(draws < win + draw, 0.5, 0.0))
+
+
+def pair_round(rng, state, scores, future, played_rounds):
+    """
+    Apparie un round pour chaque simulation selon la règle de l'application : joueurs classés par score
+    (départage aléatoire), chacun affrontant le premier joueur disponible qu'il n'a pas encore rencontré.
+
+    Le cas courant (voisin immédiat jamais rencontré) est traité pour toutes les simulations à la fois ;
+    seules les simulations en conflit parcourent le reste du classement.
+
+    Retourne :
+    - tuple : Deux tableaux (simulations x matches) des joueurs 1 et 2.
+    """
+    sims, size = scores.shape
+    rows = np.arange(sims)
+    order = np.argsort(-scores + rng.random(scores.shape) * 0.25, axis=1, kind='stable')
+    rank = np.empty_like(order)
+    rank[rows[:, None], order] = np.arange(size)
+    available = np.ones((sims, size), dtype=bool)
+    pairs = size // 2
+    firsts = np.empty((sims, pairs), dtype=np.int64)
+    seconds = np.empty((sims, pairs), dtype=np.int64)
+
+    def next_available(position):
+        position = position.copy()
+        while True:
+            clipped = np.minimum(position, size - 1)
+            behind = (position < size) & ~available[rows, clipped]
+            if not behind.any():
+                return clipped
+            position[behind] += 1
+
+    def has_played(player1, player2, subset):
+        result = state.played[player1, player2]
+        for past in range(played_rounds):
+            result |= future[subset, player1, past] == player2
+        return result
+
+    position = np.zeros(sims, dtype=np.int64)
+    for pair in range(pairs):
+        position = next_available(position)
+        player1 = order[rows, position]
+        available[rows, position] = False
+        candidate = next_available(position + 1)
+        conflict = has_played(player1, order[rows, candidate], rows)
+        if conflict.any():
+            subset = rows[conflict]
+            blocked = state.played[player1[subset][:, None], order[subset]]
+            for past in range(played_rounds):
+                opponents = future[subset, player1[subset], past]
+                met = opponents >= 0  # -1 : joueur exempt de ce round
+                blocked[np.arange(len(subset))[met], rank[subset[met], opponents[met]]] = True
+            eligible = available[subset] & ~blocked
+            found = eligible.any(axis=1)
+            candidate[subset[found]] = eligible[found].argmax(axis=1)
+        available[rows, candidate] = False
+        firsts[:, pair] = player1
+        seconds[:, pair] = order[rows, candidate]
+    return firsts, seconds
+
+
+def simulate_chunk(state, sims, seed):
+    """
+    Joue 'sims' fois la fin du tournoi et compte les places finales.
+
+    Retourne :
+    - numpy.ndarray : Matrice (joueur x place) du nombre de simulations.
+    """
+    rng = np.random.default_rng(seed)
+    size = len(state.ids)
+    rows = np.arange(sims)[:, None]
+    scores = np.repeat(state.scores[None, :], sims, axis=0)
+
+    if len(state.pending):
+        first = np.broadcast_to(state.pending[:, 0], (sims, len(state.pending)))
+        second = np.broadcast_to(state.pending[:, 1], (sims, len(state.pending)))
+        points = play_games(rng, state, first, second)
+        scores[rows, first] += points
+        scores[rows, second] += 1.0 - points
+
+    # Adversaire de chaque joueur lors des rounds simulés ; -1 pour le joueur exempt (nombre impair)
+    future = np.full((sims, size, max(state.remaining_rounds, 1)), -1, dtype=np.int32)
+    for played_rounds in range(state.remaining_rounds if size > 1 else 0):
+        first, second = pair_round(rng, state, scores, future, played_rounds)
+        points = play_games(rng, state, first, second)
+        scores[rows, first] += points
+        scores[rows, second] += 1.0 - points
+        future[rows, first, played_rounds] = second
+        future[rows, second, played_rounds] = first
+
+    final_order = np.argsort(-scores + rng.random(scores.shape) * 0.25, axis=1, kind='stable')
+    places = np.broadcast_to(np.arange(size), (sims, size))
+    return np.bincount((final_order * size + places).ravel(), minlength=size * size).reshape(size, size)
+
+
+def _simulate_chunk(args):
+    return simulate_chunk(*args)
+
+
+class SimulationResult:
+    """Distribution des places finales obtenue par simulation."""
+
+    def __init__(self, state, position_counts, simulations):
+        self.ids = state.ids
+        self.current_scores = dict(zip(state.ids, state.scores.tolist()))
+        self.contenders = state.contenders()
+        self.position_counts = position_counts
+        self.simulations = simulations
+
+    def position_probabilities(self):
+        """Retourne la matrice (joueur x place) des probabilités, dans l'ordre de self.ids."""
+        return self.position_counts / max(self.simulations, 1)
+
+    def top_probabilities(self, places=1):
+        """Retourne, par joueur, la probabilité de terminer dans les 'places' premières places."""
+        probabilities = self.position_probabilities()[:, :places].sum(axis=1)
+        return dict(zip(self.ids, probabilities.tolist()))
+
+    def expected_positions(self):
+        """Retourne, par joueur, la place finale moyenne (1 = premier)."""
+        places = np.arange(1, len(self.ids) + 1)
+        return dict(zip(self.ids, (self.position_probabilities() @ places).tolist()))
+
+
+def simulate_tournament(tournament, simulations=10000, ratings=None, seed=None, max_workers=None):
+    """
+    Simule de nombreuses fois la fin d'un tournoi à partir de son état courant.
+
+    Paramètres :
+    - tournament (Tournament) : Tournoi à simuler.
+    - simulations (int) : Nombre de fins de tournoi simulées.
+    - ratings (dict) : Classement Elo par unique_id, à la place de celui des joueurs.
+    - seed (int) : Graine pour des résultats reproductibles.
+    - max_workers (int) : Nombre de processus pour les champs d'au moins PARALLEL_THRESHOLD joueurs.
+
+    Retourne :
+    - SimulationResult : Distribution des places finales.
+    """
+    state = SimulationState(tournament, ratings)
+    sizes = [min(CHUNK_SIZE, simulations - start) for start in range(0, simulations, CHUNK_SIZE)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(state, size, chunk_seed) for size, chunk_seed in zip(sizes, seeds)]
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers > 1 and len(jobs) > 1 and len(state.ids) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            counts = list(executor.map(_simulate_chunk, jobs))
+    else:
+        counts = [simulate_chunk(*job) for job in jobs]
+    total = sum(counts) if counts else np.zeros((len(state.ids), len(state.ids)), dtype=np.int64)
+    return SimulationResult(state, total, simulations)
@@ -4,6 +4,10 @@ from datetime import datetime
 import uuid
 from models.round import Round
 from models.match import Match
+from models.opponent_history import OpponentHistory
+from models.rating import rate_round
+from models.events import (bus, MatchReset, MatchResultSet, PlayerRegistered, RoundAdded, RoundStarted, RoundEnded,
+                           ResultRecorded, TournamentChanged)
 import random
 
 
@@ -22,6 +26,12 @@ class Tournament:
         self.total_round = total_round
         self.start_date = self.safe_strptime(start_date, "%d/%m/%Y")
         self.end_date = self.safe_strptime(end_date, "%d/%m/%Y")
+        # Historique des rencontres propre à ce tournoi
+        self.opponents = OpponentHistory.from_rounds(self.registered_players, self.rounds)
+        # Incrémenté à chaque modification, pour invalider les données dérivées du tournoi
+        self.version = 0
+        for round in self.rounds:
+            self.attach_round(round)
 
     def to_dict(self):
         return {
@@ -37,6 +47,15 @@ class Tournament:
             "total_round": self.total_round
         }
 
+    def emit(self, event):
+        """Compte une modification du tournoi et publie l'événement qui la décrit."""
+        self.version += 1
+        bus.publish(event)
+
+    def touch(self):
+        """Signale une modification faite hors des méthodes du tournoi (édition, appariement, reprise)."""
+        self.emit(TournamentChanged(self))
+
     def safe_strptime(self, date_str, date_format="%Y-%m-%d"):
         """ Essaie de convertir une chaîne en datetime, renvoie None si échec. """
         try:
@@ -45,10 +64,21 @@ class Tournament:
             print(f"Erreur de format de date: {date_str}, attendu {date_format}")
             return None
 
+    def attach_round(self, round):
+        """
+        Rattache un round et ses matches au tournoi : un résultat saisi directement sur un match
+        (Match.set_results) retrouve ainsi son tournoi. Les matches ajoutés ensuite par Round.append_match
+        sont rattachés au même tournoi.
+        """
+        round.tournament = self
+        for match in round.matches:
+            match.tournament = self
+        return round
+
     def initialize_rounds(self):
         num_players = len(self.registered_players)
         number_of_rounds = num_players - 1 if num_players % 2 == 0 else num_players
-        self.rounds = [Round(name=f"Round {i + 1}") for i in range(number_of_rounds)]
+        self.rounds = [self.attach_round(Round(name=f"Round {i + 1}")) for i in range(number_of_rounds)]
         self.total_round = number_of_rounds
 
     def start_tournament(self):
@@ -65,8 +95,10 @@ class Tournament:
         self.total_round = num_players - 1 if num_players % 2 == 0 else num_players
         self.initialize_rounds()
         self.generate_matches()
+        self.touch()
         if self.rounds:
             self.rounds[0].start_time = datetime.now()
+            self.emit(RoundStarted(self, 0, self.rounds[0]))
             print(f"Le Tournoi '{self.name}' a commencé avec {len(self.registered_players)}"
                   f"joueurs et {self.total_round} rounds.")
         else:
@@ -90,21 +122,25 @@ class Tournament:
             while len(players) > 1:  # Tant qu'il y a au moins deux joueurs pour former un match
                 player1 = players.pop(0)  # Sélection du premier joueur
                 # Recherche d'un adversaire non rencontré précédemment
-                player2 = next((p for p in players if p.unique_id not in player1.past_opponents), None)
+                player2 = next((p for p in players if not self.opponents.has_played(player1.unique_id, p.unique_id)),
+                               None)
                 if player2:
                     matches.append(Match(players=(player1, player2)))  # Création du match
-                    # Enregistrement de l'adversaire dans l'historique des deux joueurs
-                    player1.past_opponents.add(player2.unique_id)
-                    player2.past_opponents.add(player1.unique_id)
+                    # Enregistrement de la rencontre dans l'historique du tournoi et celui des joueurs
+                    self.opponents.record(player1.unique_id, player2.unique_id)
+                    player1.add_past_opponent(player2.unique_id)
+                    player2.add_past_opponent(player1.unique_id)
                     players.remove(player2)  # Retirer l'adversaire de la liste des joueurs disponibles
                 else:
                     players.append(player1)  # Retour du joueur dans la liste pour une nouvelle tentative
-            round.matches.extend(matches)  # Ajout des matches au round courant
+            for match in matches:  # Ajout des matches au round courant
+                round.append_match(match)
 
     def update_scores(self, round_index, match_index, score1, score2):
         """Permet de mettre les score à jour"""
         match = self.rounds[round_index].matches[match_index]
         match.set_results((score1, score2))
+        self.emit(ResultRecorded(self, round_index, match_index, match))
 
     def register_player(self, player):
         """ Enregistre un joueur dans le tournoi si le tournoi est actif ou non terminé ou non commencé. """
@@ -117,8 +153,9 @@ class Tournament:
             print(f" Le tournoi '{self.name}'n'est pas actif")
             return
         if player not in self.registered_players:
-            player.past_opponents.clear()  # Efface l'historique du joueur
             self.registered_players.append(player)
+            self.opponents.add_player(player.unique_id)
+            self.emit(PlayerRegistered(self, player))
             print(f"{player.firstname} {player.name} a été ajouté(e) au tournoi '{self.name}'.")
         else:
             print(f"{player.firstname} {player.name} est déjà inscrit(e) à ce tournoi.")
@@ -134,8 +171,9 @@ class Tournament:
         if not self.is_active():
             print("Le tournoi n'est pas actif.")
             return
-        new_round = Round(name=round_name, start_time=start_time)
+        new_round = self.attach_round(Round(name=round_name, start_time=start_time))
         self.rounds.append(new_round)
+        self.emit(RoundAdded(self, len(self.rounds) - 1, new_round))
         print(f"Round '{round_name}' ajouté au tournoi '{self.name}'.")
 
     def start_round(self, round_index):
@@ -144,6 +182,7 @@ class Tournament:
             round = self.rounds[round_index]
             if round.start_time is None:
                 round.start_time = datetime.now()
+                self.emit(RoundStarted(self, round_index, round))
                 print(f"Round '{round.name}' démarré.")
             else:
                 print(f"Round '{round.name}' a déjà été démarré.")
@@ -160,28 +199,31 @@ class Tournament:
         try:
             round = self.rounds[round_index]
             print(f"Attempting to end round: {round.name}, which started at: {round.start_time}")
-            
+
             if round.start_time is None:
                 print(f"Cannot end round {round.name} as it has not started.")
                 return
 
             if not round.is_complete:
                 print(f"Ending round: {round.name}")
-                for match, result in zip(round.matches, match_results):
+                for match_index, (match, result) in enumerate(zip(round.matches, match_results)):
+                    if match.is_complete:  # Résultat déjà saisi pendant le round
+                        continue
                     print(f"Updating match result: {result}")
                     match.set_results(result)
+                    self.emit(ResultRecorded(self, round_index, match_index, match))
                 round.end_time = datetime.now()
                 round.is_complete = True
+                rate_round(round)  # Mise à jour des classements Elo avec les résultats du round
+                self.emit(RoundEnded(self, round_index, round))
                 print(f"Round '{round.name}' completed at {round.end_time}.")
                 if all(r.is_complete for r in self.rounds):
                     print(f"All rounds completed. Tournament '{self.name}' is now finished.")
             else:
                 print(f"Round '{round.name}' is already completed.")
         except IndexError:
-<<<<<<< HEAD
             print("Invalid round index.")
 
-
     def calculate_player_points(self):
         player_points = {}
         for round in self.rounds:
@@ -197,7 +239,19 @@ class Tournament:
                 player_points[match.players[1].unique_id] += match.results[1]
 
         return player_points
-=======
-            print("Index de round invalide")
 
->>>>>>> experimental-features
+
+def _match_changed(event):
+    """
+    Compte un résultat saisi ou effacé directement sur un match (Match.set_results, Round.update_match_result,
+    Match.reset_match) comme une modification de son tournoi. La version est incrémentée sans publier
+    d'événement : les abonnés sont déjà informés par MatchResultSet ou MatchReset (et par ResultRecorded
+    lorsque le résultat passe par Tournament.update_scores).
+    """
+    owner = event.match.tournament  # None pour un match rattaché à aucun tournoi (import, archive)
+    if owner is not None:
+        owner.version += 1
+
+
+bus.subscribe(MatchResultSet, _match_changed)
+bus.subscribe(MatchReset, _match_changed)
@@ -0,0 +1,146 @@
+# models/tournament_index.py
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from models.events import bus, RoundAdded, RoundEnded, TournamentChanged
+
+
+NO_DATE = 0  # Ordinal utilisé pour une date invalide (None)
+
+
+def location_key(location):
+    """Clé de recherche d'un lieu : insensible à la casse et aux espaces superflus."""
+    return " ".join((location or "").split()).casefold()
+
+
+def _ordinal(date):
+    return date.toordinal() if date else NO_DATE
+
+
+class TournamentIndex:
+    """
+    Index des tournois par dates, lieu et statut.
+
+    Les dates de début sont gardées dans une liste triée, interrogée par bisection ; comme la durée des
+    tournois est bornée, elle suffit à trouver ceux qui recoupent un intervalle. Les lieux sont gardés dans
+    une table de hachage. Les tournois terminés forment un ensemble tenu à jour par les événements des
+    modèles ; « à venir » et « en cours » sont déduits des dates au moment de la requête et ne se périment
+    donc pas d'un jour à l'autre. Les tournois ajoutés à la fin de la liste sont indexés à la requête suivante.
+    """
+
+    def __init__(self, tournaments):
+        self.tournaments = tournaments
+        self.positions = {}  # t_id -> position dans la liste
+        self.keys = []  # (début, fin, lieu) de chaque position
+        self.starts = []  # (ordinal de début, position), trié
+        self.locations = {}
+        self.complete = set()
+        self.max_duration = 0  # Plus longue durée d'un tournoi, en jours : borne la recherche par date de début
+        self._sync()
+        for event_type in (TournamentChanged, RoundAdded, RoundEnded):
+            bus.subscribe(event_type, self.tournament_changed)
+
+    def close(self):
+        """Cesse de suivre les modifications des tournois."""
+        for event_type in (TournamentChanged, RoundAdded, RoundEnded):
+            bus.unsubscribe(event_type, self.tournament_changed)
+
+    def _sync(self):
+        """Indexe les tournois ajoutés à la liste depuis la dernière requête."""
+        first = len(self.keys)
+        for position in range(first, len(self.tournaments)):
+            tournament = self.tournaments[position]
+            self.positions[tournament.t_id] = position
+            self.keys.append(None)
+            self._index(position, tournament, sort=False)
+        if len(self.keys) > first:
+            self.starts.sort()
+
+    def _index(self, position, tournament, sort=True):
+        start, end = _ordinal(tournament.start_date), _ordinal(tournament.end_date)
+        key = (start, end, location_key(tournament.location))
+        self.keys[position] = key
+        if sort:
+            insort(self.starts, (start, position))
+        else:
+            self.starts.append((start, position))
+        if start != NO_DATE and end != NO_DATE:
+            self.max_duration = max(self.max_duration, end - start)
+        self.locations.setdefault(key[2], set()).add(position)
+        if tournament.is_tournament_complete():
+            self.complete.add(position)
+        else:
+            self.complete.discard(position)
+
+    def _unindex(self, position):
+        start, _, location = self.keys[position]
+        del self.starts[bisect_left(self.starts, (start, position))]
+        self.locations[location].discard(position)
+
+    def tournament_changed(self, event):
+        """Réindexe un tournoi modifié (dates, lieu, rounds)."""
+        position = self.positions.get(event.tournament.t_id)
+        if position is not None and self.tournaments[position] is event.tournament:
+            self._unindex(position)
+            self._index(position, event.tournament)
+
+    def status(self, position, today):
+        """Statut d'un tournoi indexé à la date 'today' (ordinal) : upcoming, active, complete ou None."""
+        if position in self.complete:
+            return 'complete'
+        start, end, _ = self.keys[position]
+        if start > today:
+            return 'upcoming'
+        tournament = self.tournaments[position]
+        if end >= today and tournament.current_round < tournament.total_round:
+            return 'active'
+        return None
+
+    def _date_candidates(self, date_from, date_to):
+        """
+        Positions des tournois pouvant recouper l'intervalle : ceux qui commencent entre date_from moins la
+        plus longue durée d'un tournoi et date_to, délimités par bisection dans la liste triée des débuts.
+        """
+        low = bisect_left(self.starts, (date_from - self.max_duration, -1)) if date_from is not None else 0
+        high = bisect_right(self.starts, (date_to, len(self.keys))) if date_to is not None else len(self.starts)
+        return [position for _, position in self.starts[low:high]]
+
+    def query(self, date_from=None, date_to=None, location=None, status=None, today=None):
+        """
+        Recherche les tournois répondant à tous les critères fournis.
+
+        Paramètres :
+        - date_from, date_to (datetime) : Intervalle de dates que le tournoi doit recouper.
+        - location (str) : Lieu exact, sans tenir compte de la casse.
+        - status (str) : 'upcoming' (à venir), 'active' (en cours) ou 'complete' (terminé).
+        - today (datetime) : Date de référence du statut, aujourd'hui par défaut.
+
+        Retourne :
+        - list : Les tournois trouvés, triés par date de début.
+        """
+        self._sync()
+        today = _ordinal(today or datetime.now())
+        date_from = _ordinal(date_from) if date_from else None
+        date_to = _ordinal(date_to) if date_to else None
+        if location is not None:
+            candidates = self.locations.get(location_key(location), ())
+        elif date_from is not None or date_to is not None:
+            candidates = self._date_candidates(date_from, date_to)
+        elif status == 'complete':
+            candidates = self.complete
+        elif status == 'active':
+            candidates = self._date_candidates(today, today)
+        elif status == 'upcoming':
+            candidates = [position for _, position in self.starts[bisect_right(self.starts, (today, len(self.keys))):]]
+        else:
+            candidates = range(len(self.keys))
+
+        found = []
+        for position in candidates:
+            start, end, _ = self.keys[position]
+            if date_from is not None and end < date_from or date_to is not None and start > date_to:
+                continue
+            if status is not None and self.status(position, today) != status:
+                continue
+            found.append((start, position))
+        return [self.tournaments[position] for _, position in sorted(found)]
@@ -0,0 +1,327 @@
+# util/archive.py
+
+import mmap
+import os
+import struct
+from datetime import datetime
+from models.match import Match
+from models.player import Player
+from models.round import Round
+from models.tournament import Tournament
+
+
+ARCHIVE_EXTENSION = '.ctar'
+MAGIC = b'CTAR'
+VERSION = 1
+
+# En-tête : magic, version, nombre et position de chaque section
+HEADER = struct.Struct('<4sHH8I')
+# Tournoi : t_id, nom, lieu, description (indices de chaînes), dates (ordinaux), rounds prévus, round courant
+TOURNAMENT_RECORD = struct.Struct('<4I4I')
+# Chaîne : position et longueur dans la zone de texte UTF-8
+STRING_RECORD = struct.Struct('<II')
+# Joueur : unique_id, nom, prénom (indices de chaînes), date de naissance (ordinal), classement, parties classées
+PLAYER_RECORD = struct.Struct('<4IdI')
+# Round : nom (indice de chaîne), début et fin (minutes, -1 si absent), terminé, premier match, nombre de matches
+ROUND_RECORD = struct.Struct('<IqqBII')
+# Match : round, échiquier, joueurs 1 et 2 (positions dans les joueurs), scores, terminé
+MATCH_RECORD = struct.Struct('<IIIIffB')
+
+
+def _encode_datetime(value):
+    return -1 if value is None else value.toordinal() * 1440 + value.hour * 60 + value.minute
+
+
+def _decode_datetime(value):
+    if value < 0:
+        return None
+    day = datetime.fromordinal(value // 1440)
+    return day.replace(hour=value % 1440 // 60, minute=value % 60)
+
+
+def _decode_date(ordinal):
+    return datetime.fromordinal(ordinal) if ordinal else None
+
+
+class StringTable:
+    """Table de chaînes dédupliquées : chaque identifiant ou nom n'est stocké qu'une fois."""
+
+    def __init__(self):
+        self.index = {}
+        self.strings = []
+
+    def add(self, value):
+        value = value or ''
+        if value not in self.index:
+            self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return self.index[value]
+
+
+def write_archive(tournament, filename):
+    """
+    Fige un tournoi terminé dans un fichier binaire en colonnes à enregistrements de taille fixe.
+
+    Le fichier est écrit dans un fichier temporaire puis substitué à la cible.
+    """
+    strings = StringTable()
+    # Les chaînes du tournoi sont placées en tête pour être lues sans parcourir la table
+    tournament_record = TOURNAMENT_RECORD.pack(
+        strings.add(tournament.t_id), strings.add(tournament.name), strings.add(tournament.location),
+        strings.add(tournament.description),
+        tournament.start_date.toordinal() if tournament.start_date else 0,
+        tournament.end_date.toordinal() if tournament.end_date else 0,
+        tournament.total_round, tournament.current_round)
+
+    positions = {}
+    players = bytearray()
+    for player in tournament.registered_players:
+        positions[player.unique_id] = len(positions)
+        players += PLAYER_RECORD.pack(strings.add(player.unique_id), strings.add(player.name),
+                                      strings.add(player.firstname), player.birthdate.toordinal(),
+                                      player.rating, player.rated_games)
+
+    rounds = bytearray()
+    matches = bytearray()
+    match_count = 0
+    for round_index, rnd in enumerate(tournament.rounds):
+        rounds += ROUND_RECORD.pack(strings.add(rnd.name), _encode_datetime(rnd.start_time),
+                                    _encode_datetime(rnd.end_time), rnd.is_complete, match_count, len(rnd.matches))
+        for board_index, match in enumerate(rnd.matches):
+            matches += MATCH_RECORD.pack(round_index, board_index, positions[match.players[0].unique_id],
+                                         positions[match.players[1].unique_id], match.results[0], match.results[1],
+                                         match.is_complete)
+            match_count += 1
+
+    encoded = [value.encode('utf-8') for value in strings.strings]
+    string_records = bytearray()
+    text_offset = 0
+    for value in encoded:
+        string_records += STRING_RECORD.pack(text_offset, len(value))
+        text_offset += len(value)
+
+    strings_offset = HEADER.size + TOURNAMENT_RECORD.size
+    text_start = strings_offset + len(string_records)
+    players_offset = text_start + text_offset
+    rounds_offset = players_offset + len(players)
+    matches_offset = rounds_offset + len(rounds)
+    header = HEADER.pack(MAGIC, VERSION, 0, len(encoded), strings_offset, len(tournament.registered_players),
+                         players_offset, len(tournament.rounds), rounds_offset, match_count, matches_offset)
+
+    temp_file = filename + '.tmp'
+    with open(temp_file, 'wb') as file:
+        for block in (header, tournament_record, string_records, *encoded, players, rounds, matches):
+            file.write(block)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_file, filename)
+
+
+class ArchivedTournament:
+    """
+    Tournoi terminé lu depuis son archive au travers d'un mmap.
+
+    Seules les informations générales sont lues à l'ouverture, sans garder le fichier ouvert. L'archive est
+    projetée en mémoire une seule fois, à la première lecture de ses joueurs, rounds ou matches, puis gardée
+    jusqu'à close() : seules les pages effectivement lues sont chargées. Un tournoi archivé est immuable et
+    n'est jamais réécrit par save_tournaments.
+    """
+    archived = True
+    version = 0  # Un tournoi archivé ne change plus
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._map = None  # Projection mémoire, ouverte à la première lecture et libérée par close()
+        self._players = None
+        self._rounds = None
+        with open(filename, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            self._read_header(view)
+            (t_id, name, location, description, start_date, end_date,
+             self.total_round, self.current_round) = TOURNAMENT_RECORD.unpack_from(view, HEADER.size)
+            self.t_id = self._string(view, t_id)
+            self.name = self._string(view, name)
+            self.location = self._string(view, location)
+            self.description = self._string(view, description)
+            self.start_date = _decode_date(start_date)
+            self.end_date = _decode_date(end_date)
+
+    def _read_header(self, view):
+        (magic, version, _, self.string_count, self.strings_offset, self.player_count, self.players_offset,
+         self.round_count, self.rounds_offset, self.match_count, self.matches_offset) = HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Archive de tournoi invalide : {self.filename}")
+        self.text_start = self.strings_offset + self.string_count * STRING_RECORD.size
+
+    def _string(self, view, index):
+        offset, length = STRING_RECORD.unpack_from(view, self.strings_offset + index * STRING_RECORD.size)
+        start = self.text_start + offset
+        return str(view[start:start + length], 'utf-8')
+
+    def _view(self):
+        """Retourne la projection mémoire de l'archive, ouverte à la première lecture."""
+        if self._map is None:
+            with open(self.filename, 'rb') as file:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def close(self):
+        """Libère la projection mémoire et les objets déjà construits (joueurs et rounds)."""
+        self._players = self._rounds = None
+        if self._map is not None:
+            view, self._map = self._map, None
+            try:
+                view.close()
+            except BufferError:
+                pass  # Un parcours des matches en cours la référence encore : elle est libérée avec lui
+
+    def string(self, index):
+        """Retourne une chaîne de la table par son indice."""
+        return self._string(self._view(), index)
+
+    def iter_match_records(self):
+        """
+        Parcourt les enregistrements de matches sans construire d'objet du modèle.
+
+        Génère des tuples (round, échiquier, joueur 1, joueur 2, score 1, score 2, terminé), les joueurs
+        étant désignés par leur position dans la section des joueurs.
+        """
+        end = self.matches_offset + self.match_count * MATCH_RECORD.size
+        return MATCH_RECORD.iter_unpack(memoryview(self._view())[self.matches_offset:end])
+
+    def round_records(self):
+        """Retourne (nom, début, fin, terminé) de chaque round, sans construire ses matches."""
+        view = self._view()
+        records = [ROUND_RECORD.unpack_from(view, self.rounds_offset + index * ROUND_RECORD.size)
+                   for index in range(self.round_count)]
+        return [(self._string(view, name), _decode_datetime(start_time), _decode_datetime(end_time),
+                 bool(is_complete)) for name, start_time, end_time, is_complete, _, _ in records]
+
+    def _player_records(self, view):
+        return [PLAYER_RECORD.unpack_from(view, self.players_offset + index * PLAYER_RECORD.size)
+                for index in range(self.player_count)]
+
+    def player_ids(self):
+        """Retourne les unique_id des joueurs, dans l'ordre de leurs positions."""
+        view = self._view()
+        return [self._string(view, record[0]) for record in self._player_records(view)]
+
+    def player_ratings(self):
+        """Retourne les classements Elo des joueurs, dans l'ordre de leurs positions."""
+        return [record[4] for record in self._player_records(self._view())]
+
+    def calculate_player_points(self):
+        """Calcule les points de chaque joueur directement à partir des enregistrements de matches."""
+        ids = self.player_ids()
+        points = {}
+        for _, _, first, second, score1, score2, _ in self.iter_match_records():
+            points[ids[first]] = points.get(ids[first], 0) + score1
+            points[ids[second]] = points.get(ids[second], 0) + score2
+        return points
+
+    @property
+    def registered_players(self):
+        if self._players is None:
+            view = self._view()
+            self._players = [Player(self._string(view, name), self._string(view, firstname),
+                                    datetime.fromordinal(birthdate).strftime("%d/%m/%Y"),
+                                    self._string(view, unique_id), rating=rating, rated_games=rated_games)
+                             for unique_id, name, firstname, birthdate, rating, rated_games
+                             in self._player_records(view)]
+        return self._players
+
+    @property
+    def rounds(self):
+        if self._rounds is None:
+            players = self.registered_players
+            records = list(self.iter_match_records())
+            view = self._view()
+            round_records = [ROUND_RECORD.unpack_from(view, self.rounds_offset + index * ROUND_RECORD.size)
+                             for index in range(self.round_count)]
+            names = [self._string(view, record[0]) for record in round_records]
+            rounds = []
+            for (_, start_time, end_time, is_complete, first_match, count), name in zip(round_records, names):
+                matches = [Match(players=(players[first], players[second]), results=(score1, score2),
+                                 is_complete=bool(complete))
+                           for _, _, first, second, score1, score2, complete in
+                           records[first_match:first_match + count]]
+                rounds.append(Round(name=name, start_time=_decode_datetime(start_time),
+                                    end_time=_decode_datetime(end_time), is_complete=bool(is_complete),
+                                    matches=matches))
+            self._rounds = rounds
+        return self._rounds
+
+    def is_tournament_complete(self):
+        return True
+
+    def is_active(self):
+        return False
+
+    def to_tournament(self):
+        """Reconstruit un objet Tournament complet, modifiable, à partir de l'archive."""
+        # Une date absente est rendue comme dans Tournament.to_dict, et redevient None à la construction
+        start_date = self.start_date.strftime("%d/%m/%Y") if self.start_date else "Invalid date"
+        end_date = self.end_date.strftime("%d/%m/%Y") if self.end_date else "Invalid date"
+        return Tournament(name=self.name, location=self.location, description=self.description,
+                          start_date=start_date, end_date=end_date,
+                          total_round=self.total_round, t_id=self.t_id, current_round=self.current_round,
+                          rounds=self.rounds, registered_players=self.registered_players)
+
+    def to_dict(self):
+        return self.to_tournament().to_dict()
+
+    def _refuse_change(self, *args, **kwargs):
+        print(f"Le tournoi '{self.name}' est archivé et ne peut plus être modifié.")
+
+    register_player = add_round = start_round = end_round = update_scores = start_tournament = _refuse_change
+
+
+def archive_tournament(tournament, directory):
+    """Écrit l'archive d'un tournoi terminé et retourne sa version archivée."""
+    os.makedirs(directory, exist_ok=True)
+    filename = os.path.join(directory, tournament.t_id + ARCHIVE_EXTENSION)
+    write_archive(tournament, filename)
+    return ArchivedTournament(filename)
+
+
+def is_archivable(tournament):
+    """Un tournoi peut être archivé lorsque tous ses rounds prévus ont été joués."""
+    return (not getattr(tournament, 'archived', False) and len(tournament.rounds) >= tournament.total_round
+            and tournament.is_tournament_complete())
+
+
+def archive_completed(tournaments, directory):
+    """
+    Archive les tournois terminés d'une liste et les y remplace par leur version archivée.
+
+    Les archives sont écrites avant que la sauvegarde courante ne soit réécrite : après un arrêt entre
+    les deux étapes, un tournoi présent des deux côtés est lu depuis son archive (voir merge_archives).
+
+    Retourne :
+    - list : Les tournois archivés.
+    """
+    archived = []
+    for index, tournament in enumerate(tournaments):
+        if is_archivable(tournament):
+            tournaments[index] = archive_tournament(tournament, directory)
+            archived.append(tournaments[index])
+    return archived
+
+
+def load_archives(directory):
+    """Ouvre toutes les archives d'un répertoire (seules leurs informations générales sont lues)."""
+    if not os.path.isdir(directory):
+        return []
+    archives = []
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith(ARCHIVE_EXTENSION):
+            try:
+                archives.append(ArchivedTournament(os.path.join(directory, filename)))
+            except (ValueError, struct.error) as e:
+                print(f"Archive ignorée : {filename} ({e})")
+    return archives
+
+
+def merge_archives(tournaments, archives):
+    """Ajoute les tournois archivés aux tournois chargés ; l'archive l'emporte sur une copie restée en place."""
+    archived_ids = {archive.t_id for archive in archives}
+    return [tournament for tournament in tournaments if tournament.t_id not in archived_ids] + archives
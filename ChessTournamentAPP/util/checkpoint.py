@@ -0,0 +1,194 @@
+# util/checkpoint.py
+
+import json
+import os
+from datetime import datetime
+from models.match import Match
+from models.round import Round
+
+
+SNAPSHOT_SUFFIX = '.snapshot.json'
+JOURNAL_SUFFIX = '.journal'
+SNAPSHOT_EVERY = 100  # Nombre de résultats journalisés avant la réécriture d'un snapshot
+DATETIME_FORMAT = '%Y-%m-%d %H:%M'
+
+
+def _format_datetime(value):
+    return value.strftime(DATETIME_FORMAT) if value else None
+
+
+def _parse_datetime(value):
+    return datetime.strptime(value, DATETIME_FORMAT) if value else None
+
+
+def tournament_state(tournament):
+    """
+    Extrait l'état modifiable d'un tournoi sous une forme compacte.
+
+    Retourne :
+    - dict : Round courant et, pour chaque round, son statut et les résultats de ses matches.
+    """
+    return {
+        't_id': tournament.t_id,
+        'current_round': tournament.current_round,
+        'rounds': [
+            [rnd.name, rnd.is_complete, _format_datetime(rnd.start_time), _format_datetime(rnd.end_time),
+             [[match.players[0].unique_id, match.players[1].unique_id, match.results[0], match.results[1],
+               match.is_complete] for match in rnd.matches]]
+            for rnd in tournament.rounds
+        ]
+    }
+
+
+class Checkpoint:
+    """
+    Point de reprise d'un tournoi en cours : un snapshot de son état modifiable, complété par un journal
+    des résultats saisis depuis ce snapshot.
+
+    Chaque résultat n'ajoute qu'une ligne au journal ; le snapshot est réécrit tous les 'snapshot_every'
+    résultats pour que la reprise reste rapide.
+    """
+
+    def __init__(self, directory, tournament, snapshot_every=SNAPSHOT_EVERY):
+        self.tournament = tournament
+        self.snapshot_every = snapshot_every
+        self.snapshot_file = os.path.join(directory, tournament.t_id + SNAPSHOT_SUFFIX)
+        self.journal_file = os.path.join(directory, tournament.t_id + JOURNAL_SUFFIX)
+        self.pending = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def snapshot(self):
+        """Écrit l'état complet du tournoi de façon atomique puis vide le journal."""
+        temp_file = self.snapshot_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            json.dump(tournament_state(self.tournament), file, ensure_ascii=False, separators=(',', ':'))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, self.snapshot_file)
+        open(self.journal_file, 'w').close()
+        self.pending = 0
+
+    def record_result(self, round_index, match_index, results):
+        """Ajoute un résultat au journal et le rend durable avant de rendre la main."""
+        with open(self.journal_file, 'a', encoding='utf-8') as file:
+            file.write(json.dumps([round_index, match_index, results[0], results[1]]) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        self.pending += 1
+        if self.pending >= self.snapshot_every:
+            self.snapshot()
+
+
+def clear_checkpoints(directory):
+    """Supprime les points de reprise une fois les données sauvegardées."""
+    if not os.path.isdir(directory):
+        return
+    for filename in os.listdir(directory):
+        if filename.endswith((SNAPSHOT_SUFFIX, JOURNAL_SUFFIX)):
+            os.remove(os.path.join(directory, filename))
+
+
+def restore_tournament(tournament, state, journal_entries=(), notify=True):
+    """
+    Réapplique un état sauvegardé par tournament_state, puis les résultats du journal.
+
+    Les matches sont reliés aux joueurs inscrits par leur unique_id ; un match dont les joueurs ne
+    correspondent pas à ceux du tournoi est ignoré. Avec notify=False, la modification n'est pas publiée
+    (TournamentChanged) : une copie lue pour l'affichage ne doit pas remplacer le tournoi suivi par les index.
+    """
+    players = {player.unique_id: player for player in tournament.registered_players}
+    tournament.current_round = state['current_round']
+    for round_index, (name, is_complete, start_time, end_time, matches) in enumerate(state['rounds']):
+        if round_index < len(tournament.rounds):
+            rnd = tournament.rounds[round_index]
+        else:
+            rnd = tournament.attach_round(Round(name=name))
+            tournament.rounds.append(rnd)
+        rnd.name = name
+        rnd.is_complete = is_complete
+        rnd.start_time = _parse_datetime(start_time)
+        rnd.end_time = _parse_datetime(end_time)
+        for match_index, (id1, id2, score1, score2, match_complete) in enumerate(matches):
+            if match_index < len(rnd.matches):
+                match = rnd.matches[match_index]
+                if (match.players[0].unique_id, match.players[1].unique_id) != (id1, id2):
+                    continue
+            elif id1 in players and id2 in players:
+                match = Match(players=(players[id1], players[id2]))
+                rnd.append_match(match)
+                tournament.opponents.record(id1, id2)
+            else:
+                continue
+            match.results = (score1, score2)
+            match.is_complete = match_complete
+
+    for round_index, match_index, score1, score2 in journal_entries:
+        match = tournament.rounds[round_index].matches[match_index]
+        match.results = (score1, score2)
+        match.is_complete = True
+    if notify:
+        tournament.touch()
+
+
+def _read_journal(filename):
+    """Lit les entrées du journal, en ignorant une dernière ligne tronquée par un arrêt brutal."""
+    entries = []
+    if not os.path.exists(filename):
+        return entries
+    with open(filename, 'r', encoding='utf-8') as file:
+        for line in file:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+    return entries
+
+
+def recover_checkpoints(tournaments, directory):
+    """
+    Restaure les tournois pour lesquels un point de reprise a survécu à un arrêt du programme.
+
+    Paramètres :
+    - tournaments (list) : Tournois chargés depuis le stockage.
+    - directory (str) : Répertoire des points de reprise.
+
+    Retourne :
+    - list : Les tournois restaurés.
+    """
+    if not os.path.isdir(directory):
+        return []
+    by_id = {tournament.t_id: tournament for tournament in tournaments if not getattr(tournament, 'archived', False)}
+    recovered = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(SNAPSHOT_SUFFIX):
+            continue
+        t_id = filename[:-len(SNAPSHOT_SUFFIX)]
+        if t_id in by_id and apply_checkpoint(by_id[t_id], directory):
+            recovered.append(by_id[t_id])
+    return recovered
+
+
+def checkpoint_files(directory, t_id):
+    """Retourne les chemins du snapshot et du journal du point de reprise d'un tournoi."""
+    return os.path.join(directory, t_id + SNAPSHOT_SUFFIX), os.path.join(directory, t_id + JOURNAL_SUFFIX)
+
+
+def apply_checkpoint(tournament, directory, notify=True):
+    """
+    Applique à un tournoi son point de reprise, s'il en a un, sans modifier les fichiers du point de reprise
+    (voir restore_tournament pour 'notify').
+
+    Retourne :
+    - bool : True si un point de reprise a été appliqué.
+    """
+    snapshot_file, journal_file = checkpoint_files(directory, tournament.t_id)
+    try:
+        with open(snapshot_file, 'r', encoding='utf-8') as file:
+            state = json.load(file)
+        restore_tournament(tournament, state, _read_journal(journal_file), notify)
+    except FileNotFoundError:
+        return False
+    except (json.JSONDecodeError, KeyError, IndexError, ValueError) as e:
+        print(f"Point de reprise illisible pour le tournoi {tournament.t_id} : {e}")
+        return False
+    return True
@@ -0,0 +1,175 @@
+# util/compression.py
+
+import gzip
+import io
+import lzma
+import os
+import zlib
+from contextlib import contextmanager
+from util import config
+
+
+CHUNK_SIZE = 64 * 1024
+# Extensions reconnues ; le format d'un fichier de données est déterminé par son extension
+EXTENSIONS = ('.gz', '.xz', '.lzma', '.zz')
+FORMATS = tuple(extension[1:] for extension in EXTENSIONS)  # Valeurs acceptées de config.COMPRESSION
+# Erreurs levées par un fichier compressé tronqué ou endommagé
+CORRUPTION_ERRORS = (EOFError, gzip.BadGzipFile, lzma.LZMAError, zlib.error, UnicodeDecodeError)
+
+
+class ZlibStream(io.RawIOBase):
+    """
+    Flux zlib brut, compressé ou décompressé par blocs de CHUNK_SIZE octets.
+
+    Le fichier sous-jacent n'est pas fermé avec le flux, pour pouvoir être synchronisé sur disque ensuite.
+    """
+
+    def __init__(self, file, mode='r', level=6):
+        self.file = file
+        self.writing = mode == 'w'
+        self.codec = zlib.compressobj(level) if self.writing else zlib.decompressobj()
+        self.pending = b''
+        self.eof = False
+
+    def readable(self):
+        return not self.writing
+
+    def writable(self):
+        return self.writing
+
+    def readinto(self, buffer):
+        while not self.pending and not self.eof:
+            chunk = self.file.read(CHUNK_SIZE)
+            if chunk:
+                self.pending = self.codec.decompress(chunk)
+            else:
+                self.pending = self.codec.flush()
+                self.eof = True
+                if not self.codec.eof:
+                    # Comme gzip et lzma : un flux tronqué est une erreur, pas une fin de fichier
+                    raise EOFError("Fichier zlib tronqué : fin du flux compressé absente")
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+        return size
+
+    def write(self, data):
+        self.file.write(self.codec.compress(data))
+        return len(data)
+
+    def close(self):
+        if not self.closed and self.writing:
+            self.file.write(self.codec.flush())
+        super().close()
+
+
+def compression_of(filename):
+    """Retourne l'extension de compression d'un fichier ('' pour un fichier non compressé)."""
+    extension = os.path.splitext(filename)[1]
+    return extension if extension in EXTENSIONS else ''
+
+
+def strip_compression(filename):
+    """Retire l'extension de compression d'un nom de fichier."""
+    return filename[:-len(compression_of(filename))] if compression_of(filename) else filename
+
+
+def validate_compression(value):
+    """
+    Vérifie un format de compression demandé (option --compression ou variable CHESS_COMPRESSION).
+
+    Retourne :
+    - str : Le format reconnu, ou '' pour aucune compression ('' ou 'none').
+
+    Lève :
+    - ValueError : Si le format est inconnu.
+    """
+    value = (value or '').strip().lower()
+    if value in ('', 'none'):
+        return ''
+    if value not in FORMATS:
+        raise ValueError(f"Format de compression inconnu : '{value}'. Attendu : none, {', '.join(FORMATS)}")
+    return value
+
+
+def storage_name(filename):
+    """
+    Nom sous lequel écrire un fichier de données : un nom sans extension de compression reçoit celle du
+    format configuré (config.COMPRESSION), un nom qui en porte déjà une la garde.
+
+    Lève :
+    - ValueError : Si config.COMPRESSION n'est pas un format reconnu : un fichier non compressé ne doit pas
+      recevoir une extension trompeuse.
+    """
+    if compression_of(filename) or not config.COMPRESSION:
+        return filename
+    return f"{filename}.{validate_compression(config.COMPRESSION)}"
+
+
+def variants(filename):
+    """Noms possibles d'un fichier de données, compressé ou non."""
+    base = strip_compression(filename)
+    return [base] + [base + extension for extension in EXTENSIONS]
+
+
+def find_data_file(filename):
+    """
+    Retrouve un fichier de données quel que soit son format, en préférant le format configuré.
+
+    Retourne :
+    - str : Le chemin existant, ou celui à utiliser pour une première écriture.
+    """
+    preferred = storage_name(strip_compression(filename))
+    for candidate in [preferred] + variants(filename):
+        if os.path.exists(candidate):
+            return candidate
+    return preferred
+
+
+def remove_other_variants(filename):
+    """Supprime les copies d'un fichier de données enregistrées dans un autre format."""
+    for candidate in variants(filename):
+        if candidate != filename and os.path.exists(candidate):
+            os.remove(candidate)
+
+
+def _open_codec(file, extension, mode):
+    if extension == '.gz':
+        return gzip.GzipFile(filename='', fileobj=file, mode=mode + 'b', mtime=0)
+    if extension in ('.xz', '.lzma'):
+        return lzma.LZMAFile(file, mode=mode, format=lzma.FORMAT_XZ if extension == '.xz' else lzma.FORMAT_ALONE)
+    if extension == '.zz':
+        stream = ZlibStream(file, mode)
+        return io.BufferedWriter(stream, CHUNK_SIZE) if mode == 'w' else io.BufferedReader(stream, CHUNK_SIZE)
+    return None
+
+
+@contextmanager
+def open_data_file(filename, mode='r', extension=None):
+    """
+    Ouvre un fichier de données en texte UTF-8, en le (dé)compressant au fil de la lecture ou de l'écriture.
+
+    Paramètres :
+    - filename (str) : Chemin du fichier.
+    - mode (str) : 'r' ou 'w'.
+    - extension (str) : Format à utiliser, déduit par défaut de l'extension de 'filename' (utile pour
+      un fichier temporaire destiné à être renommé).
+
+    Effets :
+    - En écriture, le fichier est synchronisé sur disque (fsync) à la sortie du bloc.
+    """
+    extension = compression_of(filename) if extension is None else extension
+    with open(filename, mode + 'b') as file:
+        codec = _open_codec(file, extension, mode)
+        stream = io.TextIOWrapper(codec or file, encoding='utf-8')
+        try:
+            yield stream
+            if mode == 'w':
+                stream.flush()
+        finally:
+            stream.detach()
+            if codec is not None:
+                codec.close()  # Termine le flux compressé sans fermer le fichier
+        if mode == 'w':
+            file.flush()
+            os.fsync(file.fileno())
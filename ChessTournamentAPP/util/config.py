@@ -2,6 +2,17 @@ import os
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DATA_DIR = os.path.join(BASE_DIR, 'data')
-TOURNAMENTS_FILE = os.path.join(DATA_DIR, 'tournaments.json')
-PLAYERS_FILE = os.path.join(DATA_DIR, 'players.json')
+# Le répertoire de données peut être remplacé par la variable d'environnement CHESS_DATA_DIR
+DATA_DIR = os.environ.get('CHESS_DATA_DIR') or os.path.join(BASE_DIR, 'data')
+TOURNAMENTS_FILENAME = 'tournaments.json'
+PLAYERS_FILENAME = 'players.json'
+TOURNAMENTS_FILE = os.path.join(DATA_DIR, TOURNAMENTS_FILENAME)
+PLAYERS_FILE = os.path.join(DATA_DIR, PLAYERS_FILENAME)
+CHECKPOINTS_DIRNAME = 'checkpoints'
+EXPORTS_DIRNAME = 'exports'
+ARCHIVE_DIRNAME = 'archive'
+DROPFOLDER_DIRNAME = 'dropfolder'  # Dossiers surveillés de dépôt des résultats, un par tournoi
+SHARDS_DIRNAME = 'tournaments'  # Un fichier JSON par tournoi, plus manifest.json
+MANIFEST_FILENAME = 'manifest.json'
+# Compression des fichiers de données écrits : '' (aucune), 'gz', 'xz', 'lzma' ou 'zz' (zlib)
+COMPRESSION = os.environ.get('CHESS_COMPRESSION', '')
@@ -1,14 +1,30 @@
 
 # util/data_manager.py
 
+import hashlib
 import json
 import os
+import re
+import shutil
+import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from models.tournament import Tournament
 from models.round import Round
 from models.player import Player
 from models.match import Match
-from .config import TOURNAMENTS_FILE, PLAYERS_FILE
+from .compression import (CORRUPTION_ERRORS, open_data_file, compression_of, storage_name, strip_compression,
+                          find_data_file, remove_other_variants)
+from .config import TOURNAMENTS_FILE, PLAYERS_FILE, SHARDS_DIRNAME, MANIFEST_FILENAME
+
+
+MANIFEST_VERSION = 1
+LOAD_WORKERS = 8  # Fils de lecture des fichiers par tournoi : la lecture disque se fait hors du GIL
+
+# Tournoi -> (fichier, état, entrée du manifeste) lors de sa dernière lecture ou écriture : un tournoi dont
+# l'état n'a pas changé depuis n'est ni resérialisé ni réécrit
+_saved_states = weakref.WeakKeyDictionary()
 
 
 def my_datetime_handler(x):
@@ -29,54 +45,356 @@ def my_datetime_handler(x):
     raise TypeError("Object of type 'datetime' is not JSON serializable")
 
 
+def write_json_atomic(data, filename, **kwargs):
+    """
+    Écrit des données JSON dans un fichier temporaire puis le substitue au fichier cible.
+
+    Un arrêt brutal pendant l'écriture laisse ainsi intact le fichier précédent. Le fichier est compressé
+    au fil de l'écriture si son extension l'indique (.gz, .xz, .lzma, .zz).
+    """
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    temp_file = filename + '.tmp'
+    with open_data_file(temp_file, 'w', compression_of(filename)) as file:
+        json.dump(data, file, **kwargs)
+    os.replace(temp_file, filename)
+
+
+def quarantine_corrupt_file(filename):
+    """
+    Renomme un fichier de données illisible pour qu'une sauvegarde ultérieure ne l'écrase pas.
+
+    Retourne :
+    - str : Le nouveau chemin du fichier.
+    """
+    corrupt_file = f"{filename}.corrupt-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    os.replace(filename, corrupt_file)
+    return corrupt_file
+
+
+def preserve_original_file(filename):
+    """
+    Copie un fichier de données lu avec des problèmes avant que la sauvegarde suivante ne le réécrive sans
+    les éléments ignorés : l'original reste disponible pour les corriger à la main.
+
+    Retourne :
+    - str : Le chemin de la copie.
+    """
+    original_file = f"{filename}.orig-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    shutil.copy2(filename, original_file)
+    return original_file
+
+
+def write_text_atomic(text, filename):
+    """Écrit un texte déjà sérialisé dans un fichier, de façon atomique (voir write_json_atomic)."""
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    temp_file = filename + '.tmp'
+    with open_data_file(temp_file, 'w', compression_of(filename)) as file:
+        file.write(text)
+    os.replace(temp_file, filename)
+
+
+def shards_directory(filename):
+    """Retourne le répertoire des fichiers par tournoi, voisin de l'ancien fichier unique 'filename'."""
+    return os.path.join(os.path.dirname(filename), SHARDS_DIRNAME)
+
+
+def shard_filename(t_id):
+    """Nom du fichier d'un tournoi ; un identifiant impropre à un nom de fichier est assaini et complété d'un hash."""
+    safe_id = re.sub(r'[^\w-]', '_', t_id)
+    if safe_id != t_id:
+        safe_id += '-' + hashlib.sha1(t_id.encode('utf-8')).hexdigest()[:8]
+    return storage_name(safe_id + '.json')
+
+
+def tournament_file(t_id, filename=TOURNAMENTS_FILE):
+    """Retourne le chemin du fichier d'un tournoi, quel que soit son format de compression."""
+    return find_data_file(os.path.join(shards_directory(filename), shard_filename(t_id)))
+
+
+def save_state(tournament):
+    """
+    Empreinte peu coûteuse de ce que sauvegarde un tournoi : sa version, qui compte ses modifications, et
+    tout ce que sérialisent ses joueurs, partagés avec les autres tournois et modifiés hors de ses méthodes
+    (fiche, classement et nombre de parties classées, adversaires rencontrés, y compris renommés par une
+    fusion de doublons).
+    """
+    return tournament.version, tuple((player.unique_id, player.name, player.firstname, player.birthdate,
+                                      player.rating, player.rated_games, hash(frozenset(player.past_opponents)))
+                                     for player in tournament.registered_players)
+
+
+def _remember_saved(tournament, shard_file, entry):
+    _saved_states[tournament] = (shard_file, save_state(tournament), entry)
+
+
+def serialize_tournament(tournament):
+    return json.dumps(tournament.to_dict(), ensure_ascii=False, indent=4, default=my_datetime_handler)
+
+
+def read_manifest(directory):
+    """
+    Lit le manifeste des fichiers par tournoi.
+
+    Retourne :
+    - list : Entrées {'t_id', 'file', 'hash'} dans l'ordre des tournois, ou None si le manifeste est absent.
+    """
+    manifest_file = os.path.join(directory, MANIFEST_FILENAME)
+    if not os.path.exists(manifest_file):
+        return None
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as file:
+            return json.load(file)['tournaments']
+    except (json.JSONDecodeError, KeyError) as e:
+        print(f"Error decoding manifest: {e}. File moved to {quarantine_corrupt_file(manifest_file)}.")
+        return []
+
+
 def save_tournaments(tournaments, filename=TOURNAMENTS_FILE):
     """
-    Sauvegarde une liste de tournois dans un fichier JSON.
+    Sauvegarde une liste de tournois, un fichier JSON par tournoi, plus un manifeste.
 
     Paramètres :
     - tournaments (list) : Liste d'objets Tournament à sérialiser et sauvegarder.
-    - filename (str) : Chemin vers le fichier où les tournois seront sauvegardés.
+    - filename (str) : Chemin de l'ancien fichier unique ; les fichiers par tournoi sont écrits dans le
+      répertoire 'tournaments' voisin.
 
     Effets :
-    - Crée le répertoire du fichier s'il n'existe pas.
-    - Écrit les données des tournois dans un fichier JSON.
+    - Seuls les tournois modifiés depuis leur lecture ou leur dernière sauvegarde (voir save_state) sont
+      sérialisés ; leur fichier n'est réécrit, de façon atomique, que si son contenu a changé. Le manifeste
+      est écrit ensuite, puis les fichiers des tournois retirés sont supprimés.
+    - Les modifications des joueurs inscrits sont détectées d'elles-mêmes. Une modification directe d'un
+      attribut du tournoi, de ses rounds ou de ses matches doit en revanche passer par une méthode de
+      Tournament ou être suivie de tournament.touch(), faute de quoi elle n'est pas sauvegardée.
+    - Les tournois archivés (voir util.archive) ne sont pas réécrits : leur archive fait foi.
     """
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    with open(filename, 'w', encoding='utf-8') as file:
-        json.dump([tournament.to_dict() for tournament in tournaments], file, ensure_ascii=False,
-                  indent=4, default=my_datetime_handler)
+    directory = shards_directory(filename)
+    manifest = read_manifest(directory)
+    previous = {entry['t_id']: entry for entry in manifest or []}
+    entries = []
+    for tournament in tournaments:
+        if getattr(tournament, 'archived', False):
+            continue
+        shard_file = os.path.join(directory, shard_filename(tournament.t_id))
+        saved = _saved_states.get(tournament)
+        if (saved is not None and saved[0] == shard_file and saved[1] == save_state(tournament)
+                and previous.get(tournament.t_id) == saved[2] and os.path.exists(shard_file)):
+            entries.append(saved[2])
+            continue
+        text = serialize_tournament(tournament)
+        entry = {'t_id': tournament.t_id, 'file': os.path.basename(shard_file),
+                 'hash': hashlib.sha1(text.encode('utf-8')).hexdigest()}
+        if previous.get(tournament.t_id) != entry or not os.path.exists(shard_file):
+            write_text_atomic(text, shard_file)
+        _remember_saved(tournament, shard_file, entry)
+        entries.append(entry)
+    if manifest != entries:
+        write_json_atomic({'version': MANIFEST_VERSION, 'tournaments': entries},
+                          os.path.join(directory, MANIFEST_FILENAME), indent=1)
+    kept = {entry['file'] for entry in entries}
+    for entry in previous.values():
+        if entry['file'] not in kept and os.path.exists(os.path.join(directory, entry['file'])):
+            os.remove(os.path.join(directory, entry['file']))
 
 
-def load_tournaments(filename=TOURNAMENTS_FILE):
+def read_tournament_file(filename, expected_hash=None, quarantine=True):
     """
-    Charge les tournois à partir d'un fichier JSON.
+    Charge un tournoi depuis son fichier JSON.
 
     Paramètres :
-    - filename (str) : Chemin vers le fichier JSON contenant les données des tournois.
+    - filename (str) : Chemin du fichier du tournoi.
+    - expected_hash (str) : Hash enregistré dans le manifeste. Un fichier identique à celui qu'a écrit
+      l'application est de confiance : ses joueurs ne sont pas revalidés.
+    - quarantine (bool) : Met de côté un fichier illisible ; un simple lecteur (tableau en direct) le laisse
+      à l'application qui l'écrit.
 
     Retourne :
-    - list : Liste des objets Tournament chargés, ou une liste vide en cas d'échec.
-
-    Gère :
-    - FileNotFoundError : Avertissement si le fichier n'est pas trouvé, retourne une liste vide.
-    - JSONDecodeError : Erreur si le fichier JSON est mal formé.
+    - tuple : Le tournoi chargé (None si le fichier est absent ou illisible, il est alors mis de côté)
+      et la liste des problèmes détectés. Lorsque des éléments ont été ignorés, une copie du fichier
+      d'origine est conservée avant que la sauvegarde suivante ne le réécrive.
     """
+    try:
+        with open_data_file(filename) as file:
+            text = file.read()
+        data = json.loads(text)
+    except FileNotFoundError:
+        return None, [f"Fichier de tournoi introuvable : {filename}"]
+    except (json.JSONDecodeError, *CORRUPTION_ERRORS) as e:
+        if not quarantine:
+            return None, [f"Error decoding JSON from file: {e}."]
+        return None, [f"Error decoding JSON from file: {e}. File moved to {quarantine_corrupt_file(filename)}."]
+    trusted = expected_hash is not None and hashlib.sha1(text.encode('utf-8')).hexdigest() == expected_hash
+    del text
+    problems = []
+    try:
+        tournament = build_tournament_from_data(data, problems, trusted)
+    except (KeyError, TypeError, ValueError) as e:
+        if not quarantine:
+            return None, problems + [f"Tournoi illisible ({e!r}) : fichier ignoré."]
+        return None, problems + [f"Tournoi illisible ({e!r}) : fichier déplacé vers "
+                                 f"{quarantine_corrupt_file(filename)}."]
+    if problems and quarantine:
+        problems.append(f"Fichier d'origine conservé : {preserve_original_file(filename)}.")
+    elif trusted and not problems:
+        _remember_saved(tournament, filename, {'t_id': tournament.t_id, 'file': os.path.basename(filename),
+                                               'hash': expected_hash})
+    return tournament, problems
+
+
+def report_problems(source, problems):
+    """Affiche ensemble tous les problèmes détectés au chargement d'un fichier."""
+    if problems:
+        print(f"Problèmes détectés dans {source} :")
+        for problem in problems:
+            print(f"  - {problem}")
+
+
+def load_single_file(filename):
+    """Charge les tournois depuis l'ancien fichier unique tournaments.json."""
     if not os.path.exists(filename) or os.stat(filename).st_size == 0:
-        print("Warning: No tournament data found, returning empty list.")
         return []
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
+        with open_data_file(filename) as file:
             tournaments_data = json.load(file)
-            return [build_tournament_from_data(data) for data in tournaments_data]
-    except json.JSONDecodeError:
-        print("Error decoding JSON from file.")
+    except (json.JSONDecodeError, *CORRUPTION_ERRORS) as e:
+        print(f"Error decoding JSON from file: {e}. File moved to {quarantine_corrupt_file(filename)}.")
+        return []
+    tournaments = []
+    problems = []
+    for data in tournaments_data:
+        try:
+            tournaments.append(build_tournament_from_data(data, problems))
+        except (KeyError, TypeError, ValueError) as e:
+            problems.append(f"Tournoi illisible ({e!r}) : tournoi ignoré.")
+    report_problems(filename, problems)
+    return tournaments
+
+
+def migrate_single_file(filename):
+    """
+    Convertit l'ancien fichier unique en fichiers par tournoi ; l'ancien fichier est renommé en '.migrated'.
+
+    Retourne :
+    - list : Les tournois migrés.
+    """
+    tournaments = load_single_file(filename)
+    save_tournaments(tournaments, filename)
+    if os.path.exists(filename):
+        os.replace(filename, filename + '.migrated')
+        print(f"Données des tournois migrées vers {shards_directory(filename)}.")
+    return tournaments
+
+
+def load_tournaments(filename=TOURNAMENTS_FILE, max_workers=LOAD_WORKERS):
+    """
+    Charge les tournois à partir des fichiers par tournoi, lus en parallèle.
+
+    Paramètres :
+    - filename (str) : Chemin de l'ancien fichier unique, migré au premier chargement s'il existe encore.
+    - max_workers (int) : Nombre de fils de lecture.
+
+    Retourne :
+    - list : Liste des objets Tournament chargés, dans l'ordre du manifeste, ou une liste vide en cas d'échec.
+
+    Gère :
+    - Un fichier de tournoi illisible est mis de côté sans empêcher le chargement des autres tournois.
+    - Les problèmes d'intégrité (joueur inconnu, doublon, résultat invalide) sont signalés tous ensemble,
+      fichier par fichier ; les éléments fautifs sont ignorés.
+    - Un fichier de tournoi absent du manifeste (arrêt entre son écriture et celle du manifeste) est chargé
+      à la suite des autres.
+    """
+    directory = shards_directory(filename)
+    entries = read_manifest(directory)
+    if entries is None:
+        single_file = find_data_file(filename)
+        if os.path.exists(single_file):
+            return migrate_single_file(single_file)
+        print("Warning: No tournament data found, returning empty list.")
         return []
+    hashes = {entry['file']: entry['hash'] for entry in entries}
+    files = [entry['file'] for entry in entries]
+    files += sorted(name for name in os.listdir(directory)
+                    if strip_compression(name).endswith('.json') and name != MANIFEST_FILENAME and name not in hashes)
+    paths = [os.path.join(directory, name) for name in files]
+    expected = [hashes.get(name) for name in files]
+    if max_workers == 1 or len(paths) < 2:
+        results = map(read_tournament_file, paths, expected)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(read_tournament_file, paths, expected))
+    tournaments = []
+    for path, (tournament, problems) in zip(paths, results):
+        report_problems(path, problems)
+        if tournament is not None:
+            tournaments.append(tournament)
+    return tournaments
 
 
-def build_tournament_from_data(data):
-    registered_players = [Player(**player_data) for player_data in data.get('registered_players', [])]
+def intern_player_data(data):
+    """
+    Partage en mémoire les chaînes répétées d'un joueur (identifiant, nom, prénom, adversaires).
+
+    Un même joueur apparaît dans chaque tournoi auquel il participe et dans l'historique de ses adversaires :
+    sys.intern n'en garde qu'un exemplaire. Les données, fraîchement lues, sont modifiées sur place.
+    """
+    for key in ('unique_id', 'name', 'firstname'):
+        if isinstance(data.get(key), str):
+            data[key] = sys.intern(data[key])
+    if data.get('past_opponents'):
+        data['past_opponents'] = [sys.intern(opponent_id) for opponent_id in data['past_opponents']]
+    return data
+
+
+def build_players(players_data, problems, trusted=False, context=""):
+    """
+    Construit les joueurs d'une liste en une passe, en collectant les problèmes au lieu de s'arrêter au premier.
+
+    Paramètres :
+    - players_data (list) : Données des joueurs.
+    - problems (list) : Liste complétée par la description de chaque problème.
+    - trusted (bool) : Données écrites par l'application : les validations de Player.__init__ sont sautées.
+    - context (str) : Préfixe des messages (tournoi concerné).
+
+    Retourne :
+    - list : Les joueurs valides ; un joueur invalide ou en double est ignoré.
+    """
+    players = []
+    seen = set()
+    for position, player_data in enumerate(players_data, start=1):
+        player_data = intern_player_data(player_data)
+        try:
+            player = Player.from_trusted_data(player_data) if trusted else Player(**player_data)
+        except (KeyError, TypeError, ValueError) as e:
+            problems.append(f"{context}joueur n°{position} invalide : {e}")
+            continue
+        if player.unique_id in seen:
+            problems.append(f"{context}joueur {player.unique_id} en double")
+            continue
+        seen.add(player.unique_id)
+        players.append(player)
+    return players
+
+
+def build_tournament_from_data(data, problems=None, trusted=False):
+    """
+    Construit un tournoi et vérifie en une seule passe l'intégrité de ses références.
+
+    Paramètres :
+    - data (dict) : Données du tournoi (Tournament.to_dict).
+    - problems (list) : Liste complétée par les problèmes détectés ; s'ils ne sont pas collectés par
+      l'appelant, ils sont affichés.
+    - trusted (bool) : Données écrites par l'application (voir build_players).
+
+    Retourne :
+    - Tournament : Le tournoi, sans les joueurs ni les matches invalides.
+    """
+    collected = [] if problems is None else problems
+    context = f"Tournoi {data.get('t_id')}, "
+    registered_players = build_players(data.get('registered_players', []), collected, trusted, context)
     player_dict = {player.unique_id: player for player in registered_players}
-    rounds = [build_round_from_data(round_data, player_dict) for round_data in data.get('rounds', [])]
+    rounds = [build_round_from_data(round_data, player_dict, collected, f"{context}round {index}, ", trusted)
+              for index, round_data in enumerate(data.get('rounds', []), start=1)]
+    if problems is None:
+        report_problems(f"le tournoi {data.get('t_id')}", collected)
     return Tournament(
         name=data['name'],
         location=data['location'],
@@ -91,32 +409,43 @@ def build_tournament_from_data(data):
     )
 
 
-def build_round_from_data(round_data, player_dict):
-    matches = [
-        Match(
-            players=(
-                player_dict[match_data['players'][0]],
-                player_dict[match_data['players'][1]]
-            ),
-            results=tuple(match_data['results'])
-        )
-        for match_data in round_data.get('matches', [])
-    ]
+def build_round_from_data(round_data, player_dict, problems=None, context="", trusted=False):
+    """
+    Construit un round ; un match qui désigne un joueur non inscrit au tournoi, ou dont le résultat est
+    mal formé, est signalé dans 'problems' et ignoré. Les dates d'un round de confiance sont lues sans strptime.
+    """
+    matches = []
+    for position, match_data in enumerate(round_data.get('matches', []), start=1):
+        try:
+            first, second = match_data['players']
+            players = (player_dict[first], player_dict[second])
+            score1, score2 = match_data['results']
+            if not trusted and not (isinstance(score1, (int, float)) and isinstance(score2, (int, float))):
+                raise TypeError
+        except KeyError as e:
+            if problems is not None:
+                problems.append(f"{context}match {position} : joueur ou champ inconnu {e}")
+            continue
+        except (TypeError, ValueError):
+            if problems is not None:
+                problems.append(f"{context}match {position} : match mal formé {match_data}")
+            continue
+        matches.append(Match(players=players, results=(score1, score2),
+                             is_complete=match_data.get('is_complete', False)))
+    parse_time = datetime.fromisoformat if trusted else _parse_round_time
     return Round(
         name=round_data['name'],
-        start_time=(
-            datetime.strptime(round_data['start_time'], '%Y-%m-%d %H:%M')
-            if 'start_time' in round_data else None
-        ),
-        end_time=(
-            datetime.strptime(round_data['end_time'], '%Y-%m-%d %H:%M')
-            if 'end_time' in round_data and round_data['end_time'] else None
-        ),
+        start_time=parse_time(round_data['start_time']) if round_data.get('start_time') else None,
+        end_time=parse_time(round_data['end_time']) if round_data.get('end_time') else None,
         is_complete=round_data.get('is_complete', False),
         matches=matches
     )
 
 
+def _parse_round_time(value):
+    return datetime.strptime(value, '%Y-%m-%d %H:%M')
+
+
 def save_players(players, filename=PLAYERS_FILE):
     """
     Sauvegarde une liste de joueurs dans un fichier JSON.
@@ -127,11 +456,12 @@ def save_players(players, filename=PLAYERS_FILE):
 
     Effets :
     - Crée le répertoire du fichier s'il n'existe pas.
-    - Écrit les données des joueurs dans un fichier JSON.
+    - Écrit les données des joueurs dans un fichier JSON, de façon atomique, compressé selon le format
+      configuré (config.COMPRESSION) ; une copie dans un autre format est ensuite supprimée.
     """
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    with open(filename, 'w', encoding='utf-8') as file:
-        json.dump([player.to_dict() for player in players], file, ensure_ascii=False, indent=4)
+    filename = storage_name(filename)
+    write_json_atomic([player.to_dict() for player in players], filename, ensure_ascii=False, indent=4)
+    remove_other_variants(filename)
 
 
 def load_players(filename=PLAYERS_FILE):
@@ -146,19 +476,21 @@ def load_players(filename=PLAYERS_FILE):
 
     Gère :
     - FileNotFoundError : Avertissement si le fichier n'est pas trouvé, retourne une liste vide.
-    - JSONDecodeError : Erreur si le fichier JSON est mal formé.
-    - KeyError : Gestion des clés manquantes dans les données JSON.
+    - JSONDecodeError : Erreur si le fichier JSON est mal formé ; le fichier est mis de côté.
+    - Joueurs invalides ou en double : tous signalés ensemble, puis ignorés.
+    - Le fichier est lu quel que soit son format de compression.
     """
+    filename = find_data_file(filename)
     if not os.path.exists(filename) or os.stat(filename).st_size == 0:
         print("Warning: No player data found, returning empty list.")
         return []
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
+        with open_data_file(filename) as file:
             players_data = json.load(file)
-            return [Player(**data) for data in players_data]
-    except json.JSONDecodeError:
-        print("Error decoding JSON from file.")
-        return []
-    except KeyError as e:
-        print(f"Error: Missing expected data key in player data: {str(e)}")
+    except (json.JSONDecodeError, *CORRUPTION_ERRORS) as e:
+        print(f"Error decoding JSON from file: {e}. File moved to {quarantine_corrupt_file(filename)}.")
         return []
+    problems = []
+    players = build_players(players_data, problems)
+    report_problems(filename, problems)
+    return players
@@ -0,0 +1,239 @@
+# util/dropfolder.py
+"""
+Saisie des résultats par dépôt de fichiers dans un dossier surveillé (échiquiers électroniques, feuilles
+de résultats numérisées).
+
+Un fichier de résultats contient une ligne par partie : 'round;échiquier;résultat', éventuellement suivie
+des identifiants des deux joueurs ('round;échiquier;résultat;id_blancs;id_noirs'), qui sont alors vérifiés.
+Les lignes vides et celles commençant par '#' sont ignorées ; ',' est accepté comme séparateur.
+"""
+
+import hashlib
+import json
+import os
+import time
+from .data_manager import write_json_atomic
+
+
+RESULT_EXTENSIONS = ('.txt', '.csv')
+LEDGER_FILENAME = '.ledger.json'
+PROCESSED_DIRNAME = 'processed'
+REJECTED_DIRNAME = 'rejected'
+POLL_INTERVAL = 1.0  # Secondes entre deux examens du dossier
+MAX_BATCH_DELAY = 10.0  # Délai maximal entre l'application d'un résultat et sa sauvegarde, en secondes
+
+# Résultats acceptés (blancs-noirs) -> points des deux joueurs
+RESULTS = {'1-0': (1.0, 0.0), '0-1': (0.0, 1.0), '1/2-1/2': (0.5, 0.5), '½-½': (0.5, 0.5),
+           '0.5-0.5': (0.5, 0.5), '=': (0.5, 0.5), '+-': (1.0, 0.0), '-+': (0.0, 1.0)}
+
+
+def parse_result_line(line):
+    """
+    Analyse une ligne de fichier de résultats.
+
+    Retourne :
+    - tuple : (indice du round, indice de l'échiquier, scores, identifiants des joueurs ou None),
+      ou None pour une ligne vide ou un commentaire.
+
+    Lève :
+    - ValueError : Si la ligne est mal formée.
+    """
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    fields = [field.strip() for field in line.replace(',', ';').split(';')]
+    if len(fields) not in (3, 5):
+        raise ValueError(f"3 ou 5 champs attendus, {len(fields)} trouvés")
+    try:
+        round_number, board = int(fields[0]), int(fields[1])
+    except ValueError:
+        raise ValueError(f"round et échiquier doivent être des nombres : '{fields[0]}', '{fields[1]}'")
+    if fields[2] not in RESULTS:
+        raise ValueError(f"résultat inconnu '{fields[2]}'")
+    player_ids = tuple(fields[3:5]) if len(fields) == 5 else None
+    return round_number - 1, board - 1, RESULTS[fields[2]], player_ids
+
+
+def available_name(directory, name):
+    """
+    Retourne un chemin libre pour ranger 'name' dans 'directory' (créé au besoin) : un fichier déjà rangé
+    sous le même nom n'est pas écrasé, le nouveau reçoit un suffixe numéroté ('resultats-2.txt').
+    """
+    os.makedirs(directory, exist_ok=True)
+    stem, extension = os.path.splitext(name)
+    target, counter = os.path.join(directory, name), 1
+    while os.path.exists(target):
+        counter += 1
+        target = os.path.join(directory, f"{stem}-{counter}{extension}")
+    return target
+
+
+class DropFolder:
+    """
+    Dossier surveillé par scrutation, dont les fichiers de résultats sont appliqués à un tournoi.
+
+    Un fichier n'est lu qu'une fois sa taille et sa date de modification stables d'un examen à l'autre,
+    pour ne pas lire un fichier en cours d'écriture. Les résultats d'une rafale de fichiers sont sauvegardés
+    ensemble, lorsqu'un examen ne trouve plus de nouveau fichier (ou au plus tard après MAX_BATCH_DELAY
+    secondes) ; les fichiers sont ensuite déplacés dans 'processed' ou 'rejected', et l'empreinte de ceux
+    de 'processed' est inscrite au registre du dossier.
+
+    Le traitement est idempotent : un fichier déjà traité (même contenu) est ignoré, et un résultat déjà
+    enregistré à l'identique n'est pas réappliqué. Un fichier rejeté peut être déposé de nouveau. Un arrêt
+    avant la sauvegarde laisse les fichiers en place : ils sont réappliqués au redémarrage.
+
+    Paramètres :
+    - directory (str) : Dossier surveillé.
+    - tournament (Tournament) : Tournoi auquel les résultats s'appliquent.
+    - save (callable) : Sauvegarde des données, appelée une fois par rafale.
+    """
+
+    def __init__(self, directory, tournament, save, poll_interval=POLL_INTERVAL, max_batch_delay=MAX_BATCH_DELAY):
+        self.directory = directory
+        self.tournament = tournament
+        self.save = save
+        self.poll_interval = poll_interval
+        self.max_batch_delay = max_batch_delay
+        self.ledger_file = os.path.join(directory, LEDGER_FILENAME)
+        self.sizes = {}  # Nom de fichier -> (taille, date de modification) au dernier examen
+        self.pending = []  # (nom de fichier, empreinte, dossier de destination) en attente de sauvegarde
+        self.pending_since = None
+        self.applied = 0
+        os.makedirs(directory, exist_ok=True)
+        self.ledger = self._read_ledger()
+
+    def _read_ledger(self):
+        if not os.path.exists(self.ledger_file):
+            return {}
+        with open(self.ledger_file, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    def ready_files(self):
+        """Retourne les fichiers de résultats dont la taille et la date n'ont pas changé depuis l'examen précédent."""
+        current = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in RESULT_EXTENSIONS:
+                    stat = entry.stat()
+                    current[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        waiting = {name for name, _, _ in self.pending}
+        ready = sorted(name for name, signature in current.items()
+                       if self.sizes.get(name) == signature and name not in waiting)
+        self.sizes = current
+        return ready
+
+    def apply_file(self, name):
+        """
+        Applique les résultats d'un fichier au tournoi.
+
+        Retourne :
+        - str : Dossier de destination du fichier : PROCESSED_DIRNAME, ou REJECTED_DIRNAME si le fichier
+          n'est pas lisible en UTF-8, ou si une ligne est invalide ou contredit un résultat déjà enregistré
+          (les autres lignes sont alors appliquées).
+        """
+        try:
+            # Lu en entier avant d'appliquer une ligne : un fichier mal encodé n'est pas appliqué à moitié
+            with open(os.path.join(self.directory, name), 'r', encoding='utf-8') as file:
+                lines = file.read().splitlines()
+        except (UnicodeDecodeError, OSError) as e:
+            print(f"{name} : fichier illisible ({e}), rejeté.")
+            return REJECTED_DIRNAME
+        destination = PROCESSED_DIRNAME
+        for line_number, line in enumerate(lines, start=1):
+            try:
+                parsed = parse_result_line(line)
+                if parsed is not None:
+                    self.apply_result(*parsed)
+            except ValueError as e:
+                print(f"{name}, ligne {line_number} : {e}")
+                destination = REJECTED_DIRNAME
+        return destination
+
+    def apply_result(self, round_index, match_index, scores, player_ids=None):
+        """
+        Enregistre un résultat avec Tournament.update_scores, sauf s'il l'est déjà à l'identique.
+
+        Lève :
+        - ValueError : Si le round ou l'échiquier n'existe pas, si le round n'a pas commencé, si les joueurs
+          ne sont pas ceux de l'échiquier, ou si un autre résultat a déjà été enregistré.
+        """
+        rounds = self.tournament.rounds
+        if not 0 <= round_index < len(rounds) or not 0 <= match_index < len(rounds[round_index].matches):
+            raise ValueError(f"round {round_index + 1}, échiquier {match_index + 1} introuvable")
+        rnd = rounds[round_index]
+        match = rnd.matches[match_index]
+        if rnd.start_time is None:
+            raise ValueError(f"le round '{rnd.name}' n'a pas commencé")
+        if player_ids is not None and player_ids != tuple(player.unique_id for player in match.players):
+            raise ValueError(f"les joueurs {'-'.join(player_ids)} ne sont pas ceux de l'échiquier {match_index + 1}")
+        if match.is_complete or rnd.is_complete:
+            if tuple(match.results) != scores:
+                raise ValueError(f"échiquier {match_index + 1} du round {round_index + 1} déjà enregistré "
+                                 f"avec un autre résultat ({match.results[0]}-{match.results[1]})")
+            return  # Fichier reçu en double ou en retard : déjà appliqué
+        self.tournament.update_scores(round_index, match_index, *scores)
+        self.applied += 1
+
+    def poll(self):
+        """
+        Examine le dossier une fois, applique les fichiers prêts et sauvegarde la rafale si elle est terminée.
+
+        Retourne :
+        - int : Nombre de fichiers traités lors de cet examen.
+        """
+        ready = self.ready_files()
+        for name in ready:
+            try:
+                with open(os.path.join(self.directory, name), 'rb') as file:
+                    digest = hashlib.sha1(file.read()).hexdigest()
+            except OSError as e:
+                print(f"{name} : fichier inaccessible ({e}), ignoré.")  # Retiré ou déplacé depuis l'examen
+                continue
+            if digest in self.ledger:
+                print(f"{name} : déjà traité ({self.ledger[digest]}), ignoré.")
+                self.pending.append((name, digest, PROCESSED_DIRNAME))
+            else:
+                self.pending.append((name, digest, self.apply_file(name)))
+            if self.pending_since is None:
+                self.pending_since = time.monotonic()
+        if self.pending and (not ready or time.monotonic() - self.pending_since >= self.max_batch_delay):
+            self.commit()
+        return len(ready)
+
+    def commit(self):
+        """Sauvegarde les résultats appliqués, puis range les fichiers et met à jour le registre."""
+        if not self.pending:
+            return
+        self.save()
+        for name, digest, destination in self.pending:
+            target = available_name(os.path.join(self.directory, destination), name)
+            try:
+                os.replace(os.path.join(self.directory, name), target)
+            except FileNotFoundError:
+                print(f"{name} : fichier retiré avant d'être rangé.")
+            if destination == PROCESSED_DIRNAME:
+                # Un fichier rejeté n'est pas inscrit : déposé à nouveau (round commencé entre-temps, fichier
+                # corrigé), il est réappliqué ; ses lignes déjà enregistrées ne le sont pas une seconde fois
+                self.ledger.setdefault(digest, name)
+        write_json_atomic(self.ledger, self.ledger_file, indent=1)
+        print(f"{len(self.pending)} fichier(s) traité(s), {self.applied} résultat(s) enregistré(s).")
+        self.pending, self.pending_since, self.applied = [], None, 0
+        for index, rnd in enumerate(self.tournament.rounds):
+            if not rnd.is_complete and rnd.matches and all(match.is_complete for match in rnd.matches):
+                print(f"Tous les résultats du round {index + 1} sont reçus : il peut être terminé.")
+
+    def run(self, max_polls=None):
+        """
+        Surveille le dossier jusqu'à une interruption (Ctrl+C) ou 'max_polls' examens ; les résultats déjà
+        appliqués sont sauvegardés avant de rendre la main.
+        """
+        polls = 0
+        try:
+            while max_polls is None or polls < max_polls:
+                self.poll()
+                polls += 1
+                time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.commit()
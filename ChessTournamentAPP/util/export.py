@@ -0,0 +1,184 @@
+# util/export.py
+
+import csv
+import html
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+FORMATS = ('csv', 'html')
+REPORTS = ('pairings', 'standings', 'crosstable')
+IN_FLIGHT_PER_WORKER = 2  # Tournois sérialisés en attente par processus : borne la mémoire du processus parent
+REPORT_TITLES = {'pairings': "Appariements", 'standings': "Classement", 'crosstable': "Grille américaine"}
+
+
+def _format_score(score):
+    """Affiche un score de partie : 1, ½ ou 0."""
+    return "½" if score == 0.5 else str(int(score))
+
+
+def _is_played(rnd, match):
+    return rnd.is_complete or match.is_complete or sum(match.results) > 0
+
+
+def _ranking(tournament):
+    """Retourne les joueurs inscrits triés par points décroissants, avec leurs points."""
+    points = tournament.calculate_player_points()
+    players = sorted(tournament.registered_players,
+                     key=lambda player: (-points.get(player.unique_id, 0), player.name, player.firstname))
+    return players, points
+
+
+def pairing_rows(tournament):
+    """Génère l'en-tête puis une ligne par match, round par round."""
+    yield ["Round", "Échiquier", "Joueur 1", "Score J-1", "Score J-2", "Joueur 2"]
+    for rnd in tournament.rounds:
+        for board, match in enumerate(rnd.matches, start=1):
+            first, second = match.players
+            played = _is_played(rnd, match)
+            yield [rnd.name, board, f"{first.firstname} {first.name}",
+                   _format_score(match.results[0]) if played else "",
+                   _format_score(match.results[1]) if played else "",
+                   f"{second.firstname} {second.name}"]
+
+
+def standing_rows(tournament):
+    """Génère l'en-tête puis une ligne par joueur, dans l'ordre du classement."""
+    yield ["Rang", "ID", "Nom", "Prénom", "Points", "Elo"]
+    players, points = _ranking(tournament)
+    for rank, player in enumerate(players, start=1):
+        yield [rank, player.unique_id, player.name, player.firstname, points.get(player.unique_id, 0),
+               round(player.rating)]
+
+
+def crosstable_rows(tournament):
+    """
+    Génère la grille américaine : une ligne par joueur, une colonne par adversaire désigné par son rang.
+
+    Seuls les résultats de chaque joueur sont gardés en mémoire ; les lignes sont produites une à une.
+    """
+    players, points = _ranking(tournament)
+    ranks = {player.unique_id: rank for rank, player in enumerate(players, start=1)}
+    results = {player.unique_id: {} for player in players}
+    for rnd in tournament.rounds:
+        for match in rnd.matches:
+            if not _is_played(rnd, match):
+                continue
+            first, second = (player.unique_id for player in match.players)
+            results.setdefault(first, {}).setdefault(second, []).append(match.results[0])
+            results.setdefault(second, {}).setdefault(first, []).append(match.results[1])
+    yield ["Rang", "ID", "Nom", "Points"] + [str(rank) for rank in range(1, len(players) + 1)]
+    for player in players:
+        games = results[player.unique_id]
+        cells = [""] * len(players)
+        for opponent_id, scores in games.items():
+            if opponent_id in ranks:
+                cells[ranks[opponent_id] - 1] = " ".join(_format_score(score) for score in scores)
+        cells[ranks[player.unique_id] - 1] = "X"
+        yield [ranks[player.unique_id], player.unique_id, f"{player.firstname} {player.name}",
+               points.get(player.unique_id, 0)] + cells
+
+
+ROW_GENERATORS = {'pairings': pairing_rows, 'standings': standing_rows, 'crosstable': crosstable_rows}
+
+
+def write_csv(filename, rows):
+    """Écrit les lignes dans un fichier CSV au fur et à mesure de leur production."""
+    with open(filename, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file, delimiter=';')
+        for row in rows:
+            writer.writerow(row)
+
+
+def write_html(filename, title, rows):
+    """Écrit les lignes dans une page HTML statique au fur et à mesure de leur production."""
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.write('<!DOCTYPE html>\n<html lang="fr">\n<head>\n<meta charset="utf-8">\n'
+                   f'<title>{html.escape(title)}</title>\n'
+                   '<style>table{border-collapse:collapse}td,th{border:1px solid #999;padding:2px 6px}</style>\n'
+                   f'</head>\n<body>\n<h1>{html.escape(title)}</h1>\n<table>\n')
+        rows = iter(rows)
+        header = next(rows, [])
+        file.write('<tr>' + ''.join(f'<th>{html.escape(str(cell))}</th>' for cell in header) + '</tr>\n')
+        for row in rows:
+            file.write('<tr>' + ''.join(f'<td>{html.escape(str(cell))}</td>' for cell in row) + '</tr>\n')
+        file.write('</table>\n</body>\n</html>\n')
+
+
+def export_tournament(tournament, directory, formats=FORMATS, reports=REPORTS):
+    """
+    Exporte les appariements, le classement et la grille américaine d'un tournoi.
+
+    Paramètres :
+    - tournament (Tournament) : Tournoi à exporter.
+    - directory (str) : Répertoire de destination, créé si besoin.
+    - formats (tuple) : Formats parmi 'csv' et 'html'.
+    - reports (tuple) : Rapports parmi 'pairings', 'standings' et 'crosstable'.
+
+    Retourne :
+    - list : Chemins des fichiers écrits.
+    """
+    os.makedirs(directory, exist_ok=True)
+    written = []
+    for report in reports:
+        for file_format in formats:
+            filename = os.path.join(directory, f"{tournament.t_id}_{report}.{file_format}")
+            rows = ROW_GENERATORS[report](tournament)
+            if file_format == 'csv':
+                write_csv(filename, rows)
+            else:
+                write_html(filename, f"{tournament.name} - {REPORT_TITLES[report]}", rows)
+            written.append(filename)
+    return written
+
+
+def _export_from_data(args):
+    """Reconstruit un tournoi sérialisé et l'exporte ; exécutée dans un processus de travail."""
+    from util.data_manager import build_tournament_from_data
+    data, directory, formats, reports = args
+    return export_tournament(build_tournament_from_data(data, trusted=True), directory, formats, reports)
+
+
+def write_index(tournaments, directory, reports=REPORTS):
+    """Écrit une page index.html reliant les rapports HTML exportés."""
+    filename = os.path.join(directory, 'index.html')
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.write('<!DOCTYPE html>\n<html lang="fr">\n<head>\n<meta charset="utf-8">\n'
+                   '<title>Tournois</title>\n</head>\n<body>\n<h1>Tournois</h1>\n<ul>\n')
+        for tournament in tournaments:
+            links = ' | '.join(f'<a href="{tournament.t_id}_{report}.html">{REPORT_TITLES[report]}</a>'
+                               for report in reports)
+            file.write(f'<li>{html.escape(tournament.name)} ({html.escape(tournament.location)}) : {links}</li>\n')
+        file.write('</ul>\n</body>\n</html>\n')
+    return filename
+
+
+def export_tournaments(tournaments, directory, formats=FORMATS, reports=REPORTS, max_workers=None):
+    """
+    Exporte plusieurs tournois, en parallèle sur plusieurs processus lorsque c'est possible.
+
+    Chaque processus reçoit le tournoi sérialisé (to_dict) et écrit ses propres fichiers. Les tournois sont
+    sérialisés au fil de l'envoi, jamais plus de IN_FLIGHT_PER_WORKER par processus à la fois.
+
+    Retourne :
+    - list : Chemins des fichiers écrits.
+    """
+    os.makedirs(directory, exist_ok=True)
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(tournaments) < 2:
+        written = [path for tournament in tournaments
+                   for path in export_tournament(tournament, directory, formats, reports)]
+    else:
+        written, pending = [], deque()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for tournament in tournaments:
+                if len(pending) >= max_workers * IN_FLIGHT_PER_WORKER:
+                    written.extend(pending.popleft().result())
+                pending.append(executor.submit(_export_from_data,
+                                               (tournament.to_dict(), directory, formats, reports)))
+            while pending:
+                written.extend(pending.popleft().result())
+    if 'html' in formats:
+        written.append(write_index(tournaments, directory, reports))
+    return written
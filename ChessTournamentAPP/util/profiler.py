@@ -0,0 +1,185 @@
+# util/profiler.py
+
+import atexit
+import cProfile
+import functools
+import importlib
+import inspect
+import os
+import sys
+import time
+import tracemalloc
+
+
+ENV_VAR = 'CHESS_PROFILE'
+OUTPUT_ENV_VAR = 'CHESS_PROFILE_OUTPUT'
+DEFAULT_OUTPUT = 'chess_profile.pstats'
+MODES = ('summary', 'cprofile')
+
+# Modules dont toutes les fonctions sont instrumentées
+INSTRUMENTED_MODULES = ('util.data_manager',)
+
+# (module, classe, méthodes) : None instrumente toutes les méthodes de la classe
+INSTRUMENTED_CLASSES = (
+    ('models.tournament', 'Tournament', None),
+    ('views.tournament_views', 'TournamentView',
+     ('disp_tournaments', 'display_tournament_details', 'display_players', 'display_rounds', 'display_ranking',
+      'display_simulation', 'render_tournament_details', 'render_players', 'render_rounds', 'render_ranking')),
+    ('views.player_views', 'PlayerView', ('display_players',)),
+)
+
+_active_profiler = None
+
+
+class CallStats:
+    """Compteurs cumulés pour une fonction instrumentée."""
+    __slots__ = ('calls', 'wall_time', 'alloc_delta')
+
+    def __init__(self):
+        self.calls = 0
+        self.wall_time = 0.0
+        self.alloc_delta = 0
+
+
+class Profiler:
+    """
+    Instrumente les chemins critiques de l'application (persistance, modèle Tournament, rendu des vues).
+
+    Les fonctions ciblées ne sont remplacées par des enveloppes qu'à l'activation : lorsque le profilage
+    est désactivé, aucun code n'est modifié et l'application ne paie aucun surcoût.
+    """
+
+    def __init__(self, mode='summary', output=None):
+        if mode not in MODES:
+            raise ValueError(f"Mode de profilage inconnu : {mode}. Attendu : {', '.join(MODES)}")
+        self.mode = mode
+        self.output = output or DEFAULT_OUTPUT
+        self.stats = {}
+        self._originals = []
+        self._profile = None
+        self._started_tracemalloc = False
+
+    def enable(self):
+        """Active l'instrumentation et programme l'écriture du rapport à la sortie du programme."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._instrument()
+        if self.mode == 'cprofile':
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        atexit.register(self.dump)
+
+    def disable(self):
+        """Restaure les fonctions d'origine et arrête les mesures."""
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals.clear()
+        if self._profile:
+            self._profile.disable()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        atexit.unregister(self.dump)
+
+    def _wrap(self, qualname, func):
+        """Retourne une enveloppe qui compte les appels, le temps réel et la variation de mémoire allouée."""
+        stats = self.stats.setdefault(qualname, CallStats())
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            mem_before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.wall_time += time.perf_counter() - start
+                stats.alloc_delta += tracemalloc.get_traced_memory()[0] - mem_before
+                stats.calls += 1
+        return wrapper
+
+    def _replace(self, owner, name, original, replacement):
+        self._originals.append((owner, name, original))
+        setattr(owner, name, replacement)
+
+    def _instrument(self):
+        for module_name in INSTRUMENTED_MODULES:
+            module = importlib.import_module(module_name)
+            for name, func in list(vars(module).items()):
+                if inspect.isfunction(func) and func.__module__ == module_name:
+                    wrapper = self._wrap(f"{module_name}.{name}", func)
+                    self._replace(module, name, func, wrapper)
+                    self._rebind_imported_names(func, wrapper)
+
+        for module_name, class_name, method_names in INSTRUMENTED_CLASSES:
+            cls = getattr(importlib.import_module(module_name), class_name)
+            for name, attr in list(vars(cls).items()):
+                if name.startswith('__') or (method_names is not None and name not in method_names):
+                    continue
+                qualname = f"{class_name}.{name}"
+                if isinstance(attr, staticmethod):
+                    self._replace(cls, name, attr, staticmethod(self._wrap(qualname, attr.__func__)))
+                elif inspect.isfunction(attr):
+                    self._replace(cls, name, attr, self._wrap(qualname, attr))
+
+    def _rebind_imported_names(self, func, wrapper):
+        """Remplace aussi les références importées par 'from module import fonction' avant l'activation."""
+        for module in list(sys.modules.values()):
+            namespace = getattr(module, '__dict__', None)
+            if not namespace or namespace is vars(sys.modules[func.__module__]):
+                continue
+            for name, value in list(namespace.items()):
+                if value is func:
+                    self._replace(module, name, func, wrapper)
+
+    def summary(self):
+        """Retourne le rapport des compteurs sous forme de texte, trié par temps cumulé décroissant."""
+        header = f"{'Fonction':<55} {'Appels':>8} {'Temps (s)':>11} {'Moy. (ms)':>10} {'Alloc. (Ko)':>12}"
+        lines = ["Profil de l'application".center(len(header)), header, "-" * len(header)]
+        ordered = sorted(self.stats.items(), key=lambda item: item[1].wall_time, reverse=True)
+        for qualname, stats in ordered:
+            if not stats.calls:
+                continue
+            average_ms = stats.wall_time / stats.calls * 1000
+            lines.append(f"{qualname:<55} {stats.calls:>8} {stats.wall_time:>11.4f} {average_ms:>10.3f} "
+                         f"{stats.alloc_delta / 1024:>12.1f}")
+        return "\n".join(lines)
+
+    def dump(self):
+        """Écrit le rapport : résumé sur la sortie d'erreur et, en mode cprofile, un fichier pstats."""
+        print(self.summary(), file=sys.stderr)
+        if self._profile:
+            self._profile.disable()
+            self._profile.dump_stats(self.output)
+            print(f"Profil cProfile enregistré dans {self.output}", file=sys.stderr)
+
+
+def configure(mode=None, output=None):
+    """
+    Active le profilage si demandé par l'option de ligne de commande ou la variable d'environnement.
+
+    Paramètres :
+    - mode (str) : 'summary' ou 'cprofile'. À défaut, la variable CHESS_PROFILE est consultée.
+    - output (str) : Fichier pstats du mode cprofile. À défaut, CHESS_PROFILE_OUTPUT ou DEFAULT_OUTPUT.
+
+    Retourne :
+    - Profiler : Le profileur actif, ou None si le profilage est désactivé.
+    """
+    global _active_profiler
+    mode = mode or os.environ.get(ENV_VAR, '')
+    if mode.lower() in ('', '0', 'off', 'false', 'no'):
+        return None
+    if mode.lower() in ('1', 'on', 'true', 'yes'):
+        mode = 'summary'
+    if mode.lower() not in MODES:
+        print(f"Attention : mode de profilage inconnu '{mode}' ({ENV_VAR}), profilage désactivé. "
+              f"Attendu : {', '.join(MODES)}", file=sys.stderr)
+        return None
+    _active_profiler = Profiler(mode.lower(), output or os.environ.get(OUTPUT_ENV_VAR))
+    _active_profiler.enable()
+    return _active_profiler
+
+
+def get_profiler():
+    """Retourne le profileur actif, ou None."""
+    return _active_profiler
@@ -0,0 +1,307 @@
+# util/trf.py
+"""
+Lecture et écriture du format FIDE TRF (Tournament Report File), ligne par ligne.
+
+Correspondance avec les modèles :
+- 012 (nom), 022 (lieu), 042/052 (dates), 092 (type, gardé comme description) : Tournament.
+- XXR (nombre de rounds prévus) : Tournament.total_round.
+- 132 (dates des rounds) : Round.start_time.
+- 001 (une ligne par joueur) : Player, et pour chaque round l'adversaire, la couleur et le résultat, dont
+  sont déduits les Match (le joueur 1 d'un match a les blancs).
+
+Les exempts (adversaire 0000) n'ont pas d'équivalent dans les modèles et sont ignorés.
+"""
+
+import os
+import re
+from datetime import datetime
+from models.match import Match
+from models.player import Player
+from models.rating import DEFAULT_RATING
+from models.round import Round
+from models.tournament import Tournament
+from .compression import compression_of, open_data_file
+
+
+TRF_EXTENSION = '.trf'
+UNKNOWN_BIRTHDATE = "01/01/1900"  # Date de naissance d'un joueur importé sans date (champ facultatif en TRF)
+IMPORT_ID_PREFIX = 'TR'  # Préfixe des identifiants attribués aux joueurs importés sans identifiant valide
+ROUNDS_COLUMN = 91  # Position (à partir de 0) de la première case de round d'une ligne 001 ou 132
+CELL_WIDTH = 10
+
+# Résultat TRF -> points du joueur ; les forfaits (+/-) et parties non classées (W/D/L) comptent comme jouées
+SCORES = {'1': 1.0, '+': 1.0, 'W': 1.0, 'F': 1.0, '=': 0.5, 'D': 0.5, 'H': 0.5,
+          '0': 0.0, '-': 0.0, 'L': 0.0, 'Z': 0.0, 'U': 0.0}
+RESULT_CODES = {1.0: '1', 0.5: '=', 0.0: '0'}
+UNIQUE_ID_PATTERN = re.compile(r'^[A-Z]{2}\d{5}$')
+
+
+def _parse_date(text, line_number):
+    """Convertit une date TRF (AAAA/MM/JJ, AA/MM/JJ ou AAAA seule) en datetime."""
+    text = text.strip().replace('-', '/').replace('.', '/')
+    for date_format in ("%Y/%m/%d", "%y/%m/%d", "%Y"):
+        try:
+            return datetime.strptime(text, date_format)
+        except ValueError:
+            continue
+    raise ValueError(f"Ligne {line_number} : date TRF invalide '{text}'.")
+
+
+def _format_date(date, date_format="%Y/%m/%d"):
+    return date.strftime(date_format) if date else ''
+
+
+class PlayerResolver:
+    """
+    Associe les joueurs d'un fichier TRF aux joueurs connus : par identifiant lorsque le fichier en donne un
+    valide, sinon par nom, prénom et date de naissance (si elle est connue) ; les autres sont créés, avec
+    l'identifiant du fichier ou à défaut un identifiant libre.
+
+    Paramètres :
+    - players (list) : Joueurs connus de l'application ; n'est pas modifiée, les joueurs créés sont
+      rassemblés dans 'new_players'.
+    """
+
+    def __init__(self, players):
+        self.by_id = {player.unique_id: player for player in players}
+        self.by_identity = {(player.name, player.firstname, player.birthdate): player for player in players}
+        self.new_players = []
+        self.next_number = 0
+
+    def _free_id(self):
+        while True:
+            unique_id = f"{IMPORT_ID_PREFIX}{self.next_number:05d}"
+            self.next_number += 1
+            if unique_id not in self.by_id:
+                return unique_id
+
+    def resolve(self, name, firstname, birthdate, id_field, rating, taken=()):
+        """
+        Retourne le joueur connu correspondant, ou un nouveau joueur enregistré dans new_players.
+
+        Un identifiant valide fait foi : deux joueurs d'identifiants différents ne sont jamais confondus, même
+        homonymes et nés le même jour. Sans date de naissance, l'homonymie ne suffit pas à reconnaître un joueur.
+
+        Paramètres :
+        - taken (set) : unique_id des joueurs déjà associés à une autre ligne du même fichier ; ils ne sont
+          pas proposés de nouveau.
+
+        Lève :
+        - ValueError : Si l'identifiant est celui d'un joueur déjà associé à une autre ligne du fichier.
+        """
+        valid_id = bool(UNIQUE_ID_PATTERN.match(id_field))
+        if valid_id and id_field in taken:
+            raise ValueError(f"identifiant {id_field} attribué à deux joueurs du fichier")
+        if id_field in self.by_id:
+            return self.by_id[id_field]
+        key = None
+        if birthdate:
+            key = (name, firstname, datetime.strptime(birthdate, "%d/%m/%Y"))
+            known = self.by_identity.get(key)
+            if not valid_id and known is not None and known.unique_id not in taken:
+                return known
+        unique_id = id_field if valid_id else self._free_id()
+        player = Player(name, firstname, birthdate or UNKNOWN_BIRTHDATE, unique_id, rating=rating or DEFAULT_RATING)
+        self.by_id[unique_id] = player
+        if key is not None:
+            self.by_identity.setdefault(key, player)
+        self.new_players.append(player)
+        return player
+
+
+def parse_trf(lines, resolver):
+    """
+    Construit un tournoi à partir des lignes d'un fichier TRF, lues une à une.
+
+    Un match est créé dès que la ligne du second joueur est lue ; seules les demi-parties en attente de
+    leur adversaire sont gardées en plus du tournoi en construction.
+
+    Paramètres :
+    - lines (iterable) : Lignes du fichier.
+    - resolver (PlayerResolver) : Associe chaque ligne 001 à un joueur.
+
+    Retourne :
+    - Tournament : Le tournoi, construit sans publier d'événements (comme au chargement des données).
+
+    Lève :
+    - ValueError : Si une ligne est mal formée ou si le fichier ne décrit aucun joueur.
+    """
+    header = {}
+    round_dates = []
+    ranks = {}  # Numéro de départ -> joueur
+    taken = set()  # unique_id des joueurs déjà associés à un numéro de départ
+    pending = {}  # (round, numéro le plus petit, le plus grand) -> demi-partie lue en premier
+    boards = []  # Par round : (numéro de départ du mieux placé, match)
+    for line_number, line in enumerate(lines, start=1):
+        line = line.rstrip('\r\n')
+        code = line[:3]
+        if code == '001':
+            _read_player_line(line, line_number, resolver, ranks, taken, pending, boards)
+        elif code == '132':
+            round_dates = [_parse_date(cell, line_number) if cell.strip() else None
+                           for cell in (line[start:start + CELL_WIDTH]
+                                        for start in range(ROUNDS_COLUMN, len(line), CELL_WIDTH))]
+        elif code in ('042', '052') and line[4:].strip():
+            header[code] = _parse_date(line[4:], line_number)
+        elif code in ('012', '022', '092', 'XXR'):
+            header[code] = line[4:].strip()
+    if not ranks:
+        raise ValueError("Le fichier TRF ne contient aucun joueur (lignes 001).")
+
+    rounds = []
+    for round_index, round_boards in enumerate(boards):
+        # Ordre des échiquiers : par numéro de départ du mieux placé des deux joueurs
+        matches = [match for _, match in sorted(round_boards, key=lambda board: board[0])]
+        start_time = round_dates[round_index] if round_index < len(round_dates) else None
+        rounds.append(Round(name=f"Round {round_index + 1}", start_time=start_time, matches=matches,
+                            is_complete=bool(matches) and all(match.is_complete for match in matches)))
+    start_date = header.get('042') or next((rnd.start_time for rnd in rounds if rnd.start_time), None)
+    if start_date is None:
+        raise ValueError("Le fichier TRF ne précise pas la date de début du tournoi (ligne 042).")
+    end_date = header.get('052') or start_date
+    total_round = int(header['XXR']) if header.get('XXR', '').isdigit() else len(rounds)
+    return Tournament(name=header.get('012', ''), location=header.get('022', ''),
+                      description=header.get('092', ''), start_date=start_date.strftime("%d/%m/%Y"),
+                      end_date=end_date.strftime("%d/%m/%Y"),
+                      total_round=max(total_round, len(rounds)),
+                      current_round=sum(1 for rnd in rounds if rnd.is_complete),
+                      rounds=rounds, registered_players=[ranks[rank] for rank in sorted(ranks)])
+
+
+def _read_player_line(line, line_number, resolver, ranks, taken, pending, boards):
+    """Lit une ligne 001 : enregistre le joueur, puis complète ou met en attente ses parties."""
+    try:
+        rank = int(line[4:8])
+    except ValueError:
+        raise ValueError(f"Ligne {line_number} : numéro de départ invalide '{line[4:8]}'.")
+    name, _, firstname = line[14:47].partition(',')
+    birthdate = _parse_date(line[69:79], line_number).strftime("%d/%m/%Y") if line[69:79].strip() else None
+    rating = int(line[48:52]) if line[48:52].strip().isdigit() else 0
+    try:
+        player = resolver.resolve(name.strip(), firstname.strip(), birthdate, line[57:68].strip(), rating, taken)
+    except ValueError as e:
+        raise ValueError(f"Ligne {line_number} : {e}.")
+    ranks[rank] = player
+    taken.add(player.unique_id)
+
+    for round_index, start in enumerate(range(ROUNDS_COLUMN, len(line), CELL_WIDTH)):
+        cell = line[start:start + CELL_WIDTH]
+        opponent_field, color, result = cell[0:4].strip(), cell[5:6].strip(), cell[7:8].strip()
+        if not opponent_field or not opponent_field.isdigit() or int(opponent_field) == 0:
+            continue  # Round non joué ou exempt
+        if result and result not in SCORES:
+            raise ValueError(f"Ligne {line_number} : résultat TRF inconnu '{result}' au round {round_index + 1}.")
+        opponent_rank = int(opponent_field)
+        key = (round_index, min(rank, opponent_rank), max(rank, opponent_rank))
+        half = (rank, player, color, result)
+        other = pending.pop(key, None)
+        if other is None:
+            pending[key] = half
+            continue
+        while len(boards) <= round_index:
+            boards.append([])
+        boards[round_index].append((key[1], _build_match(other, half)))
+
+
+def _build_match(first, second):
+    """Crée le match de deux demi-parties, le joueur qui a les blancs en premier."""
+    colors = (first[2], second[2])
+    if colors[0] == 'b' or colors[1] == 'w' or (colors == ('', '') and first[0] > second[0]):
+        first, second = second, first
+    played = bool(first[3] and second[3])
+    results = (SCORES[first[3]], SCORES[second[3]]) if played else (0, 0)
+    return Match(players=(first[1], second[1]), results=results, is_complete=played)
+
+
+def read_trf(filename, players):
+    """
+    Lit un fichier TRF, éventuellement compressé (voir util.compression).
+
+    Paramètres :
+    - filename (str) : Chemin du fichier.
+    - players (list) : Joueurs connus, réutilisés lorsqu'ils figurent dans le fichier.
+
+    Retourne :
+    - tuple : Le tournoi et la liste des joueurs créés pour l'occasion.
+    """
+    resolver = PlayerResolver(players)
+    with open_data_file(filename) as file:
+        tournament = parse_trf(file, resolver)
+    return tournament, resolver.new_players
+
+
+def _cells(tournament, numbers):
+    """Retourne, pour chaque joueur, ses cases de round (adversaire, couleur, résultat)."""
+    cells = {player.unique_id: [] for player in tournament.registered_players}
+    for round_index, rnd in enumerate(tournament.rounds):
+        for match in rnd.matches:
+            white, black = (player.unique_id for player in match.players)
+            if white not in numbers or black not in numbers:
+                continue
+            played = rnd.is_complete or match.is_complete or sum(match.results) > 0
+            for player_id, opponent_id, color, score in ((white, black, 'w', match.results[0]),
+                                                         (black, white, 'b', match.results[1])):
+                row = cells[player_id]
+                row.extend([None] * (round_index - len(row)))
+                result = RESULT_CODES.get(float(score), '=') if played else ' '
+                row.append(f"{numbers[opponent_id]:>4} {color} {result}")
+    return cells
+
+
+def trf_lines(tournament):
+    """
+    Génère les lignes TRF d'un tournoi, une à une.
+
+    Les joueurs sont numérotés dans leur ordre d'inscription ; l'identifiant de l'application est écrit dans
+    le champ d'identifiant FIDE, ce qui permet de retrouver les joueurs à la réimportation.
+    """
+    players = tournament.registered_players
+    numbers = {player.unique_id: number for number, player in enumerate(players, start=1)}
+    points = tournament.calculate_player_points()
+    ranking = sorted(players, key=lambda player: (-points.get(player.unique_id, 0), numbers[player.unique_id]))
+    places = {player.unique_id: place for place, player in enumerate(ranking, start=1)}
+    cells = _cells(tournament, numbers)
+
+    yield f"012 {tournament.name}"
+    yield f"022 {tournament.location}"
+    yield f"042 {_format_date(tournament.start_date)}"
+    yield f"052 {_format_date(tournament.end_date)}"
+    yield f"062 {len(players)}"
+    if tournament.description:
+        yield f"092 {tournament.description}"
+    yield f"XXR {tournament.total_round}"
+    if any(rnd.start_time for rnd in tournament.rounds):
+        dates = "".join(f"{_format_date(rnd.start_time, '%y/%m/%d'):>8}  " for rnd in tournament.rounds)
+        yield f"{'132':<{ROUNDS_COLUMN}}{dates}".rstrip()
+    for player in players:
+        name = f"{player.name}, {player.firstname}"[:33]
+        birthdate = '' if player.birthdate.strftime("%d/%m/%Y") == UNKNOWN_BIRTHDATE else \
+            _format_date(player.birthdate)
+        line = (f"001 {numbers[player.unique_id]:>4}      {name:<33} {round(player.rating):>4}     "
+                f"{player.unique_id:>11} {birthdate:>10} {points.get(player.unique_id, 0):>4.1f} "
+                f"{places[player.unique_id]:>4}  ")
+        rounds = "".join(f"{cell or '0000 - U':<{CELL_WIDTH}}" for cell in cells[player.unique_id])
+        yield (line + rounds).rstrip()
+
+
+def write_trf(tournament, filename):
+    """
+    Écrit un tournoi au format TRF, ligne par ligne, dans un fichier temporaire substitué ensuite au fichier
+    cible ; le fichier est compressé si son extension l'indique.
+    """
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_file = filename + '.tmp'
+    with open_data_file(temp_file, 'w', compression_of(filename)) as file:
+        for line in trf_lines(tournament):
+            file.write(line + '\n')
+    os.replace(temp_file, filename)
+
+
+def trf_files(path):
+    """Retourne le fichier TRF 'path', ou les fichiers TRF (compressés ou non) du répertoire 'path'."""
+    if not os.path.isdir(path):
+        return [path]
+    return sorted(os.path.join(path, name) for name in os.listdir(path)
+                  if name[:-len(compression_of(name)) or None].endswith(TRF_EXTENSION))
@@ -0,0 +1,200 @@
+# views/live_board.py
+
+# curses est importé au lancement du tableau : il n'est pas disponible sur toutes les plateformes
+# (sous Windows, il faut installer le paquet windows-curses).
+
+import os
+import time
+from models.player_stats import PlayerStats, tournament_stats
+
+
+POLL_INTERVAL = 1.0  # Secondes entre deux examens du fichier du tournoi
+PAGE_SECONDS = 10  # Durée d'affichage d'une page lorsque les listes ne tiennent pas à l'écran
+MIN_SPLIT_WIDTH = 100  # Largeur à partir de laquelle appariements et classement sont côte à côte
+
+
+def current_round_index(tournament):
+    """Round affiché : le premier round commencé et non terminé, sinon le dernier round commencé."""
+    started = [index for index, rnd in enumerate(tournament.rounds) if rnd.start_time is not None]
+    for index in started:
+        if not tournament.rounds[index].is_complete:
+            return index
+    return started[-1] if started else (0 if tournament.rounds else None)
+
+
+def _score(value):
+    return "½" if value == 0.5 else str(int(value))
+
+
+def pairing_rows(tournament, round_index):
+    """Lignes des appariements d'un round : échiquier, joueurs et résultat s'il est connu."""
+    if round_index is None:
+        return []
+    rnd = tournament.rounds[round_index]
+    rows = []
+    for board, match in enumerate(rnd.matches, start=1):
+        first, second = match.players
+        played = rnd.is_complete or match.is_complete or sum(match.results) > 0
+        result = f"{_score(match.results[0])}-{_score(match.results[1])}" if played else "   "
+        rows.append(f"{board:>4} {first.firstname[:1]}. {first.name[:16]:<16} {result:^5} "
+                    f"{second.firstname[:1]}. {second.name[:16]}")
+    return rows
+
+
+def standing_rows(tournament, stats=None):
+    """Lignes du classement : rang, joueur, points et bilan."""
+    stats = tournament_stats(tournament) if stats is None else stats
+    empty = PlayerStats()
+    players = sorted(tournament.registered_players,
+                     key=lambda player: (-stats.get(player.unique_id, empty).points, player.name, player.firstname))
+    rows = []
+    for rank, player in enumerate(players, start=1):
+        player_stats = stats.get(player.unique_id, empty)
+        rows.append(f"{rank:>4} {player.firstname[:1]}. {player.name[:16]:<16} {player_stats.points:>5.1f} "
+                    f"{player_stats.wins:>3}/{player_stats.draws}/{player_stats.losses}")
+    return rows
+
+
+class LiveBoard:
+    """
+    Tableau d'affichage plein écran des appariements du round en cours et du classement d'un tournoi.
+
+    Le tournoi n'est relu que lorsque la date de modification ou la taille de son fichier, ou d'un des
+    fichiers surveillés en plus (point de reprise des résultats en cours de saisie), change ; les lignes
+    sont alors recalculées, et seules les cellules de l'écran dont le texte a changé sont redessinées.
+    Les listes plus longues que l'écran défilent par pages.
+
+    Paramètres :
+    - tournament (Tournament) : Tournoi affiché au lancement.
+    - filename (str) : Fichier du tournoi, surveillé (None pour un tournoi archivé, qui ne change plus).
+    - loader (callable) : Relit le tournoi depuis 'filename' ; retourne None si le fichier est illisible.
+    - watched (tuple) : Autres fichiers dont une modification provoque la relecture, qu'ils existent ou non.
+    """
+
+    def __init__(self, tournament, filename=None, loader=None, poll_interval=POLL_INTERVAL, watched=()):
+        self.tournament = tournament
+        self.filename = filename
+        self.loader = loader
+        self.poll_interval = poll_interval
+        self.watched = tuple(watched)
+        self.signature = self._file_signature()
+        self.page = 0
+        self.cells = {}  # (ligne, colonne) -> texte affiché
+        self.redraws = 0  # Nombre de cellules redessinées, pour mesurer le coût des mises à jour
+        self._compute_rows()
+
+    @staticmethod
+    def _stat(filename):
+        try:
+            stat = os.stat(filename)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _file_signature(self):
+        if not self.filename:
+            return None
+        stat = self._stat(self.filename)
+        if stat is None:
+            return None
+        return (stat,) + tuple(self._stat(filename) for filename in self.watched)
+
+    def _compute_rows(self):
+        self.round_index = current_round_index(self.tournament)
+        self.pairings = pairing_rows(self.tournament, self.round_index)
+        self.standings = standing_rows(self.tournament)
+
+    def poll(self):
+        """Relit le tournoi si un fichier surveillé a changé ; retourne True si les lignes ont été recalculées."""
+        signature = self._file_signature()
+        if signature is None or signature == self.signature:
+            return False
+        self.signature = signature
+        tournament = self.loader(self.filename)
+        if tournament is None:
+            return False  # Fichier en cours de remplacement ou illisible : l'affichage précédent est gardé
+        self.tournament = tournament
+        self._compute_rows()
+        return True
+
+    def layout(self, height, width):
+        """
+        Calcule le contenu de l'écran.
+
+        Retourne :
+        - dict : (ligne, colonne) -> texte, chaque texte tenant dans la largeur de sa colonne.
+        """
+        if height < 6 or width < 20:
+            return {(0, 0): "Écran trop petit"[:max(width - 1, 0)]}
+        tournament = self.tournament
+        round_name = tournament.rounds[self.round_index].name if self.round_index is not None else "Aucun round"
+        cells = {(0, 0): f"{tournament.name} - {tournament.location} - {round_name}"[:width - 1]}
+        body = max(height - 3, 1)
+        if width >= MIN_SPLIT_WIDTH:
+            half = width // 2
+            panes = [(0, half - 1, body, "APPARIEMENTS", self.pairings),
+                     (half, width - half - 1, body, "CLASSEMENT", self.standings)]
+        else:
+            top = max(body // 2, 1)
+            panes = [(0, width - 1, top, "APPARIEMENTS", self.pairings),
+                     (0, width - 1, body - top - 1, "CLASSEMENT", self.standings)]
+        first_line = 2
+        for index, (column, pane_width, lines, title, rows) in enumerate(panes):
+            if lines < 1 or pane_width < 1:
+                continue
+            line = first_line if width >= MIN_SPLIT_WIDTH or index == 0 else first_line + panes[0][2] + 1
+            pages = max((len(rows) + lines - 1) // lines, 1)
+            page = self.page % pages
+            cells[(line - 1, column)] = f"{title} ({page + 1}/{pages})"[:pane_width]
+            for offset, row in enumerate(rows[page * lines:(page + 1) * lines]):
+                cells[(line + offset, column)] = row[:pane_width]
+        return cells
+
+    def draw(self, screen):
+        """Redessine les cellules modifiées depuis le dernier affichage et efface celles qui ont disparu."""
+        height, width = screen.getmaxyx()
+        cells = self.layout(height, width)
+        for position, text in self.cells.items():
+            if position not in cells:
+                screen.addstr(position[0], position[1], " " * len(text))
+                self.redraws += 1
+        for position, text in cells.items():
+            previous = self.cells.get(position)
+            if previous != text:
+                # Complète avec des espaces pour effacer la fin d'un texte précédent plus long
+                screen.addstr(position[0], position[1], text.ljust(len(previous or "")))
+                self.redraws += 1
+        self.cells = cells
+        screen.refresh()
+
+    def run(self, screen):
+        """Boucle d'affichage, jusqu'à l'appui sur 'q' ; espace passe à la page suivante."""
+        import curses
+        curses.curs_set(0)
+        screen.timeout(int(self.poll_interval * 1000))
+        screen.clear()
+        page_started = time.monotonic()
+        while True:
+            self.draw(screen)
+            key = screen.getch()
+            if key in (ord('q'), ord('Q')):
+                return
+            if key == curses.KEY_RESIZE:
+                screen.clear()
+                self.cells = {}
+            if key == ord(' ') or time.monotonic() - page_started >= PAGE_SECONDS:
+                self.page += 1
+                page_started = time.monotonic()
+            self.poll()
+
+
+def show_live_board(board):
+    """Affiche le tableau en plein écran jusqu'à l'appui sur 'q'."""
+    try:
+        import curses
+        import locale
+        locale.setlocale(locale.LC_ALL, '')  # Affichage des caractères accentués
+    except ImportError:
+        print("Le tableau en direct nécessite le module curses (sous Windows : pip install windows-curses).")
+        return
+    curses.wrapper(board.run)
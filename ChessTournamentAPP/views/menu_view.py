@@ -28,9 +28,11 @@ class MenuView:
         print("[4] Démarrer un tournoi")
         print("[5] Voir la liste des tournois")
         print("[6] Gestion des rounds")
-        print("[7] Retour au menu principal")
+        print("[7] Rapports et outils")
+        print("[8] Rechercher des tournois")
+        print("[9] Retour au menu principal")
         print("-" * 30)
-        choice = input("Entrez votre choix [1-7]: ")
+        choice = input("Entrez votre choix [1-9]: ")
         return choice
 
     @staticmethod
@@ -41,9 +43,12 @@ class MenuView:
         print("[1] Ajouter un nouveau joueur")
         print("[2] Voir la liste des joueurs")
         print("[3] Inscrire un joueur à un tournoi")
-        print("[4] Retour au menu principal")
+        print("[4] Recalculer les classements Elo")
+        print("[5] Historique d'un joueur")
+        print("[6] Rechercher les doublons")
+        print("[7] Retour au menu principal")
         print("-" * 30)
-        choice = input("Entrez votre choix [1-4]: ")
+        choice = input("Entrez votre choix [1-7]: ")
         return choice
 
     @staticmethod
@@ -55,6 +60,24 @@ class MenuView:
         print("[1] Ajouter un Round")
         print("[2] Démarrer un Round")
         print("[3] Terminer un Round")
-        print("[4] Retour")
+        print("[4] Surveiller un dossier de résultats")
+        print("[5] Comparer des appariements")
+        print("[6] Retour")
+        print("-" * 30)
+        return input("Choisissez une option [1-6]: ")
+
+    @staticmethod
+    def display_tools_menu():
+        """Affiche le menu des rapports et outils des tournois."""
+        print("\n" + "-" * 30)
+        print("RAPPORTS ET OUTILS".center(30))
+        print("-" * 30)
+        print("[1] Simuler l'issue d'un tournoi")
+        print("[2] Exporter les rapports (CSV/HTML)")
+        print("[3] Archiver les tournois terminés")
+        print("[4] Importer des fichiers TRF")
+        print("[5] Exporter un tournoi au format TRF")
+        print("[6] Tableau d'affichage en direct")
+        print("[7] Retour")
         print("-" * 30)
-        return input("Choisissez une option [1-4]: ")
+        return input("Choisissez une option [1-7]: ")
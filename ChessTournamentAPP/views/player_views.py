@@ -1,7 +1,6 @@
 # player_views.py
 
 import re
-from prettytable import PrettyTable
 
 
 class PlayerView:
@@ -40,10 +39,16 @@ class PlayerView:
         return name, firstname, birthdate, u_id
 
     @staticmethod
-    def display_players(players):
-        """ Affiche les joueurs enregistrés sur l'application. """
+    def display_players(players, stats=None):
+        """
+        Affiche les joueurs enregistrés sur l'application.
+        'stats' (unique_id -> PlayerStats) ajoute le bilan de chaque joueur, tous tournois confondus.
+        """
+        from prettytable import PrettyTable  # Import différé pour ne pas ralentir le démarrage
         table = PrettyTable()
-        table.field_names = ["ID", "Prénom", "Nom", "Date de naissance"]
+        table.field_names = ["ID", "Prénom", "Nom", "Date de naissance", "Elo"]
+        if stats is not None:
+            table.field_names += ["Parties", "V", "N", "D", "Score %", "Perf"]
         table.align = "c"  # Centre tout le texte dans le tableau
         table.align["ID"] = "l"  # Alignement à gauche pour l'ID
         # Ajoute des données factices pour démonstration
@@ -52,7 +57,14 @@ class PlayerView:
         else:
             sorted_players = sorted(players, key=lambda x: (x.name, x.firstname))
             for player in sorted_players:
-                table.add_row([player.unique_id, player.name, player.firstname, player.birthdate.strftime('%d/%m/%Y')])
+                row = [player.unique_id, player.name, player.firstname,
+                       player.birthdate.strftime('%d/%m/%Y'), round(player.rating)]
+                if stats is not None:
+                    player_stats = stats.get(player.unique_id)
+                    row += ([player_stats.games, player_stats.wins, player_stats.draws, player_stats.losses,
+                             f"{player_stats.score_percentage:.1f}", f"{player_stats.performance:.0f}"]
+                            if player_stats and player_stats.games else [0, 0, 0, 0, "-", "-"])
+                table.add_row(row)
         # Calcul de la largeur du tableau pour centrer le titre
         table_string = table.get_string()
         table_width = len(table_string.splitlines()[0])
@@ -87,3 +99,64 @@ class PlayerView:
         except ValueError:
             print("Veuillez entrer un nombre valide.")
         return None
+
+    @staticmethod
+    def display_player_history(player, games, game_index):
+        """Affiche les parties d'un joueur dans tous les tournois."""
+        from prettytable import PrettyTable
+        if not games:
+            print(f"Aucune partie enregistrée pour {player}.")
+            return
+        table = PrettyTable()
+        table.field_names = ["Tournoi", "Round", "Échiquier", "Adversaire", "Résultat"]
+        table.align = "l"
+        for game in games:
+            tournament = game_index.tournament(game.ref.t_id)
+            rnd = tournament.rounds[game.ref.round_index]
+            results = game.match.results
+            if game.match.players[0].unique_id != player.unique_id:
+                results = results[::-1]
+            played = game.match.is_complete or sum(results) > 0
+            table.add_row([tournament.name, rnd.name, game.ref.board_index + 1, game.opponent_id,
+                           f"{results[0]}-{results[1]}" if played else "à jouer"])
+        print(f"Historique des parties de {player}".upper())
+        print(table)
+
+    @staticmethod
+    def display_head_to_head(player, opponent_id, summary):
+        """Affiche le bilan des rencontres entre deux joueurs."""
+        print(f"Face-à-face {player.unique_id} contre {opponent_id} : {len(summary['games'])} partie(s), "
+              f"{summary['wins']} victoire(s), {summary['draws']} nulle(s), {summary['losses']} défaite(s).")
+
+    @staticmethod
+    def display_duplicates(candidates):
+        """Affiche les doublons probables, numérotés pour la sélection."""
+        from prettytable import PrettyTable
+        if not candidates:
+            print("Aucun doublon probable trouvé.")
+            return
+        table = PrettyTable()
+        table.field_names = ["#", "Score", "Conservé", "Doublon"]
+        table.align = "l"
+        for index, candidate in enumerate(candidates, start=1):
+            table.add_row([index, f"{candidate.score:.0%}", candidate.player, candidate.duplicate])
+        print(table)
+
+    @staticmethod
+    def select_duplicates(candidates):
+        """
+        Demande les doublons à fusionner.
+
+        Retourne :
+        - list : Les DuplicateCandidate choisis ('tous' les sélectionne tous, une saisie vide aucun).
+        """
+        choice = input("Numéros des doublons à fusionner (séparés par des virgules, 'tous', vide pour aucun) : ")
+        if choice.strip().lower() == 'tous':
+            return list(candidates)
+        selected = []
+        for part in filter(None, (part.strip() for part in choice.split(','))):
+            if part.isdigit() and 1 <= int(part) <= len(candidates):
+                selected.append(candidates[int(part) - 1])
+            else:
+                print(f"Numéro ignoré : {part}")
+        return selected
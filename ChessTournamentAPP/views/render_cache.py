@@ -0,0 +1,62 @@
+# views/render_cache.py
+
+import sys
+from collections import OrderedDict
+
+
+class RenderCache:
+    """
+    Cache des textes rendus par les vues, avec éviction du moins récemment utilisé.
+
+    Une entrée est identifiée par le tournoi (t_id et version), le type de rendu et ses paramètres : toute
+    modification faite par les méthodes de Tournament incrémente sa version, les entrées périmées ne sont
+    donc plus jamais lues et finissent évincées. Un tournoi terminé garde sa version et reste en cache.
+
+    Paramètres :
+    - max_entries (int) : Nombre maximal d'entrées.
+    - max_bytes (int) : Mémoire maximale occupée par les textes rendus.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, tournament, kind, render, *args):
+        """
+        Retourne le texte mis en cache pour ce tournoi, ou le produit avec render(tournament, *args).
+
+        Paramètres :
+        - tournament (Tournament) : Tournoi rendu.
+        - kind (str) : Type de rendu (détails, joueurs, rounds, classement).
+        - render (callable) : Fonction de rendu, appelée en cas d'absence.
+        - args : Paramètres du rendu, comme la largeur ; ils font partie de la clé.
+        """
+        key = (tournament.t_id, tournament.version, kind) + args
+        text = self.entries.get(key)
+        if text is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return text
+        self.misses += 1
+        text = render(tournament, *args)
+        size = sys.getsizeof(text)
+        if size <= self.max_bytes:
+            self.entries[key] = text
+            self.size += size
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= sys.getsizeof(evicted)
+        return text
+
+    def clear(self):
+        """Vide le cache, par exemple lors d'un changement de répertoire de données."""
+        self.entries.clear()
+        self.size = 0
+
+
+# Cache partagé par les vues
+render_cache = RenderCache()
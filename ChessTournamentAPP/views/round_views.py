@@ -47,8 +47,16 @@ class RoundView:
             print(f"{index + 1}. Round: {rnd.name}, Statut: {status}")
 
     def get_match_results():
-        """Demande et valide les résultats des matches d'un round."""
-        result = input("Entrez le résultat (1-0, 0-1, 0.5-0.5) : ")
+        """
+        Demande et valide le résultat d'un match.
+
+        Retourne :
+        - tuple : Les scores des deux joueurs, un tuple vide si la saisie est laissée vide (interruption de la
+          saisie), ou None si le format est invalide.
+        """
+        result = input("Entrez le résultat (1-0, 0-1, 0.5-0.5, laisser vide pour interrompre) : ")
+        if not result.strip():
+            return ()
         try:
             results_tuple = tuple(map(float, result.split('-')))
             if len(results_tuple) != 2 or not all(isinstance(num, float) for num in results_tuple):
@@ -57,3 +65,44 @@ class RoundView:
         except ValueError:
             print("Format invalide. Veuillez entrer les résultats sous la forme 'score1-score2'.")
             return None
+
+    @staticmethod
+    def display_pairing_previews(previews):
+        """Affiche les indicateurs de qualité de chaque variante d'appariement."""
+        from prettytable import PrettyTable
+        table = PrettyTable()
+        table.field_names = ["#", "Variante", "Matches", "Revanches", "Écart de points (moy./max)",
+                             "Écart Elo moyen", "Exempt"]
+        for number, preview in enumerate(previews, start=1):
+            metrics = preview.metrics
+            table.add_row([number, preview.variant.name, len(preview.pairs), metrics['rematches'],
+                           f"{metrics['mean_score_gap']:.2f} / {metrics['max_score_gap']:g}",
+                           round(metrics['mean_rating_gap']), metrics['bye'] or "-"])
+        print("Comparaison des appariements".upper())
+        print(table)
+
+    @staticmethod
+    def display_preview_pairs(preview, players_by_id):
+        """Affiche les appariements d'une variante."""
+        for board, (first, second) in enumerate(preview.pairs, start=1):
+            print(f"{board:>4}. {players_by_id[preview.ids[first]]} - {players_by_id[preview.ids[second]]}")
+
+    @staticmethod
+    def select_pairing_preview(previews):
+        """
+        Demande la variante à appliquer ; 'v' suivi d'un numéro affiche ses appariements.
+
+        Retourne :
+        - tuple : ('commit' ou 'show', aperçu choisi), ou None pour annuler.
+        """
+        choice = input("Numéro de la variante à appliquer, 'v' + numéro pour la détailler "
+                       "(laisser vide pour annuler) : ").strip().lower()
+        action = 'show' if choice.startswith('v') else 'commit'
+        try:
+            index = int(choice[1:] if action == 'show' else choice) - 1
+        except ValueError:
+            return None
+        if 0 <= index < len(previews):
+            return action, previews[index]
+        print("Variante invalide.")
+        return None
@@ -1,6 +1,25 @@
 # views/tournament_views.py
 
-from prettytable import PrettyTable
+# PrettyTable est importé dans les méthodes d'affichage pour ne pas ralentir le démarrage de l'application.
+# Les méthodes render_* produisent le texte affiché par les méthodes display_*, qui le mettent en cache.
+
+from datetime import datetime
+from views.render_cache import render_cache
+
+
+def _format_stat(value, digits=0):
+    """Affiche un pourcentage ou une performance, '-' en l'absence de partie jouée."""
+    if value is None:
+        return "-"
+    return f"{value:.{digits}f}"
+
+
+def _stats_key(stats):
+    """
+    Empreinte des bilans affichés, ajoutée à la clé du classement en cache : la performance dépend des
+    classements des adversaires, qui changent (recalcul, synchronisation) sans changer la version du tournoi.
+    """
+    return hash(tuple((unique_id, s.games, s.points, s.opponent_ratings) for unique_id, s in stats.items()))
 
 
 class TournamentView:
@@ -23,6 +42,7 @@ class TournamentView:
     @staticmethod
     def disp_tournaments(tournaments):
         """Affiche la liste de tournois de l'application"""
+        from prettytable import PrettyTable
         table = PrettyTable()
         table.field_names = ["ID", "Nom", "Lieu", "Description", "Date de début", "Date de fin"]
         table.align = "l"
@@ -46,6 +66,31 @@ class TournamentView:
         print(center_line)
         print(table)
 
+    @staticmethod
+    def get_search_criteria():
+        """
+        Demande les critères de recherche d'un tournoi ; une saisie vide ignore le critère.
+
+        Retourne :
+        - dict : Critères reconnus par TournamentIndex.query (location, date_from, date_to, status).
+        """
+        criteria = {}
+        location = input("Lieu (laisser vide pour tous) : ").strip()
+        if location:
+            criteria['location'] = location
+        for key, prompt in (('date_from', "Du (DD/MM/YYYY, laisser vide pour sans limite) : "),
+                            ('date_to', "Au (DD/MM/YYYY, laisser vide pour sans limite) : ")):
+            value = input(prompt).strip()
+            if value:
+                try:
+                    criteria[key] = datetime.strptime(value, "%d/%m/%Y")
+                except ValueError:
+                    print(f"Date invalide ignorée : {value}")
+        status = input("Statut : [1] à venir, [2] en cours, [3] terminé (laisser vide pour tous) : ").strip()
+        if status in ('1', '2', '3'):
+            criteria['status'] = ('upcoming', 'active', 'complete')[int(status) - 1]
+        return criteria
+
     @staticmethod
     def select_tournament(tournaments):
         """
@@ -70,22 +115,34 @@ class TournamentView:
     @staticmethod
     def display_tournament_details(tournament, width=80):
         """Affiche les détails d'un tournoi sélectionné"""
+        print(render_cache.get(tournament, 'details', TournamentView.render_tournament_details, width))
+
+    @staticmethod
+    def render_tournament_details(tournament, width=80):
+        """Retourne le texte des détails d'un tournoi"""
         separator = "-" * width
-        title = "Détails du Tournoi Chargé".center(width)
-        print(separator, title, separator, sep='\n')
-        print(f"Nom du tournoi : {tournament.name}".upper().center(width))
-        print(f"Lieu : {tournament.location}".center(width))
-        print(f"Description : {tournament.description}".center(width))
-        print(f"Date de début : {tournament.start_date.strftime('%d/%m/%Y')}".center(width))
-        print(f"Date de fin : {tournament.end_date.strftime('%d/%m/%Y')}".center(width))
-        print(f"Nombre total de rounds prévus : {tournament.total_round}".center(width))
-        print(f"Rounds actuellement complétés : {len(tournament.rounds)}".center(width))
-        print(f"Nombre de joueurs inscrits : {len(tournament.registered_players)}".center(width))
-        print(separator, "\n", sep='\n')
+        return "\n".join([
+            separator, "Détails du Tournoi Chargé".center(width), separator,
+            f"Nom du tournoi : {tournament.name}".upper().center(width),
+            f"Lieu : {tournament.location}".center(width),
+            f"Description : {tournament.description}".center(width),
+            f"Date de début : {tournament.start_date.strftime('%d/%m/%Y')}".center(width),
+            f"Date de fin : {tournament.end_date.strftime('%d/%m/%Y')}".center(width),
+            f"Nombre total de rounds prévus : {tournament.total_round}".center(width),
+            f"Rounds actuellement complétés : {len(tournament.rounds)}".center(width),
+            f"Nombre de joueurs inscrits : {len(tournament.registered_players)}".center(width),
+            separator, "", ""
+        ])
 
     @staticmethod
     def display_players(tournament, width=80):
         """Affiche la liste des joueurs inscrits à un tournoi."""
+        print(render_cache.get(tournament, 'players', TournamentView.render_players, width))
+
+    @staticmethod
+    def render_players(tournament, width=80):
+        """Retourne le tableau des joueurs inscrits à un tournoi."""
+        from prettytable import PrettyTable
         if tournament.registered_players:
             table = PrettyTable()
             table.field_names = ["ID", "Nom", "Prénom", "Date de naissance"]
@@ -95,63 +152,104 @@ class TournamentView:
                 table.add_row([player.unique_id, player.name,
                                player.firstname, player.birthdate.strftime('%d/%m/%Y')])
             # Centraliser chaque ligne du tableau
-            player_lines = table.get_string().splitlines()
-            title = "Liste des joueurs inscrits au tournoi".center(width)
-            print(title)
-            for line in player_lines:
-                print(line.center(width))
+            lines = ["Liste des joueurs inscrits au tournoi".center(width)]
+            lines += [line.center(width) for line in table.get_string().splitlines()]
         else:
-            print("Aucun joueur n'est inscrit dans le tournoi.".center(width))
-        print()  # Ajouter une ligne vide pour une meilleure séparation
+            lines = ["Aucun joueur n'est inscrit dans le tournoi.".center(width)]
+        return "\n".join(lines + [""])  # Ligne vide pour une meilleure séparation
 
     @staticmethod
     def display_rounds(tournament, width=80):
         """Affiche la liste des rounds joués dans un tournoi"""
-        if tournament.rounds:
-            print("Liste des Rounds joués".center(width))
-            for round in tournament.rounds:
-                matches_table = PrettyTable()
-                matches_table.field_names = ["Match #", "Joueur 1", "Score J-1", "vs.", "Joueur 2", "Score J-2"]
-                for index, match in enumerate(round.matches, start=1):
-                    player1_full_name = f"{match.players[0].firstname} {match.players[0].name}"
-                    player2_full_name = f"{match.players[1].firstname} {match.players[1].name}"
-                    matches_table.add_row([
-                        index,
-                        player1_full_name,
-                        match.results[0],
-                        "vs.",
-                        player2_full_name,
-                        match.results[1]
-                    ])
-
-                # Rendre le formatage compatible avec flake8
-                start_time = round.start_time.strftime('%d/%m/%Y %H:%M') if round.start_time else 'N/A'
-                end_time = round.end_time.strftime('%d/%m/%Y %H:%M') if round.end_time else 'N/A'
-                round_details = f"{round.name} - Début : {start_time} - Fin : {end_time}"
-
-                # Centraliser chaque ligne du tableau
-                round_lines = matches_table.get_string(title=round_details).splitlines()
-                for line in round_lines:
-                    print(line.center(width))
-            print()  # Ajouter une ligne vide pour une meilleure séparation
-        else:
-            print("Aucun round joué.".center(width))
-            print()  # Ajouter une ligne vide pour une meilleure séparation
+        print(render_cache.get(tournament, 'rounds', TournamentView.render_rounds, width))
 
     @staticmethod
-    def display_ranking(tournament, player_points, width=80):
-        """Affiche le classement des joueurs d'un tournoi sélectionné"""
+    def render_rounds(tournament, width=80):
+        """Retourne les tableaux des rounds joués dans un tournoi"""
+        from prettytable import PrettyTable
+        if not tournament.rounds:
+            return "\n".join(["Aucun round joué.".center(width), ""])
+        lines = ["Liste des Rounds joués".center(width)]
+        for round in tournament.rounds:
+            matches_table = PrettyTable()
+            matches_table.field_names = ["Match #", "Joueur 1", "Score J-1", "vs.", "Joueur 2", "Score J-2"]
+            for index, match in enumerate(round.matches, start=1):
+                player1_full_name = f"{match.players[0].firstname} {match.players[0].name}"
+                player2_full_name = f"{match.players[1].firstname} {match.players[1].name}"
+                matches_table.add_row([
+                    index,
+                    player1_full_name,
+                    match.results[0],
+                    "vs.",
+                    player2_full_name,
+                    match.results[1]
+                ])
+
+            # Rendre le formatage compatible avec flake8
+            start_time = round.start_time.strftime('%d/%m/%Y %H:%M') if round.start_time else 'N/A'
+            end_time = round.end_time.strftime('%d/%m/%Y %H:%M') if round.end_time else 'N/A'
+            round_details = f"{round.name} - Début : {start_time} - Fin : {end_time}"
+
+            # Centraliser chaque ligne du tableau
+            lines += [line.center(width) for line in matches_table.get_string(title=round_details).splitlines()]
+        return "\n".join(lines + [""])  # Ligne vide pour une meilleure séparation
+
+    @staticmethod
+    def display_ranking(tournament, stats=None, width=80):
+        """
+        Affiche le classement des joueurs d'un tournoi sélectionné.
+        Les bilans (unique_id -> PlayerStats) sont calculés à partir du tournoi s'ils ne sont pas fournis ;
+        le rendu mis en cache est indexé par leur empreinte, les bilans fournis sont donc toujours respectés.
+        """
+        if stats is None:
+            from models.player_stats import tournament_stats
+            stats = tournament_stats(tournament)
+        print(render_cache.get(tournament, 'ranking',
+                               lambda t, w, _: TournamentView.render_ranking(t, stats, w), width, _stats_key(stats)))
+
+    @staticmethod
+    def render_ranking(tournament, stats=None, width=80):
+        """Retourne le tableau du classement des joueurs d'un tournoi, avec leur bilan"""
+        from prettytable import PrettyTable
+        from models.player_stats import PlayerStats, tournament_stats
+        if stats is None:
+            stats = tournament_stats(tournament)
+        empty = PlayerStats()
         ranking_table = PrettyTable()
-        ranking_table.field_names = ["ID", "Nom", "Prénom", "Points"]
+        ranking_table.field_names = ["ID", "Nom", "Prénom", "Points", "V", "N", "D", "Score %", "Perf"]
         ranking_table.align = "l"
         sorted_players = sorted(tournament.registered_players,
-                                key=lambda player: player_points.get(player.unique_id, 0), reverse=True)
+                                key=lambda player: stats.get(player.unique_id, empty).points, reverse=True)
         for player in sorted_players:
-            ranking_table.add_row([player.unique_id, player.name,
-                                   player.firstname, player_points.get(player.unique_id, 0)])
+            player_stats = stats.get(player.unique_id, empty)
+            ranking_table.add_row([player.unique_id, player.name, player.firstname, player_stats.points,
+                                   player_stats.wins, player_stats.draws, player_stats.losses,
+                                   _format_stat(player_stats.score_percentage, 1),
+                                   _format_stat(player_stats.performance)])
 
-        print("Classement des Joueurs".center(width))
         # Centraliser chaque ligne du tableau
-        ranking_lines = ranking_table.get_string().splitlines()
-        for line in ranking_lines:
+        lines = ["Classement des Joueurs".center(width)]
+        lines += [line.center(width) for line in ranking_table.get_string().splitlines()]
+        return "\n".join(lines)
+
+    @staticmethod
+    def display_simulation(tournament, result, width=80):
+        """Affiche les probabilités de classement final obtenues par simulation"""
+        from prettytable import PrettyTable
+        simulation_table = PrettyTable()
+        simulation_table.field_names = ["ID", "Nom", "Prénom", "Points", "1re place", "Podium", "Place moyenne"]
+        simulation_table.align = "l"
+        winners = result.top_probabilities(1)
+        podium = result.top_probabilities(3)
+        positions = result.expected_positions()
+        for player in sorted(tournament.registered_players, key=lambda player: positions[player.unique_id]):
+            simulation_table.add_row([player.unique_id, player.name, player.firstname,
+                                      result.current_scores[player.unique_id],
+                                      f"{winners[player.unique_id]:.1%}", f"{podium[player.unique_id]:.1%}",
+                                      f"{positions[player.unique_id]:.1f}"])
+
+        print(f"Simulation de l'issue du tournoi ({result.simulations} tirages)".center(width))
+        for line in simulation_table.get_string().splitlines():
             print(line.center(width))
+        contenders = ", ".join(result.contenders) if result.contenders else "aucun"
+        print(f"Joueurs pouvant encore terminer premiers : {contenders}")